@@ -6,12 +6,46 @@ This script converts Syncfusion PowerPoint JSON format to React components.
 It uses Pydantic for data validation and modeling.
 """
 
+import binascii
+import contextlib
+import functools
+import gc
+import glob
+import hashlib
+import io
+import itertools
 import json
 import os
+import re
 import sys
-from typing import List, Optional, Union, Dict, Any
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Annotated, Callable, List, NamedTuple, Optional, Set, Tuple, Union, Dict, Any, Iterable, Iterator, TextIO
 from enum import Enum
-from pydantic import BaseModel, Field, field_validator
+import pydantic_core
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+from syncfusion.assets import NON_WEB_MIME_TYPES, AssetStore, sniff_base64_mime, strip_data_uri
+from syncfusion.charts import ChartStore, chart_document
+from syncfusion.downsample import METHODS as DOWNSAMPLE_METHODS
+from syncfusion.geometry import format_pixels, item_geometry
+from syncfusion.groups import flatten_group, group_children
+from syncfusion.culling import CullBox, CullReport, cull, rotated_bounds
+from syncfusion.render_cache import RenderCache, cache_key
+from syncfusion.schemas.chart import ChartSerie
+from syncfusion.schemas.presentation import Presentation
+from syncfusion.schemas.shape import AutoShapeType
+from syncfusion.schemas.slide import Slide
+from syncfusion.schemas.table import BuiltInTableStyle, TableRow
+from syncfusion.streaming import iter_json_array
+from syncfusion.style_builder import StyleBuilder
+from syncfusion.svg_shapes import format_coordinate, polygon_path, unit_polygon
+from syncfusion.table_styles import (COLUMN_CLASS_CODES, ROW_CLASS_CODES, TABLE_STYLE_PREFIX, TableFlags, cell_class,
+                                     style_class_prefix, style_sheet, table_classes)
+from syncfusion.tables import TableLayout, cell_lines, table_layout
+from syncfusion.style_pool import StylePool
+from syncfusion.utils import default_file_mode
 
 
 # Pydantic models for Syncfusion PowerPoint JSON structure
@@ -74,6 +108,11 @@ class LineFormat(BaseModel):
     Style: Optional[str] = "solid"
 
 
+# Try the TextBody model first and keep the raw dict if it does not fit, in a
+# single validation pass
+TextBodyData = Annotated[Union[TextBody, Dict[str, Any]], Field(union_mode='left_to_right')]
+
+
 class SlideItem(BaseModel):
     """Base model for slide items"""
     SlideItemType: Optional[str] = None
@@ -84,7 +123,7 @@ class SlideItem(BaseModel):
     Width: Optional[float] = 100
     Height: Optional[float] = 50
     Rotation: Optional[float] = 0
-    TextBody: Optional[Union[TextBody, Dict[str, Any]]] = None
+    TextBody: Optional[TextBodyData] = None
     FillFormat: Optional[Union[FillFormat, Dict[str, Any]]] = None
     LineFormat: Optional[Union[LineFormat, Dict[str, Any]]] = None
     ImageData: Optional[Dict[str, Any]] = None
@@ -97,16 +136,123 @@ class SlideItem(BaseModel):
     model_config = {
         "extra": "allow"
     }
-    
-    @field_validator('TextBody', mode='before')
-    @classmethod
-    def validate_text_body(cls, v):
-        if isinstance(v, dict):
-            try:
-                return TextBody(**v)
-            except Exception:
-                return v
-        return v
+
+
+# Top-level keys that may wrap the list of slide items; the first one in
+# document order holding a list is used, so --stream can pick it on sight
+_WRAPPER_KEYS = ("slides", "Slides", "items", "Items", "content", "Content")
+
+
+def _parse_slide_item(item: Any) -> Iterator[SlideItem]:
+    """
+    Validate a single raw JSON element into slide items.
+
+    Elements carrying an ``items``/``Items`` list are group shapes, flattened
+    into their leaf items at absolute positions (see ``syncfusion.groups``),
+    and elements that fail validation are replaced by an ``Info`` placeholder.
+
+    Args:
+        item: Decoded JSON element
+
+    Returns:
+        Iterator[SlideItem]: Slide items produced by the element
+    """
+    try:
+        # Skip items with circular references
+        if isinstance(item, dict) and "Info" in item and "Circular reference detected" in item["Info"]:
+            yield SlideItem(Info=item["Info"])
+            return
+
+        # Handle nested items
+        if group_children(item) is not None:
+            for nested_item in flatten_group(item):
+                try:
+                    yield SlideItem(**nested_item)
+                except Exception as e:
+                    print(f"Error parsing nested slide item: {e}")
+                    yield SlideItem(Info=f"Error parsing nested item: {str(e)}")
+            return
+
+        yield SlideItem(**item)
+    except Exception as e:
+        print(f"Error parsing slide item: {e}")
+        # Add as a basic model with just the info field
+        if isinstance(item, dict):
+            yield SlideItem(Info=f"Error parsing: {str(e)}")
+
+
+_SLIDE_ITEM_LIST = TypeAdapter(List[SlideItem])
+
+
+@contextlib.contextmanager
+def _gc_paused():
+    """
+    Pause the cyclic garbage collector.
+
+    Bulk validation allocates millions of acyclic objects, which otherwise
+    trigger repeated full collections that cost as much as the parsing itself.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _expand_validated_item(item: SlideItem) -> List[SlideItem]:
+    """
+    Apply the circular-reference and nested-item rules of ``_parse_slide_item``
+    to an item that was validated in bulk.
+    """
+    if item.Info and "Circular reference detected" in item.Info:
+        return [SlideItem(Info=item.Info)]
+    extra = item.model_extra or {}
+    if "items" in extra or "Items" in extra:
+        # The group's own box and child space place its children
+        return list(_parse_slide_item(item.model_dump(exclude_unset=True)))
+    return [item]
+
+
+def _validate_slide_items(json_data: Union[bytes, List[Any]]) -> List[SlideItem]:
+    """
+    Validate a whole item array in one pass.
+
+    Raw bytes are validated straight from JSON without building intermediate
+    dicts. If some elements fail, the rest are still validated in bulk and
+    only the failing elements go through per-item parsing, so a single bad
+    item never discards the others.
+
+    Args:
+        json_data: JSON array as raw bytes, or an already decoded list
+
+    Returns:
+        List[SlideItem]: List of slide items
+    """
+    with _gc_paused():
+        try:
+            if isinstance(json_data, bytes):
+                validated = _SLIDE_ITEM_LIST.validate_json(json_data)
+            else:
+                validated = _SLIDE_ITEM_LIST.validate_python(json_data)
+            failed = set()
+        except ValidationError as e:
+            if isinstance(json_data, bytes):
+                json_data = pydantic_core.from_json(json_data)
+            failed = {error["loc"][0] for error in e.errors() if error["loc"]}
+            validated = _SLIDE_ITEM_LIST.validate_python(
+                [item for index, item in enumerate(json_data) if index not in failed]
+            )
+
+    slide_items = []
+    validated_iter = iter(validated)
+    for index in range(len(validated) + len(failed)):
+        if index in failed:
+            slide_items.extend(_parse_slide_item(json_data[index]))
+        else:
+            slide_items.extend(_expand_validated_item(next(validated_iter)))
+    return slide_items
 
 
 def load_json(file_path: str) -> List[SlideItem]:
@@ -120,27 +266,25 @@ def load_json(file_path: str) -> List[SlideItem]:
         List[SlideItem]: List of slide items
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            json_data = json.load(f)
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        
+        # A top-level array can be validated directly from the raw bytes
+        if raw.lstrip()[:1] == b'[':
+            return _validate_slide_items(raw)
+        
+        json_data = pydantic_core.from_json(raw)
         
         # Handle different JSON structures
         # Some PowerPoint JSONs might have a top-level structure with slides/items
         if isinstance(json_data, dict):
             # Try to find items in common PowerPoint JSON structures
-            if "slides" in json_data and isinstance(json_data["slides"], list):
-                json_data = json_data["slides"]
-            elif "Slides" in json_data and isinstance(json_data["Slides"], list):
-                json_data = json_data["Slides"]
-            elif "items" in json_data and isinstance(json_data["items"], list):
-                json_data = json_data["items"]
-            elif "Items" in json_data and isinstance(json_data["Items"], list):
-                json_data = json_data["Items"]
-            elif "content" in json_data and isinstance(json_data["content"], list):
-                json_data = json_data["content"]
-            elif "Content" in json_data and isinstance(json_data["Content"], list):
-                json_data = json_data["Content"]
+            for key, value in json_data.items():
+                if key in _WRAPPER_KEYS and isinstance(value, list):
+                    json_data = value
+                    break
             # If we can't find a list structure, wrap the dict in a list
-            elif not isinstance(json_data, list):
+            else:
                 json_data = [json_data]
         
         # Ensure we're working with a list
@@ -149,38 +293,406 @@ def load_json(file_path: str) -> List[SlideItem]:
             json_data = [json_data]
             
         # Parse JSON data using Pydantic models
-        slide_items = []
-        for item in json_data:
-            try:
-                # Skip items with circular references
-                if isinstance(item, dict) and "Info" in item and "Circular reference detected" in item["Info"]:
-                    slide_items.append(SlideItem(Info=item["Info"]))
-                    continue
-                
-                # Handle nested items
-                if isinstance(item, dict) and ("items" in item or "Items" in item):
-                    nested_items = item.get("items") or item.get("Items") or []
-                    for nested_item in nested_items:
-                        try:
-                            slide_items.append(SlideItem(**nested_item))
-                        except Exception as e:
-                            print(f"Error parsing nested slide item: {e}")
-                            slide_items.append(SlideItem(Info=f"Error parsing nested item: {str(e)}"))
-                    continue
-                
-                slide_items.append(SlideItem(**item))
-            except Exception as e:
-                print(f"Error parsing slide item: {e}")
-                # Add as a basic model with just the info field
-                if isinstance(item, dict):
-                    slide_items.append(SlideItem(Info=f"Error parsing: {str(e)}"))
-        
-        return slide_items
+        return _validate_slide_items(json_data)
     except Exception as e:
         print(f"Error loading JSON file: {e}")
         return []
 
 
+def iter_slide_items(file_path: str) -> Iterator[SlideItem]:
+    """
+    Stream slide items from the JSON file one element at a time.
+
+    Unlike ``load_json`` the file is never fully parsed into memory: the item
+    array is decoded incrementally, so peak memory is bounded by the largest
+    single item. When the document is an object, the first wrapper key found
+    in document order is used, as in ``load_json``.
+
+    Args:
+        file_path: Path to the Syncfusion JSON file
+
+    Returns:
+        Iterator[SlideItem]: Lazily validated slide items
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the JSON is malformed or truncated, possibly after
+            some items were already yielded
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for item in iter_json_array(f, _WRAPPER_KEYS):
+                yield from _parse_slide_item(item)
+    except (OSError, ValueError) as e:
+        # Reported here, and re-raised so a partial slide is never written
+        print(f"Error loading JSON file: {e}")
+        raise
+
+
+class ShapeRenderState:
+    """
+    Mutable output of ``generate_react_component_for_item`` that shape
+    renderers adjust.
+    
+    Attributes:
+        style: Inline style properties of the element
+        text_content: Inner JSX of the element
+        component: Element tag name
+        image_src: ``src`` attribute when the component is an ``img``
+    """
+    
+    __slots__ = ("style", "text_content", "component", "image_src")
+    
+    def __init__(self, style: StyleBuilder, text_content: str = ""):
+        self.style = style
+        self.text_content = text_content
+        self.component = "div"
+        self.image_src = None
+    
+    def has_background(self) -> bool:
+        return "backgroundColor" in self.style
+
+
+class ShapeSpec(NamedTuple):
+    """
+    Static rendering data for one AutoShapeType or SlideItemType, applied in
+    field order.
+    
+    Attributes:
+        styles: Style properties always set, as (name, value) pairs
+        default_background: Background color added if none is set yet
+        placeholder: Content used when the shape has no text
+        clip_path: CSS ``polygon()`` outline for non-rectangular shapes
+        renderer: Extra rendering step, called as ``renderer(item, state)``
+    """
+    styles: Tuple[Tuple[str, Any], ...] = ()
+    default_background: Optional[str] = None
+    placeholder: Optional[str] = None
+    clip_path: Optional[str] = None
+    renderer: Optional[Callable[["SlideItem", ShapeRenderState], None]] = None
+
+
+def apply_shape_spec(spec: ShapeSpec, item: SlideItem, state: ShapeRenderState) -> None:
+    """Apply a shape spec's static data and renderer to the render state."""
+    state.style.update(spec.styles)
+    if spec.default_background:
+        state.style.setdefault("backgroundColor", spec.default_background)
+    if spec.placeholder and not state.text_content:
+        state.text_content = spec.placeholder
+    if spec.renderer is not None:
+        spec.renderer(item, state)
+
+
+def _arrow_placeholder(arrow: str) -> str:
+    # Placeholder content keeps empty arrows visible
+    return ("<div style={{ display: 'flex', justifyContent: 'center', alignItems: 'center', "
+            f"height: '100%', color: '#ffffff' }}}}>{arrow}</div>")
+
+
+def _render_rectangle(item: SlideItem, state: ShapeRenderState) -> None:
+    """Title rectangles: a #156082 text color becomes the shape background."""
+    if not item.TextBody:
+        return
+    text_body = item.TextBody
+    paragraphs_data = []
+    
+    if isinstance(text_body, TextBody) and text_body.Paragraphs:
+        paragraphs_data = text_body.Paragraphs
+    elif isinstance(text_body, dict) and "Paragraphs" in text_body:
+        paragraphs_data = text_body["Paragraphs"]
+        
+    # Check if any paragraph contains text parts with specific color
+    for para_data in paragraphs_data:
+        text_parts = []
+        if isinstance(para_data, Paragraph):
+            text_parts = para_data.TextParts
+        elif isinstance(para_data, dict):
+            text_parts = para_data.get("TextParts", [])
+        
+        for part in text_parts:
+            font = None
+            if isinstance(part, TextPart):
+                font = part.Font
+            elif isinstance(part, dict) and "Font" in part:
+                font = part["Font"]
+            
+            # If font has color #156082 (blue), apply it to the rectangle background
+            # and change text color to white for contrast
+            if font:
+                color = None
+                if isinstance(font, Font) and font.Color == "#156082":
+                    color = font.Color
+                elif isinstance(font, dict) and font.get("Color") == "#156082":
+                    color = font.get("Color")
+                    
+                if color and not state.has_background():
+                    state.style.set("backgroundColor", color)
+                    
+                    # Always use white text on dark blue background for contrast
+                    if not hasattr(item, '_needs_contrasting_text'):
+                        item._needs_contrasting_text = True
+
+
+def _render_picture(item: SlideItem, state: ShapeRenderState) -> None:
+    if isinstance(item.ImageData, dict):
+        image_src = image_source(item.ImageData)
+        if image_src is not None:
+            # Use img tag for pictures
+            state.component = "img"
+            state.image_src = image_src
+            state.style.set("objectFit", "cover")
+
+
+def _render_chart(item: SlideItem, state: ShapeRenderState) -> None:
+    chart = chart_element(item)
+    if chart is not None:
+        state.text_content = chart
+    else:
+        # Charts without usable data keep a placeholder
+        state.text_content = "<div style={{ textAlign: 'center', padding: '20px' }}>Chart Placeholder</div>"
+
+
+def _render_table(item: SlideItem, state: ShapeRenderState) -> None:
+    table = table_element(item)
+    if table is not None:
+        state.text_content = table
+
+
+# Every AutoShapeType starts with the default (plain box) spec, so lookups
+# never miss for known types
+_DEFAULT_SHAPE_SPEC = ShapeSpec()
+_AUTO_SHAPE_SPECS: Dict[str, ShapeSpec] = {shape_type.value: _DEFAULT_SHAPE_SPEC for shape_type in AutoShapeType}
+_AUTO_SHAPE_SPECS.update({
+    # Clip paths are applied by the .shape-<type> rules in SLIDE_CSS
+    "RightArrow": ShapeSpec(default_background="#e67e22", placeholder=_arrow_placeholder("→"),
+                            clip_path="polygon(0 25%, 75% 25%, 75% 0, 100% 50%, 75% 100%, 75% 75%, 0 75%)"),
+    "LeftArrow": ShapeSpec(default_background="#3498db", placeholder=_arrow_placeholder("←"),
+                           clip_path="polygon(25% 0%, 25% 20%, 100% 20%, 100% 80%, 25% 80%, 25% 100%, 0% 50%)"),
+    "UpArrow": ShapeSpec(default_background="#2ecc71", placeholder=_arrow_placeholder("↑"),
+                         clip_path="polygon(20% 25%, 0% 25%, 50% 0%, 100% 25%, 80% 25%, 80% 100%, 20% 100%)"),
+    "DownArrow": ShapeSpec(default_background="#9b59b6", placeholder=_arrow_placeholder("↓"),
+                           clip_path="polygon(20% 0%, 20% 75%, 0% 75%, 50% 100%, 100% 75%, 80% 75%, 80% 0%)"),
+    "Circle": ShapeSpec(styles=(("borderRadius", "50%"),), default_background="#f0f0f0"),
+    "Oval": ShapeSpec(styles=(("borderRadius", "50%"),), default_background="#f0f0f0"),
+    "RoundedRectangle": ShapeSpec(styles=(("borderRadius", "10px"),)),
+    "Diamond": ShapeSpec(styles=(("backgroundColor", "#f0f0f0"),),
+                         clip_path="polygon(50% 0%, 100% 50%, 50% 100%, 0% 50%)"),
+    "Triangle": ShapeSpec(styles=(("backgroundColor", "#f0f0f0"),),
+                          clip_path="polygon(50% 0%, 100% 100%, 0% 100%)"),
+    "Pentagon": ShapeSpec(styles=(("backgroundColor", "#f0f0f0"),),
+                          clip_path="polygon(50% 0%, 100% 38%, 82% 100%, 18% 100%, 0% 38%)"),
+    "Hexagon": ShapeSpec(styles=(("backgroundColor", "#f0f0f0"),),
+                         clip_path="polygon(25% 0%, 75% 0%, 100% 50%, 75% 100%, 25% 100%, 0% 50%)"),
+    "Rectangle": ShapeSpec(renderer=_render_rectangle),
+    "Picture": ShapeSpec(renderer=_render_picture),
+})
+
+
+def _render_auto_shape(item: SlideItem, state: ShapeRenderState) -> None:
+    apply_shape_spec(_AUTO_SHAPE_SPECS.get(item.AutoShapeType, _DEFAULT_SHAPE_SPEC), item, state)
+
+
+_SLIDE_ITEM_SPECS: Dict[str, ShapeSpec] = {
+    "AutoShape": ShapeSpec(renderer=_render_auto_shape),
+    "Picture": ShapeSpec(renderer=_render_picture),
+    "Chart": ShapeSpec(styles=(("backgroundColor", "#f0f0f0"),), renderer=_render_chart),
+    # Cells carry their own fills
+    "Table": ShapeSpec(styles=(("backgroundColor", "transparent"),), renderer=_render_table),
+}
+
+# Specs registered through the public functions, part of the render cache key
+_registered_specs: Dict[Tuple[str, str], ShapeSpec] = {}
+
+
+def register_shape_renderer(auto_shape_type: str, spec: ShapeSpec) -> None:
+    """
+    Register (or replace) how an AutoShapeType is rendered.
+    
+    Register at import time so that pool worker processes, which re-import
+    this module, see the same registry. A ``clip_path`` produces a
+    ``.shape-<type>`` rule in the generated CSS.
+    
+    Args:
+        auto_shape_type: AutoShapeType value, e.g. ``"Star5"``
+        spec: Static styles, geometry and optional renderer for the shape
+    """
+    _AUTO_SHAPE_SPECS[auto_shape_type] = spec
+    _registered_specs[("AutoShape", auto_shape_type)] = spec
+
+
+def register_slide_item_renderer(slide_item_type: str, spec: ShapeSpec) -> None:
+    """
+    Register (or replace) how a SlideItemType is rendered. Replacing
+    ``"AutoShape"`` bypasses the AutoShapeType registry.
+    
+    Args:
+        slide_item_type: SlideItemType value, e.g. ``"Table"``
+        spec: Static styles and optional renderer for the item type
+    """
+    _SLIDE_ITEM_SPECS[slide_item_type] = spec
+    _registered_specs[("SlideItem", slide_item_type)] = spec
+
+
+def _registry_fingerprint() -> str:
+    """Stable description of registered specs, for render cache keys."""
+    entries = []
+    for key, spec in sorted(_registered_specs.items()):
+        renderer = spec.renderer
+        renderer_name = f"{renderer.__module__}.{renderer.__qualname__}" if renderer else None
+        entries.append(repr((key, spec.styles, spec.default_background, spec.placeholder,
+                             spec.clip_path, renderer_name)))
+    return hashlib.sha256("\n".join(entries).encode("utf-8")).hexdigest() if entries else ""
+
+
+def registered_shape_css() -> str:
+    """CSS clip-path rules for registered shapes that SLIDE_CSS does not cover."""
+    rules = []
+    for (kind, shape_type), spec in _registered_specs.items():
+        selector = f".shape-{shape_type.lower()}"
+        if kind == "AutoShape" and spec.clip_path and f"{selector} {{" not in SLIDE_CSS:
+            rules.append(f"\n{selector} {{\n  clip-path: {spec.clip_path};\n}}\n")
+    return "".join(rules)
+
+
+# Distinct (font, contrast) combinations kept; decks use a few dozen at most
+_FONT_STYLE_CACHE_SIZE = 1024
+
+# Font style cache activity reported back by pool worker processes
+_worker_font_style_stats = {"hits": 0, "misses": 0}
+
+
+def _font_fields(font: Union[Font, Dict[str, Any]]) -> Tuple[Any, ...]:
+    """Normalize a Font model or dict to (color, name, size, bold, italic)."""
+    if isinstance(font, Font):
+        return font.Color, font.FontName, font.FontSize, font.Bold, font.Italic
+    return font.get("Color"), font.get("FontName"), font.get("FontSize"), font.get("Bold"), font.get("Italic")
+
+
+@functools.lru_cache(maxsize=_FONT_STYLE_CACHE_SIZE, typed=True)
+def _span_style(color: Optional[str], font_name: Optional[str], font_size: Optional[float],
+                bold: Optional[bool], italic: Optional[bool],
+                light_background: bool, contrasting_text: bool) -> str:
+    """
+    Build the inline style of a text run. Memoized, so each distinct font and
+    contrast context is formatted once however many runs share it.
+
+    Returns:
+        str: Body of the span's style object, empty if there is none
+    """
+    text_style_props = []
+
+    # If background is light (#f0f0f0), use dark text
+    if light_background:
+        text_style_props.append("color: '#156082'")
+    # If background is dark blue, use white text
+    elif contrasting_text:
+        text_style_props.append("color: '#FFFFFF'")
+    elif color:
+        text_style_props.append(f"color: '{color}'")
+
+    if font_name:
+        # Replace Aptos with more widely supported fonts
+        if font_name == 'Aptos':
+            text_style_props.append("fontFamily: 'Segoe UI, Roboto, Helvetica, Arial, sans-serif'")
+        else:
+            text_style_props.append(f"fontFamily: '{font_name}, Arial, sans-serif'")
+    if font_size:
+        text_style_props.append(f"fontSize: '{font_size}px'")
+    if bold:
+        text_style_props.append("fontWeight: 'bold'")
+    if italic:
+        text_style_props.append("fontStyle: 'italic'")
+
+    return ", ".join(text_style_props)
+
+
+def font_style_cache_stats() -> Dict[str, int]:
+    """
+    Text run style cache activity in this process plus what pool workers
+    reported back.
+
+    Returns:
+        Dict[str, int]: hits, misses, and entries/maxsize of the local cache
+    """
+    info = _span_style.cache_info()
+    return {
+        "hits": info.hits + _worker_font_style_stats["hits"],
+        "misses": info.misses + _worker_font_style_stats["misses"],
+        "entries": info.currsize,
+        "maxsize": info.maxsize,
+    }
+
+
+def _font_style_cache_delta(before: Dict[str, int]) -> Tuple[int, int]:
+    """Hits and misses since ``before``, for workers to report back."""
+    after = font_style_cache_stats()
+    return after["hits"] - before["hits"], after["misses"] - before["misses"]
+
+
+def _record_worker_font_style_stats(delta: Tuple[int, int]) -> None:
+    _worker_font_style_stats["hits"] += delta[0]
+    _worker_font_style_stats["misses"] += delta[1]
+
+
+# Pixel grid step item geometry is snapped to; None writes exact values
+_pixel_step: Optional[float] = None
+
+# Items whose geometry is computed in one vectorized pass
+_GEOMETRY_CHUNK_SIZE = 4096
+
+
+def set_pixel_quantization(step: Optional[float]) -> None:
+    """
+    Snap item boxes and border widths to a pixel grid in every following
+    conversion (see ``syncfusion.geometry``).
+    
+    Args:
+        step: Grid step in pixels, e.g. 1 or 0.5; None writes exact values
+    """
+    global _pixel_step
+    _pixel_step = step
+
+
+def _with_geometry(slide_items: Iterable[SlideItem]) -> Iterable[SlideItem]:
+    """
+    Attach snapped pixel geometry to items (as ``_geometry``) when
+    quantization is enabled, one chunk of items per vectorized pass, so lazy
+    iterators stay lazy.
+    """
+    if _pixel_step is None:
+        return slide_items
+    if isinstance(slide_items, list):
+        _attach_geometry(slide_items)
+        return slide_items
+    return _attaching_geometry(iter(slide_items))
+
+
+def _attaching_geometry(slide_items: Iterator[SlideItem]) -> Iterator[SlideItem]:
+    while True:
+        chunk = list(itertools.islice(slide_items, _GEOMETRY_CHUNK_SIZE))
+        if not chunk:
+            return
+        _attach_geometry(chunk)
+        yield from chunk
+
+
+def _attach_geometry(slide_items: List[SlideItem]) -> None:
+    # Culling computes geometry before rendering does
+    pending = [item for item in slide_items if getattr(item, '_geometry', None) is None]
+    boxes = [(item.Left or 0, item.Top or 0, item.Width or 0, item.Height or 0, _line_width(item), item.Rotation or 0)
+             for item in pending]
+    for item, geometry in zip(pending, item_geometry(boxes, _pixel_step)):
+        item._geometry = geometry
+
+
+def _pixel_box(item: SlideItem) -> Tuple[float, float, float, float]:
+    """Left, top, width and height of an item in pixels, snapped when quantization is enabled."""
+    geometry = getattr(item, '_geometry', None)
+    if geometry is not None:
+        return geometry.left, geometry.top, geometry.width, geometry.height
+    return item.Left * 1.33333, item.Top * 1.33333, item.Width * 1.33333, item.Height * 1.33333
+
+
 def generate_react_component_for_item(item: SlideItem) -> str:
     """
     Generate a React component for a given slide item.
@@ -196,17 +708,28 @@ def generate_react_component_for_item(item: SlideItem) -> str:
         return ""
     
     # Basic position and style - convert PowerPoint points to pixels (1 pt = 1.33333 px)
-    style_props = [
-        f"position: 'absolute'",
-        f"left: '{item.Left * 1.33333}px'",
-        f"top: '{item.Top * 1.33333}px'",
-        f"width: '{item.Width * 1.33333}px'",
-        f"height: '{item.Height * 1.33333}px'"
-    ]
+    geometry = getattr(item, '_geometry', None)
+    if geometry is not None:
+        # Precomputed and snapped by the geometry pass
+        style = StyleBuilder((
+            ("position", "absolute"),
+            ("left", f"{format_pixels(geometry.left)}px"),
+            ("top", f"{format_pixels(geometry.top)}px"),
+            ("width", f"{format_pixels(geometry.width)}px"),
+            ("height", f"{format_pixels(geometry.height)}px"),
+        ))
+    else:
+        style = StyleBuilder((
+            ("position", "absolute"),
+            ("left", f"{item.Left * 1.33333}px"),
+            ("top", f"{item.Top * 1.33333}px"),
+            ("width", f"{item.Width * 1.33333}px"),
+            ("height", f"{item.Height * 1.33333}px"),
+        ))
     
     # Add rotation if present
     if item.Rotation and item.Rotation != 0:
-        style_props.append(f"transform: 'rotate({item.Rotation}deg)'")
+        style.set("transform", f"rotate({item.Rotation}deg)")
     
     # Process fill format
     if item.FillFormat:
@@ -219,19 +742,19 @@ def generate_react_component_for_item(item: SlideItem) -> str:
                 # Solid fill
                 if "Color" in fill_format:
                     color = fill_format.get("Color")
-                    style_props.append(f"backgroundColor: '{color}'")
+                    style.set("backgroundColor", f"{color}")
             elif fill_type == "Gradient" and "Gradient" in fill_format:
                 # Gradient fill - simplified handling
                 color = fill_format.get('Color', '#ffffff')
-                style_props.append(f"background: 'linear-gradient(90deg, {color}, #e0e0e0)'")
+                style.set("background", f"linear-gradient(90deg, {color}, #e0e0e0)")
             elif fill_type == "Picture" and "Image" in fill_format:
                 # Image fill - simplified handling
-                style_props.append("backgroundSize: 'cover'")
-                style_props.append("backgroundPosition: 'center'")
+                style.set("backgroundSize", "cover")
+                style.set("backgroundPosition", "center")
         else:
             # Handle model format
             if hasattr(fill_format, 'Color') and fill_format.Color:
-                style_props.append(f"backgroundColor: '{fill_format.Color}'")
+                style.set("backgroundColor", f"{fill_format.Color}")
     
     # Process line format
     if item.LineFormat:
@@ -239,36 +762,42 @@ def generate_react_component_for_item(item: SlideItem) -> str:
         if isinstance(line_format, dict):
             # Handle dictionary format
             if "Color" in line_format:
-                style_props.append(f"borderColor: '{line_format['Color']}'")
+                style.set("borderColor", f"{line_format['Color']}")
             if "Width" in line_format:
-                style_props.append(f"borderWidth: '{line_format['Width'] * 1.33333}px'")
+                border_width = (format_pixels(geometry.border) if geometry is not None
+                                else line_format['Width'] * 1.33333)
+                style.set("borderWidth", f"{border_width}px")
             if "Style" in line_format:
                 border_style = line_format["Style"].lower() if isinstance(line_format["Style"], str) else "solid"
-                style_props.append(f"borderStyle: '{border_style}'")
+                style.set("borderStyle", f"{border_style}")
         else:
             # Handle model format
             if hasattr(line_format, 'Color') and line_format.Color:
-                style_props.append(f"borderColor: '{line_format.Color}'")
+                style.set("borderColor", f"{line_format.Color}")
             if hasattr(line_format, 'Width') and line_format.Width:
-                style_props.append(f"borderWidth: '{line_format.Width * 1.33333}px'")
+                border_width = format_pixels(geometry.border) if geometry is not None else line_format.Width * 1.33333
+                style.set("borderWidth", f"{border_width}px")
             if hasattr(line_format, 'Style') and line_format.Style:
-                style_props.append(f"borderStyle: '{line_format.Style}'")
+                style.set("borderStyle", f"{line_format.Style}")
     
     # Process shadow format
     if item.ShadowFormat:
         shadow_format = item.ShadowFormat
         if isinstance(shadow_format, dict):
             shadow_color = shadow_format.get("Color", "rgba(0,0,0,0.3)")
-            style_props.append(f"boxShadow: '2px 2px 5px {shadow_color}'")
-    
-    # Combine style properties
-    style_str = ",\n        ".join(style_props)
+            style.set("boxShadow", f"2px 2px 5px {shadow_color}")
     
     # Process text content if present
     text_content = ""
     if item.TextBody:
         paragraphs = []
         
+        # Background color decides the text color for contrast; neither it
+        # nor the contrast flag changes while the text is processed
+        bg_color = style.get("backgroundColor")
+        light_background = bg_color in ('#f0f0f0', '#ffffff', '#FFFFFF')
+        contrasting_text = getattr(item, '_needs_contrasting_text', False)
+        
         # Handle both TextBody model and dictionary
         paragraphs_data = []
         if isinstance(item.TextBody, TextBody) and item.TextBody.Paragraphs:
@@ -319,72 +848,15 @@ def generate_react_component_for_item(item: SlideItem) -> str:
                     font = font_data if isinstance(font_data, Font) else font_data
                     part_text = part_data.get("Text", "")
                 
-                text_style_props = []
-                
-                # Get font properties, handling both model and dict
-                if isinstance(font, Font):
-                    # Check background color to determine appropriate text color for contrast
-                    bg_color = next((prop.split(":")[1].strip(" '") for prop in style_props if "backgroundColor" in prop), None)
-                    
-                    # If background is light (#f0f0f0), use dark text
-                    if bg_color and bg_color in ['#f0f0f0', '#ffffff', '#FFFFFF']:
-                        text_style_props.append("color: '#156082'")
-                    # If background is dark blue, use white text
-                    elif hasattr(item, '_needs_contrasting_text') and item._needs_contrasting_text:
-                        text_style_props.append("color: '#FFFFFF'")
-                    elif font.Color:
-                        text_style_props.append(f"color: '{font.Color}'")
-                    
-                    if font.FontName:
-                        # Replace Aptos with more widely supported fonts
-                        font_name = font.FontName
-                        if font_name == 'Aptos':
-                            text_style_props.append(f"fontFamily: 'Segoe UI, Roboto, Helvetica, Arial, sans-serif'")
-                        else:
-                            text_style_props.append(f"fontFamily: '{font_name}, Arial, sans-serif'")
-                    if font.FontSize:
-                        text_style_props.append(f"fontSize: '{font.FontSize}px'")
-                    if font.Bold:
-                        text_style_props.append("fontWeight: 'bold'")
-                    if font.Italic:
-                        text_style_props.append("fontStyle: 'italic'")
-                else:  # Dictionary
-                    # Check background color to determine appropriate text color for contrast
-                    bg_color = next((prop.split(":")[1].strip(" '") for prop in style_props if "backgroundColor" in prop), None)
-                    
-                    # If background is light (#f0f0f0), use dark text
-                    if bg_color and bg_color in ['#f0f0f0', '#ffffff', '#FFFFFF']:
-                        text_style_props.append("color: '#156082'")
-                    # If background is dark blue, use white text
-                    elif hasattr(item, '_needs_contrasting_text') and item._needs_contrasting_text:
-                        text_style_props.append("color: '#FFFFFF'")
-                    elif font.get("Color"):
-                        color = font.get("Color")
-                        text_style_props.append(f"color: '{color}'")
-                        
-                    if font.get("FontName"):
-                        font_name = font.get("FontName")
-                        # Replace Aptos with more widely supported fonts
-                        if font_name == 'Aptos':
-                            text_style_props.append(f"fontFamily: 'Segoe UI, Roboto, Helvetica, Arial, sans-serif'")
-                        else:
-                            text_style_props.append(f"fontFamily: '{font_name}, Arial, sans-serif'")
-                    if font.get("FontSize"):
-                        font_size = font.get("FontSize")
-                        text_style_props.append(f"fontSize: '{font_size}px'")
-                    if font.get("Bold"):
-                        text_style_props.append("fontWeight: 'bold'")
-                    if font.get("Italic"):
-                        text_style_props.append("fontStyle: 'italic'")
-                
-                text_style_str = ", ".join(text_style_props)
+                # Font and contrast context are normalized so that model and
+                # dict fonts with the same properties share one cached style
+                text_style_str = _span_style(*_font_fields(font), light_background, contrasting_text)
                 
                 # Add prefix only to the first text part
                 current_prefix = prefix if len(text_parts) == 0 else ""
                 
                 # Create text part with style - using proper JSX style object syntax
-                text_style_str = ", ".join(text_style_props)
-                if text_style_props:
+                if text_style_str:
                     text_part = f"<span style={{{{ {text_style_str} }}}}>{current_prefix}{part_text}</span>"
                 else:
                     text_part = f"<span>{current_prefix}{part_text}</span>"
@@ -419,15 +891,14 @@ def generate_react_component_for_item(item: SlideItem) -> str:
     # Process opacity if present
     if item.Opacity is not None and item.Opacity != 100:
         opacity_value = item.Opacity / 100
-        style_props.append(f"opacity: {opacity_value}")
+        style.set("opacity", opacity_value)
     
     # Process z-index if present
     if item.ZIndex is not None:
-        style_props.append(f"zIndex: {item.ZIndex}")
+        style.set("zIndex", item.ZIndex)
         
     # Ensure all shapes have a background color for visibility
-    if not any("backgroundColor" in prop for prop in style_props):
-        style_props.append("backgroundColor: '#f0f0f0'")
+    style.setdefault("backgroundColor", "#f0f0f0")
     
     # Process fill color if present
     fill_color = None
@@ -436,126 +907,17 @@ def generate_react_component_for_item(item: SlideItem) -> str:
             if hasattr(item.Fill, 'SolidFill') and hasattr(item.Fill.SolidFill, 'Color'):
                 fill_color = item.Fill.SolidFill.Color
     
-    # Determine the component to use based on shape type
-    component = "div"
-    if item.SlideItemType == "AutoShape":
-        # Handle different auto shape types
-        if item.AutoShapeType == "RightArrow":
-            # Don't add clipPath directly in JSX - we'll handle it in CSS for better browser compatibility
-            # Only add background color if not already specified in FillFormat
-            if not any("backgroundColor" in prop for prop in style_props):
-                style_props.append("backgroundColor: '#e67e22'")
-            
-            # Add placeholder content for empty arrows to ensure visibility
-            if not text_content or text_content == "":
-                text_content = "<div style={{ display: 'flex', justifyContent: 'center', alignItems: 'center', height: '100%', color: '#ffffff' }}>→</div>"
-        elif item.AutoShapeType == "LeftArrow":
-            # Don't add clipPath directly in JSX - we'll handle it in CSS for better browser compatibility
-            if not any("backgroundColor" in prop for prop in style_props):
-                style_props.append("backgroundColor: '#3498db'")
-            
-            # Add placeholder content for empty arrows to ensure visibility
-            if not text_content or text_content == "":
-                text_content = "<div style={{ display: 'flex', justifyContent: 'center', alignItems: 'center', height: '100%', color: '#ffffff' }}>←</div>"
-        elif item.AutoShapeType == "UpArrow":
-            # Don't add clipPath directly in JSX - we'll handle it in CSS for better browser compatibility
-            if not any("backgroundColor" in prop for prop in style_props):
-                style_props.append("backgroundColor: '#2ecc71'")
-            
-            # Add placeholder content for empty arrows to ensure visibility
-            if not text_content or text_content == "":
-                text_content = "<div style={{ display: 'flex', justifyContent: 'center', alignItems: 'center', height: '100%', color: '#ffffff' }}>↑</div>"
-        elif item.AutoShapeType == "DownArrow":
-            # Don't add clipPath directly in JSX - we'll handle it in CSS for better browser compatibility
-            if not any("backgroundColor" in prop for prop in style_props):
-                style_props.append("backgroundColor: '#9b59b6'")
-            
-            # Add placeholder content for empty arrows to ensure visibility
-            if not text_content or text_content == "":
-                text_content = "<div style={{ display: 'flex', justifyContent: 'center', alignItems: 'center', height: '100%', color: '#ffffff' }}>↓</div>"
-        elif item.AutoShapeType == "Circle" or item.AutoShapeType == "Oval":
-            style_props.append("borderRadius: '50%'")
-            if not any("backgroundColor" in prop for prop in style_props):
-                style_props.append("backgroundColor: '#f0f0f0'")
-        elif item.AutoShapeType == "RoundedRectangle":
-            style_props.append("borderRadius: '10px'")
-        elif item.AutoShapeType == "Diamond":
-            # Don't add clipPath directly in JSX - we'll handle it in CSS for better browser compatibility
-            style_props.append("backgroundColor: '#f0f0f0'")
-        elif item.AutoShapeType == "Triangle":
-            # Don't add clipPath directly in JSX - we'll handle it in CSS for better browser compatibility
-            style_props.append("backgroundColor: '#f0f0f0'")
-        elif item.AutoShapeType == "Pentagon":
-            # Don't add clipPath directly in JSX - we'll handle it in CSS for better browser compatibility
-            style_props.append("backgroundColor: '#f0f0f0'")
-        elif item.AutoShapeType == "Hexagon":
-            # Don't add clipPath directly in JSX - we'll handle it in CSS for better browser compatibility
-            style_props.append("backgroundColor: '#f0f0f0'")
-            
-        # Special case for Rectangle with title text - preserve the color from TextBody
-        if item.AutoShapeType == "Rectangle" and item.TextBody:
-            text_body = item.TextBody
-            paragraphs_data = []
-            
-            if isinstance(text_body, TextBody) and text_body.Paragraphs:
-                paragraphs_data = text_body.Paragraphs
-            elif isinstance(text_body, dict) and "Paragraphs" in text_body:
-                paragraphs_data = text_body["Paragraphs"]
-                
-            # Check if any paragraph contains text parts with specific color
-            for para_data in paragraphs_data:
-                text_parts = []
-                if isinstance(para_data, Paragraph):
-                    text_parts = para_data.TextParts
-                elif isinstance(para_data, dict):
-                    text_parts = para_data.get("TextParts", [])
-                
-                for part in text_parts:
-                    font = None
-                    if isinstance(part, TextPart):
-                        font = part.Font
-                    elif isinstance(part, dict) and "Font" in part:
-                        font = part["Font"]
-                    
-                    # If font has color #156082 (blue), apply it to the rectangle background
-                    # and change text color to white for contrast
-                    if font:
-                        color = None
-                        if isinstance(font, Font) and font.Color == "#156082":
-                            color = font.Color
-                        elif isinstance(font, dict) and font.get("Color") == "#156082":
-                            color = font.get("Color")
-                            
-                        if color and not any("backgroundColor" in prop for prop in style_props):
-                            style_props.append(f"backgroundColor: '{color}'")
-                            
-                            # Always use white text on dark blue background for contrast
-                            if not hasattr(item, '_needs_contrasting_text'):
-                                item._needs_contrasting_text = True
-    elif item.SlideItemType == "Picture" or (item.SlideItemType == "AutoShape" and item.AutoShapeType == "Picture"):
-        # Handle picture elements
-        if item.ImageData:
-            image_data = item.ImageData
-            if isinstance(image_data, dict):
-                if "Base64" in image_data:
-                    # Use img tag for pictures
-                    component = "img"
-                    base64_data = image_data.get("Base64", "")
-                    style_props.append(f"src: 'data:image/png;base64,{base64_data}'")
-                    style_props.append("objectFit: 'cover'")
-                elif "ImagePath" in image_data:
-                    component = "img"
-                    image_path = image_data.get("ImagePath", "")
-                    style_props.append(f"src: '{image_path}'")
-                    style_props.append("objectFit: 'cover'")
-    elif item.SlideItemType == "Chart":
-        # For charts, we would need to implement chart rendering
-        # This is a placeholder for chart handling
-        style_props.append("backgroundColor: '#f0f0f0'")
-        text_content = "<div style={{ textAlign: 'center', padding: '20px' }}>Chart Placeholder</div>"
+    # Apply the shape-specific renderer for the item type
+    state = ShapeRenderState(style, text_content)
+    spec = _SLIDE_ITEM_SPECS.get(item.SlideItemType)
+    if spec is not None:
+        apply_shape_spec(spec, item, state)
+    component = state.component
+    image_src = state.image_src
+    text_content = state.text_content
     
-    # Update style string after adding shape-specific styles
-    style_str = ",\n        ".join(style_props)
+    # Serialize the style once, after the shape-specific styles
+    style_str = style.serialize(",\n        ")
     
     # Add any additional attributes from the item that might be useful
     additional_attrs = []
@@ -565,6 +927,9 @@ def generate_react_component_for_item(item: SlideItem) -> str:
         additional_attrs.append(f'data-shape-type="{item.AutoShapeType}"')
     if item.SlideItemType:
         additional_attrs.append(f'data-slide-item-type="{item.SlideItemType}"')
+    if component == "img":
+        # src is an attribute, not a style property
+        additional_attrs.append(f'src="{image_src}" alt=""')
     
     # Add any other custom properties as data attributes
     for key, value in item.__dict__.items():
@@ -585,11 +950,23 @@ def generate_react_component_for_item(item: SlideItem) -> str:
         shape_class += " shape-picture"
     elif item.SlideItemType == "Chart":
         shape_class += " shape-chart"
+    elif item.SlideItemType == "Table":
+        shape_class += " shape-table"
         
     # Add bullet-indent class if needed (separate from style props)
     if hasattr(item, '_bullet_indent_class') and item._bullet_indent_class:
         shape_class += " bullet-indent"
         
+    if component == "img":
+        # img is a void element and cannot have children
+        return f"""
+    <img 
+      id="shape_{item.ShapeId}"
+      className="{shape_class}"
+      style={{{{ {style_str} }}}}
+      {additional_attrs_str}
+    />"""
+    
     jsx = f"""
     <{component} 
       id="shape_{item.ShapeId}"
@@ -603,115 +980,2068 @@ def generate_react_component_for_item(item: SlideItem) -> str:
     return jsx
 
 
-def convert_json_to_react(slide_items: List[SlideItem], slide_props: Dict[str, Any] = None) -> str:
+# Image asset store shared by every conversion in this process
+_asset_store: Optional[AssetStore] = None
+
+
+def enable_asset_store(directory: str, url_prefix: str = "assets") -> AssetStore:
     """
-    Convert Syncfusion PowerPoint JSON to React components.
+    Write embedded images to content-hashed files in ``directory`` and
+    reference them by URL, instead of inlining base64 data URIs.
     
     Args:
-        slide_items: List of slide items
-        slide_props: Optional slide properties (width, height, background, etc.)
+        directory: Asset output directory
+        url_prefix: URL path under which the directory is served
         
     Returns:
-        str: Complete React component code
+        AssetStore: The active asset store
     """
-    if not slide_props:
-        # Default slide size for PowerPoint is 720x540 points
-        # Convert to pixels (1 pt = 1.33333 px)
-        slide_props = {
-            "width": 960,  # 720 * 1.33333
-            "height": 720,  # 540 * 1.33333
-            "background": "#ffffff"
-        }
-    
-    # Generate components for each slide item
-    components = []
-    for item in slide_items:
-        component = generate_react_component_for_item(item)
-        if component:
-            components.append(component)
+    global _asset_store
+    _asset_store = AssetStore(directory, url_prefix)
+    return _asset_store
+
+
+def _asset_store_settings() -> Optional[Tuple[str, str]]:
+    """Picklable asset store configuration for pool worker initializers."""
+    if _asset_store is None:
+        return None
+    return _asset_store.directory, _asset_store.url_prefix
+
+
+def image_source(image_data: Dict[str, Any]) -> Optional[str]:
+    """
+    Resolve the ``src`` of a picture from its ImageData.
     
-    # Create the React component
-    component_jsx = "\n".join(components)
+    Base64 payloads are stored as assets when the asset store is enabled, or
+    inlined as data URIs with their sniffed MIME type otherwise or when they
+    cannot be decoded. A ``FallbackBase64`` image is used when the primary
+    one is in a format browsers cannot display (EMF, WMF, TIFF).
     
-    # Create the React component file with proper CSS imports and styling
-    react_component = f"""import React from 'react';
-import './SyncfusionSlide.css';
+    Args:
+        image_data: ImageData dictionary (Base64, FallbackBase64 or ImagePath)
+        
+    Returns:
+        Optional[str]: Image URL, or None if there is no image
+    """
+    if "Base64" in image_data:
+        base64_data = image_data.get("Base64") or ""
+        fallback_data = image_data.get("FallbackBase64")
+        if _asset_store is not None:
+            try:
+                url, mime = _asset_store.add_base64(base64_data)
+                if mime in NON_WEB_MIME_TYPES and fallback_data:
+                    url, mime = _asset_store.add_base64(fallback_data)
+                return url
+            except (binascii.Error, ValueError) as e:
+                # One broken picture must not abort the conversion
+                print(f"Warning: Could not store picture as an asset ({e}); inlining it")
+        mime, _ = sniff_base64_mime(base64_data)
+        if mime in NON_WEB_MIME_TYPES and fallback_data:
+            base64_data = fallback_data
+            mime, _ = sniff_base64_mime(base64_data)
+        if not mime.startswith("image/"):
+            mime = "image/png"
+        return f"data:{mime};base64,{strip_data_uri(base64_data)}"
+    if "ImagePath" in image_data:
+        return image_data.get("ImagePath", "")
+    return None
 
-/**
- * SyncfusionSlide - A React component that renders a PowerPoint slide
- * converted from Syncfusion JSON format.
- * 
- * The component preserves the visual properties of the PowerPoint elements including:
- * - Position (Left, Top, Width, Height)
- * - Formatting (Fill, LineFormat)
- * - Text content with formatting
- * - Rotation
- * - Shape types
- */
-export const SyncfusionSlide = () => {{
-  return (
-    <div 
-      className="syncfusion-slide"
-      style={{{{
-        position: 'relative',
-        width: '{slide_props['width']}px',
-        height: '{slide_props['height']}px',
-        backgroundColor: '{slide_props['background']}',
-        overflow: 'hidden',
-        boxSizing: 'border-box',
-        fontFamily: 'Arial, sans-serif'
-      }}}}
-    >
-{component_jsx}
-    </div>
-  );
-}};
 
-// CSS file (SyncfusionSlide.css) should include:
-// .syncfusion-slide {{
-//   border: 1px solid #ccc;
-//   box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-// }}
-// .syncfusion-shape {{
-//   box-sizing: border-box;
-// }}
+# Chart data module store shared by every conversion in this process
+_chart_store: Optional[ChartStore] = None
 
-export default SyncfusionSlide;
-"""
-    
-    return react_component
+_CHART_SERIES = TypeAdapter(List[ChartSerie])
 
+# Downsampling method for long chart series ("lttb" or "minmax"), or None
+_chart_downsampling: Optional[str] = None
 
-def main():
-    """Main function to execute the conversion."""
-    import argparse
+# Start of the element that draws a chart; modules using it get the component
+_CHART_ELEMENT = "<SyncfusionChart "
+
+
+def enable_chart_store(directory: str, import_prefix: str = "./charts") -> ChartStore:
+    """
+    Write chart data to content-hashed JSON modules in ``directory``, loaded
+    by the chart component on first render, instead of inlining it.
+    
+    Args:
+        directory: Chart data output directory
+        import_prefix: Module path of the directory as imported from the
+            generated components
+        
+    Returns:
+        ChartStore: The active chart store
+    """
+    global _chart_store
+    _chart_store = ChartStore(directory, import_prefix)
+    return _chart_store
+
+
+def _chart_store_settings() -> Optional[Tuple[str, str]]:
+    """Picklable chart store configuration for pool worker initializers."""
+    if _chart_store is None:
+        return None
+    return _chart_store.directory, _chart_store.import_prefix
+
+
+def enable_chart_downsampling(method: str = "lttb") -> None:
+    """
+    Reduce line, area and scatter chart series with more points than the
+    chart is wide in pixels, for every following conversion.
+    
+    Args:
+        method: ``"lttb"`` (Largest-Triangle-Three-Buckets, one point per
+            pixel column) or ``"minmax"`` (lowest and highest point per
+            pixel column)
+    """
+    global _chart_downsampling
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"Unknown downsampling method {method!r}, expected one of {', '.join(DOWNSAMPLE_METHODS)}")
+    _chart_downsampling = method
+
+
+def chart_element(item: SlideItem) -> Optional[str]:
+    """
+    Render the ``SyncfusionChart`` element of a chart item.
+    
+    The item's ``ChartData`` rows and ``Series`` (``ChartSerie`` models or
+    dicts) are converted into a columnar JSON document, which is written to
+    the chart store when it is enabled or inlined as the ``data`` prop.
+    
+    Args:
+        item: Chart slide item
+        
+    Returns:
+        Optional[str]: JSX element, or None if the chart has no usable data
+    """
+    grid = getattr(item, "ChartData", None)
+    if not isinstance(grid, list) or not grid:
+        return None
+    try:
+        series = _CHART_SERIES.validate_python(getattr(item, "Series", None) or [])
+    except ValidationError:
+        return None
+    _, _, width, height = _pixel_box(item)
+    document = chart_document(grid, series, getattr(item, "ChartTitle", None), _chart_downsampling, int(width))
+    if document is None:
+        return None
+    if _chart_store is not None:
+        source = f"load={{() => import('{_chart_store.add(document)}')}}"
+    else:
+        source = f"data={{{document}}}"
+    return (f"{_CHART_ELEMENT}width={{{format_coordinate(width)}}} height={{{format_coordinate(height)}}} "
+            f"{source} />")
+
+
+# Tables with more rows are rendered as a windowed SyncfusionTable; 0 renders
+# every table as a plain <table>
+_table_window_rows = 200
+
+_TABLE_ROWS = TypeAdapter(List[TableRow])
+
+# Start of the element that draws a windowed table
+_TABLE_ELEMENT = "<SyncfusionTable "
+
+_JSX_TEXT_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", "{": "&#123;", "}": "&#125;"})
+
+
+def set_table_window_rows(rows: int) -> None:
+    """
+    Render tables with more than ``rows`` rows as a scrollable component that
+    mounts only the rows in view, for every following conversion.
+    
+    Args:
+        rows: Row threshold; 0 renders every table as a plain ``<table>``
+    """
+    global _table_window_rows
+    _table_window_rows = rows
+
+
+def table_element(item: SlideItem) -> Optional[str]:
+    """
+    Render the rows of a table item (``TableRow`` models or dicts).
+    
+    Merged cells are resolved once into a merge map (see
+    ``syncfusion.tables``). Tables up to the row threshold become a plain
+    ``<table>`` with rowSpan/colSpan; longer ones a ``SyncfusionTable`` whose
+    cells are passed as data and mounted only while their rows are in view.
+    
+    Args:
+        item: Table slide item
+        
+    Returns:
+        Optional[str]: JSX element, or None if the table has no rows
+    """
+    try:
+        rows = _TABLE_ROWS.validate_python(getattr(item, "Rows", None) or [])
+    except ValidationError:
+        return None
+    if not rows:
+        return None
+    _, _, width, height = _pixel_box(item)
+    layout = table_layout(rows, width, height)
+    style = _table_style(item)
+    if _table_window_rows and len(rows) > _table_window_rows:
+        return _windowed_table(layout, style, _table_flags(item))
+    return _static_table(layout, style, _table_flags(item))
+
+
+def _table_style(item: SlideItem) -> Optional[str]:
+    """The item's ``BuiltInStyle`` value, or None if it is missing or unknown."""
+    style = getattr(item, "BuiltInStyle", None)
+    try:
+        return BuiltInTableStyle(style).value if style is not None else None
+    except ValueError:
+        return None
+
+
+def _table_flags(item: SlideItem) -> TableFlags:
+    return TableFlags(*(bool(getattr(item, name, None)) for name in (
+        "HasHeaderRow", "HasTotalRow", "HasFirstColumn", "HasLastColumn", "HasBandedRows", "HasBandedColumns")))
+
+
+def _static_table(layout: TableLayout, style: Optional[str] = None, flags: TableFlags = TableFlags()) -> str:
+    row_classes, column_classes = table_classes(len(layout.rows), len(layout.column_widths), flags)
+    columns = "".join(f"<col style={{{{ width: '{format_coordinate(width)}px' }}}} />"
+                      for width in layout.column_widths)
+    row_tags = []
+    for height, cells, row in zip(layout.row_heights, layout.rows, row_classes):
+        cell_tags = []
+        for placement in cells:
+            attributes = ""
+            # Style formatting comes from the style's shared sheet; an explicit
+            # cell fill still wins as an inline style
+            class_name = cell_class(style, row, column_classes[placement.column]) if style else None
+            if class_name:
+                attributes += f' className="{class_name}"'
+            if placement.row_span > 1:
+                attributes += f" rowSpan={{{placement.row_span}}}"
+            if placement.column_span > 1:
+                attributes += f" colSpan={{{placement.column_span}}}"
+            background = _schema_fill_color(placement.cell.Fill)
+            if background:
+                attributes += f" style={{{{ backgroundColor: '{background}' }}}}"
+            text = "<br />".join(line.translate(_JSX_TEXT_ESCAPES) for line in cell_lines(placement.cell))
+            cell_tags.append(f"<td{attributes}>{text}</td>")
+        row_tags.append(f"<tr style={{{{ height: '{format_coordinate(height)}px' }}}}>{''.join(cell_tags)}</tr>")
+    rows = "\n            ".join(row_tags)
+    return f"""<table className="syncfusion-table">
+          <colgroup>{columns}</colgroup>
+          <tbody>
+            {rows}
+          </tbody>
+        </table>"""
+
+
+def _windowed_table(layout: TableLayout, style: Optional[str] = None, flags: TableFlags = TableFlags()) -> str:
+    # Cells are [column, text] or [column, text, rowSpan, colSpan, background?]
+    rows = []
+    for cells in layout.rows:
+        entries = []
+        for placement in cells:
+            entry = [placement.column, "\n".join(cell_lines(placement.cell))]
+            background = _schema_fill_color(placement.cell.Fill)
+            if background or placement.row_span > 1 or placement.column_span > 1:
+                entry += [placement.row_span, placement.column_span]
+                if background:
+                    entry.append(background)
+            entries.append(entry)
+        rows.append(entries)
+    props = [
+        f"columns={{[{','.join(map(format_coordinate, layout.column_widths))}]}}",
+        f"rowHeights={{[{','.join(map(format_coordinate, layout.row_heights))}]}}",
+        f"rows={{{json.dumps(rows, ensure_ascii=False, separators=(',', ':'))}}}",
+    ]
+    if any(start != index for index, start in enumerate(layout.span_start)):
+        props.append(f"spanStart={{{json.dumps(layout.span_start, separators=(',', ':'))}}}")
+    if style and style_sheet(style):
+        # One class code per row and column; the component joins them into
+        # the style's cell classes
+        row_classes, column_classes = table_classes(len(layout.rows), len(layout.column_widths), flags)
+        props += [
+            f'tableStyle="{style_class_prefix(style)}"',
+            f'rowClasses="{"".join(ROW_CLASS_CODES[row] for row in row_classes)}"',
+            f'columnClasses="{"".join(COLUMN_CLASS_CODES[column] for column in column_classes)}"',
+        ]
+    return f"{_TABLE_ELEMENT}{' '.join(props)} />"
+
+
+# Rendered-fragment cache shared by every conversion in this process
+_render_cache: Optional[RenderCache] = None
+_converter_version: Optional[str] = None
+
+# Items looked up in the render cache per round trip
+_CACHE_CHUNK_SIZE = 256
+
+
+def enable_render_cache(directory: str, max_bytes: int) -> RenderCache:
+    """
+    Cache rendered item fragments on disk for every following conversion.
+    
+    Args:
+        directory: Cache directory, shared safely between processes
+        max_bytes: Size cap; least recently used fragments are evicted first
+        
+    Returns:
+        RenderCache: The active cache
+    """
+    global _render_cache, _converter_version
+    _render_cache = RenderCache(directory, max_bytes)
+    if _converter_version is None:
+        _converter_version = _converter_source_hash()
+    return _render_cache
+
+
+def _converter_source_hash() -> str:
+    """
+    Hash of this file and every module of the ``syncfusion`` package, in
+    sorted order, so any change to the converter source invalidates earlier
+    fragments.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    package = os.path.join(here, "syncfusion")
+    sources = [os.path.abspath(__file__)]
+    sources += sorted(glob.glob(os.path.join(package, "**", "*.py"), recursive=True))
+    digest = hashlib.sha256()
+    for source in sources:
+        # The path is part of the hash, so moving code between modules counts
+        digest.update(os.path.relpath(source, here).encode("utf-8") + b"\0")
+        with open(source, 'rb') as f:
+            digest.update(f.read())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _render_cache_settings() -> Optional[Tuple[str, int]]:
+    """Picklable cache configuration for pool worker initializers."""
+    if _render_cache is None:
+        return None
+    return os.path.dirname(_render_cache.path), _render_cache.max_bytes
+
+
+def render_item_fragments(slide_items: Iterable[SlideItem]) -> Iterator[str]:
+    """
+    Render slide items to JSX fragments, in order, reusing cached fragments
+    when the render cache is enabled.
+    
+    Items are keyed on a canonical JSON dump of the validated model plus the
+    converter version, and looked up in chunks to keep disk round trips low.
+    Items that write asset or chart data files are always rendered.
+    
+    Args:
+        slide_items: Slide items, either a list or a lazy iterator
+        
+    Returns:
+        Iterator[str]: One fragment per item (empty for skipped items)
+    """
+    slide_items = _with_geometry(slide_items)
+    if _render_cache is None:
+        for item in slide_items:
+            yield _lazy_fragment(item, generate_react_component_for_item(item))
+        return
+    
+    # Registered shape renderers change the output without changing this file
+    version = _converter_version + _registry_fingerprint()
+    if _chart_downsampling is not None:
+        version += f":downsample={_chart_downsampling}"
+    version += f":table-window={_table_window_rows}"
+    if _pixel_step is not None:
+        version += f":pixel-step={_pixel_step}"
+    slide_items = iter(slide_items)
+    while True:
+        chunk = list(itertools.islice(slide_items, _CACHE_CHUNK_SIZE))
+        if not chunk:
+            return
+        keys = [
+            None if _writes_store_files(item) else
+            cache_key(version, json.dumps(item.model_dump(mode='json'), sort_keys=True, separators=(',', ':')))
+            for item in chunk
+        ]
+        fragments = _render_cache.get_many([key for key in keys if key is not None])
+        rendered = {}
+        for key, item in zip(keys, chunk):
+            if key is None:
+                yield _lazy_fragment(item, generate_react_component_for_item(item))
+                continue
+            if key not in fragments:
+                fragments[key] = rendered[key] = generate_react_component_for_item(item)
+            yield _lazy_fragment(item, fragments[key])
+        _render_cache.put_many(rendered)
+
+
+def _writes_store_files(item: SlideItem) -> bool:
+    """
+    Whether rendering an item writes an asset or chart data file. Such items
+    bypass the render cache, since a hit would skip the write and leave the
+    fragment pointing at a file that may not exist.
+    """
+    if _asset_store is not None and isinstance(getattr(item, "ImageData", None), dict):
+        return True
+    return _chart_store is not None and item.SlideItemType == "Chart"
+
+
+# Default slide size for PowerPoint is 720x540 points
+# Convert to pixels (1 pt = 1.33333 px)
+DEFAULT_SLIDE_PROPS = {
+    "width": 960,  # 720 * 1.33333
+    "height": 720,  # 540 * 1.33333
+    "background": "#ffffff"
+}
+
+_COMPONENT_FILE_HEADER = """import React from 'react';
+import './SyncfusionSlide.css';
+"""
+
+_COMPONENT_FILE_FOOTER = """// CSS file (SyncfusionSlide.css) should include:
+// .syncfusion-slide {{
+//   border: 1px solid #ccc;
+//   box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+// }}
+// .syncfusion-shape {{
+//   box-sizing: border-box;
+// }}
+
+export default {component_name};
+"""
+
+# Whether output mounts slides, pictures and charts only near the viewport
+_virtualize = False
+
+# Slide items whose fragments are mounted lazily in virtualized output
+_LAZY_SLIDE_ITEM_TYPES = ("Picture", "Chart")
+
+_LAZY_MOUNT_COMPONENT = """
+/**
+ * LazyMount - Renders a fixed-size placeholder until it comes within one
+ * viewport of the visible area, then mounts its children and keeps them.
+ */
+const LazyMount = ({ width, height, className, style, children }) => {
+  const ref = React.useRef(null);
+  const [mounted, setMounted] = React.useState(false);
+  React.useEffect(() => {
+    const node = ref.current;
+    if (mounted || !node) {
+      return undefined;
+    }
+    if (typeof IntersectionObserver === 'undefined') {
+      setMounted(true);
+      return undefined;
+    }
+    const observer = new IntersectionObserver((entries) => {
+      if (entries.some((entry) => entry.isIntersecting)) {
+        setMounted(true);
+        observer.disconnect();
+      }
+    }, { rootMargin: '100% 0px' });
+    observer.observe(node);
+    return () => observer.disconnect();
+  }, [mounted]);
+  if (mounted) {
+    return children;
+  }
+  const placeholderStyle = { width, height, ...style };
+  return <div ref={ref} className={className} style={placeholderStyle} />;
+};
+"""
+
+_CHART_COMPONENT = """
+const CHART_COLORS = ['#156082', '#e97132', '#196b24', '#0f9ed5', '#a02b93', '#4ea72e'];
+
+// Radius of the largest bubble of a series
+const CHART_BUBBLE_RADIUS = 20;
+
+/**
+ * SyncfusionChart - Draws a converted chart as SVG from its columnar data,
+ * given inline (data) or as a JSON module imported on first render (load).
+ */
+const SyncfusionChart = ({ width, height, data, load }) => {
+  const [chart, setChart] = React.useState(data || null);
+  React.useEffect(() => {
+    if (chart || !load) {
+      return undefined;
+    }
+    let active = true;
+    load().then((module) => {
+      if (active) {
+        setChart(module.default || module);
+      }
+    });
+    return () => {
+      active = false;
+    };
+  }, [chart, load]);
+  if (!chart) {
+    return null;
+  }
+  const { title, categories = [], series = [], count: slots, xDomain } = chart;
+  const top = title ? 28 : 10;
+  const left = 44;
+  const plotWidth = Math.max(width - left - 10, 1);
+  const plotHeight = Math.max(height - top - 10, 1);
+  let min = 0;
+  let max = 0;
+  series.forEach((serie) => serie.values.forEach((value) => {
+    if (value !== null) {
+      min = Math.min(min, value);
+      max = Math.max(max, value);
+    }
+  }));
+  if (max === min) {
+    max = min + 1;
+  }
+  const y = (value) => top + plotHeight - ((value - min) / (max - min)) * plotHeight;
+  // Numeric categories (scatter charts) are an x axis; others are evenly
+  // spaced slots. Downsampled series carry the slot (index) and x of each value.
+  const [xMin, xMax] = xDomain || [0, 0];
+  const count = slots || series.reduce((longest, serie) => Math.max(longest, serie.values.length), 1);
+  const step = plotWidth / count;
+  const x = (serie, index) => {
+    const slot = serie.index ? serie.index[index] : index;
+    if (xMax > xMin && serie.kind !== 'bar') {
+      const value = serie.x ? serie.x[index] : categories[slot];
+      return left + ((value - xMin) / (xMax - xMin)) * plotWidth;
+    }
+    return left + step * (slot + 0.5);
+  };
+  const bars = series.filter((serie) => serie.kind === 'bar');
+  const barWidth = (step * 0.8) / Math.max(bars.length, 1);
+  const marks = series.map((serie, seriesIndex) => {
+    const color = CHART_COLORS[seriesIndex % CHART_COLORS.length];
+    const key = `series-${seriesIndex}`;
+    if (serie.kind === 'pie') {
+      const total = serie.values.reduce((sum, value) => sum + Math.max(value || 0, 0), 0) || 1;
+      const radius = Math.min(plotWidth, plotHeight) / 2;
+      const cx = left + plotWidth / 2;
+      const cy = top + plotHeight / 2;
+      let angle = -Math.PI / 2;
+      return (
+        <g key={key}>
+          {serie.values.map((value, index) => {
+            const sweep = (2 * Math.PI * Math.max(value || 0, 0)) / total;
+            const start = angle;
+            angle += sweep;
+            const fill = CHART_COLORS[index % CHART_COLORS.length];
+            if (sweep >= 2 * Math.PI - 1e-9) {
+              return <circle key={index} cx={cx} cy={cy} r={radius} fill={fill} />;
+            }
+            const d = `M${cx} ${cy} L${cx + radius * Math.cos(start)} ${cy + radius * Math.sin(start)} `
+              + `A${radius} ${radius} 0 ${sweep > Math.PI ? 1 : 0} 1 `
+              + `${cx + radius * Math.cos(angle)} ${cy + radius * Math.sin(angle)} Z`;
+            return <path key={index} d={d} fill={fill} />;
+          })}
+        </g>
+      );
+    }
+    if (serie.kind === 'bar') {
+      const offset = bars.indexOf(serie) * barWidth - step * 0.4;
+      return (
+        <g key={key} fill={color}>
+          {serie.values.map((value, index) => (value === null ? null : (
+            <rect key={index} x={x(serie, index) + offset} y={Math.min(y(value), y(0))}
+                  width={barWidth} height={Math.abs(y(0) - y(value))} />
+          )))}
+          {serie.labels ? (
+            <g fill="#404040" fontSize={10} textAnchor="middle">
+              {serie.values.map((value, index) => (value === null || !serie.labels[index] ? null : (
+                <text key={index} x={x(serie, index) + offset + barWidth / 2} y={Math.min(y(value), y(0)) - 4}>
+                  {serie.labels[index]}
+                </text>
+              )))}
+            </g>
+          ) : null}
+        </g>
+      );
+    }
+    const coords = [];
+    serie.values.forEach((value, index) => {
+      if (value !== null) {
+        coords.push([x(serie, index), y(value), index]);
+      }
+    });
+    // Data labels taken from cells, above each point
+    const labels = serie.labels ? (
+      <g fill="#404040" fontSize={10} textAnchor="middle">
+        {coords.map(([px, py, index]) => (serie.labels[index]
+          ? <text key={index} x={px} y={py - 6}>{serie.labels[index]}</text> : null))}
+      </g>
+    ) : null;
+    if (serie.kind === 'scatter') {
+      // Bubble areas are proportional to their sizes
+      const largest = serie.sizes ? Math.max(...serie.sizes.map((size) => Math.abs(size || 0)), 1e-9) : 0;
+      const radius = (index) => (serie.sizes
+        ? Math.max(Math.sqrt(Math.abs(serie.sizes[index] || 0) / largest) * CHART_BUBBLE_RADIUS, 1) : 3);
+      return (
+        <g key={key}>
+          <g fill={color} fillOpacity={serie.sizes ? 0.7 : 1}>
+            {coords.map(([cx, cy, index]) => <circle key={index} cx={cx} cy={cy} r={radius(index)} />)}
+          </g>
+          {labels}
+        </g>
+      );
+    }
+    const points = coords.map(([px, py]) => `${px},${py}`).join(' ');
+    if (serie.kind === 'area' && coords.length) {
+      const baseline = y(0);
+      const outline = `${coords[0][0]},${baseline} ${points} ${coords[coords.length - 1][0]},${baseline}`;
+      return (
+        <g key={key}>
+          <polygon points={outline} fill={color} fillOpacity={0.6} />
+          {labels}
+        </g>
+      );
+    }
+    return (
+      <g key={key}>
+        <polyline points={points} fill="none" stroke={color} strokeWidth={2} />
+        {labels}
+      </g>
+    );
+  });
+  const cartesian = series.some((serie) => serie.kind !== 'pie');
+  return (
+    <svg width="100%" height="100%" viewBox={`0 0 ${width} ${height}`}>
+      {title ? <text x={width / 2} y={18} textAnchor="middle" fontSize={14}>{title}</text> : null}
+      {cartesian ? (
+        <g fontSize={10} fill="#595959" stroke="#bfbfbf">
+          <line x1={left} y1={top} x2={left} y2={top + plotHeight} />
+          <line x1={left} y1={y(0)} x2={left + plotWidth} y2={y(0)} />
+          <text x={left - 4} y={top + 4} textAnchor="end" stroke="none">{Number(max.toPrecision(4))}</text>
+          <text x={left - 4} y={top + plotHeight} textAnchor="end" stroke="none">{Number(min.toPrecision(4))}</text>
+        </g>
+      ) : null}
+      {marks}
+    </svg>
+  );
+};
+"""
+
+_TABLE_COMPONENT = """
+// Rows mounted above and below the visible ones
+const TABLE_OVERSCAN_ROWS = 10;
+
+// Row and column class codes of table style cell classes
+const TABLE_ROW_CLASSES = { h: 'header', t: 'total', 1: 'band1', 2: 'band2', b: 'body' };
+const TABLE_COLUMN_CLASSES = { f: 'first', l: 'last', 1: 'band1', 2: 'band2', b: 'body' };
+
+/**
+ * SyncfusionTable - Scrollable table that mounts only the rows in view.
+ * Cells ([column, text, rowSpan, colSpan, background]) are positioned from
+ * the column widths and row heights; spanStart[row] is the first row with a
+ * merged cell reaching that row, so merged cells stay visible when their
+ * first row has scrolled out. With tableStyle, each cell gets the style's
+ * class for its row and column class codes (rowClasses, columnClasses).
+ */
+const SyncfusionTable = ({ columns, rowHeights, rows, spanStart, tableStyle, rowClasses, columnClasses }) => {
+  const ref = React.useRef(null);
+  const [view, setView] = React.useState([0, Math.min(rowHeights.length, 50)]);
+  const rowOffsets = React.useMemo(() => {
+    const offsets = [0];
+    rowHeights.forEach((height) => offsets.push(offsets[offsets.length - 1] + height));
+    return offsets;
+  }, [rowHeights]);
+  const columnOffsets = React.useMemo(() => {
+    const offsets = [0];
+    columns.forEach((width) => offsets.push(offsets[offsets.length - 1] + width));
+    return offsets;
+  }, [columns]);
+  const update = React.useCallback(() => {
+    const node = ref.current;
+    if (!node) {
+      return;
+    }
+    // Last row starting at or above y
+    const rowAt = (y) => {
+      let low = 0;
+      let high = rowHeights.length - 1;
+      while (low < high) {
+        const middle = (low + high + 1) >> 1;
+        if (rowOffsets[middle] <= y) {
+          low = middle;
+        } else {
+          high = middle - 1;
+        }
+      }
+      return low;
+    };
+    const first = Math.max(rowAt(node.scrollTop) - TABLE_OVERSCAN_ROWS, 0);
+    const last = Math.min(rowAt(node.scrollTop + node.clientHeight) + TABLE_OVERSCAN_ROWS + 1, rowHeights.length);
+    setView((current) => (current[0] === first && current[1] === last ? current : [first, last]));
+  }, [rowHeights, rowOffsets]);
+  React.useEffect(update, [update]);
+  const [first, last] = view;
+  const cells = [];
+  for (let row = spanStart ? spanStart[first] : first; row < last; row += 1) {
+    rows[row].forEach(([column, text, rowSpan = 1, columnSpan = 1, background]) => {
+      if (row + rowSpan <= first) {
+        return;
+      }
+      const style = {
+        position: 'absolute',
+        top: rowOffsets[row],
+        left: columnOffsets[column],
+        height: rowOffsets[row + rowSpan] - rowOffsets[row],
+        width: columnOffsets[column + columnSpan] - columnOffsets[column],
+        backgroundColor: background,
+      };
+      const className = tableStyle
+        ? `syncfusion-table-cell ${tableStyle}-${TABLE_ROW_CLASSES[rowClasses[row]]}-${TABLE_COLUMN_CLASSES[columnClasses[column]]}`
+        : 'syncfusion-table-cell';
+      cells.push(<div key={`${row}-${column}`} className={className} style={style}>{text}</div>);
+    });
+  }
+  const viewportStyle = { width: '100%', height: '100%', overflow: 'auto', padding: 0 };
+  const contentStyle = {
+    position: 'relative',
+    width: columnOffsets[columns.length],
+    height: rowOffsets[rowHeights.length],
+    padding: 0,
+  };
+  return (
+    <div ref={ref} className="syncfusion-table-viewport" style={viewportStyle} onScroll={update}>
+      <div style={contentStyle}>{cells}</div>
+    </div>
+  );
+};
+"""
+
+# Components written after the slides of the modules that use them, as
+# (start of their element, name, definition)
+_ON_DEMAND_COMPONENTS = (
+    (_CHART_ELEMENT, "SyncfusionChart", _CHART_COMPONENT),
+    (_TABLE_ELEMENT, "SyncfusionTable", _TABLE_COMPONENT),
+)
+
+# Table styles by class prefix, and the prefixes in rendered output
+_TABLE_STYLES = {style_class_prefix(style.value): style.value for style in BuiltInTableStyle}
+_TABLE_STYLE_CLASS = re.compile(r"\b(" + "|".join(map(re.escape, _TABLE_STYLES)) + r")\b")
+
+_TABLE_STYLE_SHEET = """
+// Table style {prefix}, added to the document once
+if (typeof document !== 'undefined' && !document.getElementById('{prefix}')) {{
+  const sheet = document.createElement('style');
+  sheet.id = '{prefix}';
+  sheet.textContent = `
+{css}
+`;
+  document.head.appendChild(sheet);
+}}
+"""
+
+PLACEHOLDER_CSS = """
+/* Placeholders of slides that are not mounted or loaded yet */
+.syncfusion-slide-placeholder {
+  margin: 0 auto 20px;
+}
+"""
+
+
+def enable_virtualization() -> None:
+    """
+    Make every following conversion mount each slide, picture and chart only
+    when it scrolls near the viewport, behind a placeholder of the same size.
+    """
+    global _virtualize
+    _virtualize = True
+
+
+def _module_header() -> str:
+    return _COMPONENT_FILE_HEADER + _LAZY_MOUNT_COMPONENT if _virtualize else _COMPONENT_FILE_HEADER
+
+
+def generated_css(placeholders: bool = False) -> str:
+    """
+    CSS for the generated components, including registered shapes and
+    enabled output modes.
+
+    Args:
+        placeholders: Include the slide placeholder rule (always included
+            with virtualization)
+    """
+    return SLIDE_CSS + registered_shape_css() + (PLACEHOLDER_CSS if placeholders or _virtualize else "")
+
+
+def _lazy_fragment(item: SlideItem, fragment: str) -> str:
+    """Wrap a picture or chart fragment in a LazyMount placeholder at the item's position."""
+    if not _virtualize or not fragment or (item.SlideItemType not in _LAZY_SLIDE_ITEM_TYPES
+                                           and item.AutoShapeType != "Picture"):
+        return fragment
+    geometry = getattr(item, '_geometry', None)
+    if geometry is not None:
+        left, top, width, height = map(format_pixels, (geometry.left, geometry.top, geometry.width, geometry.height))
+    else:
+        left, top = item.Left * 1.33333, item.Top * 1.33333
+        width, height = item.Width * 1.33333, item.Height * 1.33333
+    placeholder_style = StyleBuilder((
+        ("position", "absolute"),
+        ("left", f"{left}px"),
+        ("top", f"{top}px"),
+        ("width", f"{width}px"),
+        ("height", f"{height}px"),
+    )).serialize()
+    return f"\n    <LazyMount style={{{{ {placeholder_style} }}}}>{fragment}\n    </LazyMount>"
+
+
+def _raw_slide_size(slide_data: Any) -> Tuple[int, int]:
+    """Pixel size of a raw slide dict, as ``slide_props_for`` computes it, without validating it."""
+    width, height = DEFAULT_SLIDE_PROPS["width"], DEFAULT_SLIDE_PROPS["height"]
+    slide_size = slide_data.get("SlideSize") if isinstance(slide_data, dict) else None
+    if isinstance(slide_size, dict):
+        # Missing sides take the SlideSize schema defaults
+        width = round(slide_size.get("Width", 720.0) * 1.33333)
+        height = round(slide_size.get("Height", 540.0) * 1.33333)
+    return width, height
+
+
+# Whether conversions drop provably invisible items before rendering
+_cull_invisible = False
+
+_OPAQUE_COLOR = re.compile(r"#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6})")
+
+# Horizontal shift of shapes with indented paragraphs (.bullet-indent margin)
+_BULLET_INDENT_SHIFT = 20
+# Farthest a rendered box-shadow (2px 2px 5px) reaches outside the box
+_SHADOW_EXTENT = 7
+# .syncfusion-shape:empty min-width/min-height
+_EMPTY_SHAPE_MIN_SIZE = 20
+
+
+def enable_culling() -> None:
+    """Drop provably invisible items (see ``cull_slide_items``) in every following conversion."""
+    global _cull_invisible
+    _cull_invisible = True
+
+
+def _line_width(item: SlideItem) -> float:
+    """Border width in points."""
+    line_format = item.LineFormat
+    if isinstance(line_format, dict):
+        width = line_format.get("Width") or 0
+    else:
+        width = getattr(line_format, "Width", None) or 0
+    return width
+
+
+def _border_width(item: SlideItem) -> float:
+    geometry = getattr(item, '_geometry', None)
+    return geometry.border if geometry is not None else _line_width(item) * 1.33333
+
+
+def _has_opaque_fill(item: SlideItem) -> bool:
+    """Whether the rendered background is an opaque color (shapes without a fill get #f0f0f0)."""
+    fill_format = item.FillFormat
+    if not fill_format:
+        return True
+    if isinstance(fill_format, dict):
+        if fill_format.get("Type") not in (None, "", "Solid"):
+            return False
+        color = fill_format.get("Color") if "Color" in fill_format else "#f0f0f0"
+    else:
+        color = getattr(fill_format, "Color", None) or "#f0f0f0"
+    return isinstance(color, str) and _OPAQUE_COLOR.fullmatch(color) is not None
+
+
+def _has_indented_paragraph(item: SlideItem) -> bool:
+    text_body = item.TextBody
+    if isinstance(text_body, TextBody):
+        return any(paragraph.IndentLevelNumber for paragraph in text_body.Paragraphs)
+    if isinstance(text_body, dict):
+        return any(isinstance(paragraph, dict) and paragraph.get("IndentLevelNumber")
+                   for paragraph in text_body.get("Paragraphs") or [])
+    return False
+
+
+def _is_box_shape(item: SlideItem) -> bool:
+    """Whether the item renders as a plain rectangle through the built-in AutoShape renderers."""
+    if item.SlideItemType != "AutoShape" or _SLIDE_ITEM_SPECS.get("AutoShape").renderer is not _render_auto_shape:
+        return False
+    spec = _AUTO_SHAPE_SPECS.get(item.AutoShapeType, _DEFAULT_SHAPE_SPEC)
+    return (spec.clip_path is None and spec.renderer in (None, _render_rectangle)
+            and not any(name == "borderRadius" for name, _ in spec.styles))
+
+
+def _cull_box(index: int, item: SlideItem) -> CullBox:
+    rotation = item.Rotation or 0
+    border = _border_width(item)
+    shadow = _SHADOW_EXTENT if isinstance(item.ShadowFormat, dict) else 0
+    indented = _has_indented_paragraph(item)
+
+    geometry = getattr(item, '_geometry', None)
+    if geometry is not None:
+        # The snapped box, as rendered
+        left, top, width, height = geometry.left, geometry.top, geometry.width, geometry.height
+        x0, y0, x1, y1 = geometry.bounds
+    else:
+        left, top = (item.Left or 0) * 1.33333, (item.Top or 0) * 1.33333
+        width, height = (item.Width or 0) * 1.33333, (item.Height or 0) * 1.33333
+        x0, y0, x1, y1 = rotated_bounds(left, top, width, height, rotation)
+    # Empty shapes are grown to a minimum size by the generated CSS
+    bx0, by0, bx1, by1 = rotated_bounds(left, top, max(width, _EMPTY_SHAPE_MIN_SIZE),
+                                        max(height, _EMPTY_SHAPE_MIN_SIZE), rotation)
+    bx0, by0, bx1, by1 = min(x0, bx0), min(y0, by0), max(x1, bx1), max(y1, by1)
+    # Borders may sit outside the box without the generated CSS (box-sizing)
+    reach = 2 * border + shadow
+    bounds = (bx0 - reach, by0 - reach, bx1 + reach + (_BULLET_INDENT_SHIFT if indented else 0), by1 + reach)
+
+    occluder = None
+    if (width > 0 and height > 0 and rotation % 90 == 0 and not indented
+            and (item.Opacity is None or item.Opacity >= 100)
+            and _is_box_shape(item) and _has_opaque_fill(item)):
+        occluder = (x0, y0, x1, y1)
+
+    return CullBox(
+        key=item.ShapeId if item.ShapeId is not None else f"#{index}",
+        bounds=bounds,
+        occluder=occluder,
+        # Every item is absolutely positioned: z-index first, then document order
+        order=(item.ZIndex or 0, index),
+        degenerate=(width <= 0 or height <= 0) and not border and not shadow,
+    )
+
+
+def cull_slide_items(slide_items: Iterable[SlideItem],
+                     slide_props: Dict[str, Any] = None) -> Tuple[List[SlideItem], CullReport]:
+    """
+    Drop slide items that cannot be seen in the rendered slide.
+
+    Removes zero-size items without a border or shadow (which the generated
+    CSS would otherwise show as minimum-size placeholder boxes), items entirely
+    outside the slide (the slide container clips its content), and items
+    entirely covered by an opaque, unrotated (or quarter-turned) rectangle
+    painted above them. Occluders are AutoShapes rendered as plain boxes with
+    a solid hex or default fill and full opacity; rotation, borders, shadows
+    and bullet indentation widen the area an item may paint. Relies on the
+    generated CSS clipping shape content (``overflow: hidden``).
+
+    Args:
+        slide_items: Slide items, in document order
+        slide_props: Optional slide properties (width, height in pixels)
+
+    Returns:
+        Tuple[List[SlideItem], CullReport]: Remaining items in order, and what
+        was culled
+    """
+    slide_items = _with_geometry(list(slide_items))
+    slide_props = slide_props or DEFAULT_SLIDE_PROPS
+    boxes = []
+    candidates = []
+    for index, item in enumerate(slide_items):
+        # Circular reference placeholders render nothing and hide nothing
+        if item.Info and "Circular reference detected" in item.Info:
+            continue
+        boxes.append(_cull_box(index, item))
+        candidates.append(index)
+    culled, report = cull(boxes, slide_props["width"], slide_props["height"])
+    report.total = len(slide_items)
+    dropped = {candidates[box_index] for box_index in culled}
+    return [item for index, item in enumerate(slide_items) if index not in dropped], report
+
+
+def _culled(slide_items: Iterable[SlideItem], slide_props: Dict[str, Any] = None,
+            label: str = "") -> Iterable[SlideItem]:
+    """Apply ``cull_slide_items`` if culling is enabled, printing what was dropped."""
+    if not _cull_invisible:
+        return slide_items
+    slide_items, report = cull_slide_items(slide_items, slide_props)
+    if report.culled:
+        # Flushed per line so reports from pool workers do not interleave
+        print(f"{label}: {report.summary()}" if label else report.summary(), flush=True)
+    return slide_items
+
+
+# Whether text-free polygonal AutoShapes are drawn as paths in shared <svg> elements
+_svg_shapes = False
+
+# Dash patterns, in multiples of the stroke width, for border styles
+_STROKE_DASHES = {"dashed": (3, 2), "dash": (3, 2), "dotted": (1, 1), "dot": (1, 1)}
+
+
+def enable_svg_shapes() -> None:
+    """
+    Draw text-free polygonal AutoShapes (arrows, diamonds, triangles, ...)
+    of every following conversion as SVG paths, one ``<svg>`` per run of
+    such shapes in paint order, instead of one clipped ``<div>`` each.
+    """
+    global _svg_shapes
+    _svg_shapes = True
+
+
+def _has_text(item: SlideItem) -> bool:
+    text_body = item.TextBody
+    if isinstance(text_body, TextBody):
+        return any(paragraph.Text.strip() for paragraph in text_body.Paragraphs)
+    if isinstance(text_body, dict):
+        return any(isinstance(paragraph, dict) and str(paragraph.get("Text", "")).strip()
+                   for paragraph in text_body.get("Paragraphs") or [])
+    return False
+
+
+def _vector_shape_spec(item: SlideItem) -> Optional[ShapeSpec]:
+    """The item's ShapeSpec if it can be drawn as an SVG path, else None."""
+    if item.SlideItemType != "AutoShape" or _SLIDE_ITEM_SPECS.get("AutoShape").renderer is not _render_auto_shape:
+        return None
+    if item.Info and "Circular reference detected" in item.Info:
+        return None
+    spec = _AUTO_SHAPE_SPECS.get(item.AutoShapeType)
+    if spec is None or not spec.clip_path or spec.renderer is not None or _has_text(item):
+        return None
+    fill_format = item.FillFormat
+    if isinstance(fill_format, dict) and fill_format.get("Type") not in (None, "", "Solid"):
+        # Gradient and picture fills stay with the CSS renderer
+        return None
+    return spec
+
+
+def _svg_path_element(item: SlideItem, spec: ShapeSpec) -> str:
+    """One ``<path>`` with the item's outline, fill, border, rotation and opacity."""
+    left, top, width, height = _pixel_box(item)
+    fill_format = item.FillFormat
+    if isinstance(fill_format, dict):
+        fill = fill_format.get("Color")
+    else:
+        fill = getattr(fill_format, "Color", None)
+    attrs = [
+        f'id="shape_{item.ShapeId}"',
+        f'd="{polygon_path(unit_polygon(spec.clip_path), left, top, width, height)}"',
+        f'fill="{fill or spec.default_background or "#f0f0f0"}"',
+    ]
+
+    line_format = item.LineFormat
+    if isinstance(line_format, dict):
+        line_color, line_style = line_format.get("Color"), line_format.get("Style")
+    else:
+        line_color, line_style = getattr(line_format, "Color", None), getattr(line_format, "Style", None)
+    stroke_width = _border_width(item)
+    if line_color and stroke_width:
+        attrs.append(f'stroke="{line_color}" strokeWidth="{format_coordinate(stroke_width)}"')
+        dash = _STROKE_DASHES.get(line_style.lower() if isinstance(line_style, str) else None)
+        if dash:
+            attrs.append(f'strokeDasharray="{format_coordinate(dash[0] * stroke_width)} '
+                         f'{format_coordinate(dash[1] * stroke_width)}"')
+
+    if item.Rotation:
+        attrs.append(f'transform="rotate({format_coordinate(item.Rotation)} '
+                     f'{format_coordinate(left + width / 2)} {format_coordinate(top + height / 2)})"')
+    if item.Opacity is not None and item.Opacity != 100:
+        attrs.append(f'opacity="{item.Opacity / 100}"')
+    attrs.append(f'data-shape-type="{item.AutoShapeType}"')
+    # The <svg> ignores the pointer so shapes below stay reachable; paths do not
+    attrs.append('pointerEvents="visiblePainted"')
+    return f"      <path {' '.join(attrs)} />"
+
+
+def _svg_group_fragment(items: List[SlideItem], specs: List[ShapeSpec], slide_props: Dict[str, Any]) -> str:
+    """A slide-sized ``<svg>`` drawing the given shapes, stacked where the first one is."""
+    style = StyleBuilder((
+        ("position", "absolute"),
+        ("left", "0px"),
+        ("top", "0px"),
+        ("overflow", "visible"),
+        ("pointerEvents", "none"),
+    ))
+    if items[0].ZIndex is not None:
+        style.set("zIndex", items[0].ZIndex)
+    paths = "\n".join(_svg_path_element(item, spec) for item, spec in zip(items, specs))
+    return f"""
+    <svg
+      className="syncfusion-vector-shapes"
+      width="{slide_props['width']}"
+      height="{slide_props['height']}"
+      style={{{{ {style.serialize()} }}}}
+    >
+{paths}
+    </svg>"""
+
+
+def render_slide_fragments(slide_items: Iterable[SlideItem], slide_props: Dict[str, Any] = None) -> Iterator[str]:
+    """
+    Render the items of one slide to JSX fragments, in document order.
+
+    Same as ``render_item_fragments`` unless SVG shapes are enabled. Then
+    the items are sorted by paint order (ZIndex, then document order), and
+    every run of consecutive text-free polygonal shapes becomes one
+    ``<svg>``, emitted in place of the run's first shape and given its
+    ZIndex. Nothing else is painted between the members of a run, so the
+    stacking of the slide is unchanged.
+
+    Args:
+        slide_items: Slide items, in document order
+        slide_props: Optional slide properties (width, height in pixels)
+
+    Returns:
+        Iterator[str]: One fragment per item or SVG group
+    """
+    if not _svg_shapes:
+        yield from render_item_fragments(slide_items)
+        return
+    slide_items = _with_geometry(list(slide_items))
+    slide_props = slide_props or DEFAULT_SLIDE_PROPS
+    specs = [_vector_shape_spec(item) for item in slide_items]
+
+    # Runs of vector shapes in paint order, keyed by their first member
+    groups: Dict[int, List[int]] = {}
+    run: List[int] = []
+    paint_order = sorted(range(len(slide_items)), key=lambda index: (slide_items[index].ZIndex or 0, index))
+    for index in paint_order + [None]:
+        if index is not None and specs[index] is not None:
+            run.append(index)
+        elif run:
+            groups[run[0]] = run
+            run = []
+    grouped = {index for run in groups.values() for index in run}
+
+    other_fragments = render_item_fragments(
+        item for index, item in enumerate(slide_items) if index not in grouped
+    )
+    for index in range(len(slide_items)):
+        if index in groups:
+            members = groups[index]
+            yield _svg_group_fragment([slide_items[member] for member in members],
+                                      [specs[member] for member in members], slide_props)
+        elif index not in grouped:
+            yield next(other_fragments)
+
+
+def render_slide_component(slide_items: Iterable[SlideItem], slide_props: Dict[str, Any] = None,
+                           component_name: str = "SyncfusionSlide") -> str:
+    """
+    Render the named React component for a single slide.
+    
+    Args:
+        slide_items: Slide items, either a list or a lazy iterator
+        slide_props: Optional slide properties (width, height, background, etc.)
+        component_name: Name of the exported component
+        
+    Returns:
+        str: Component definition without imports or default export
+    """
+    # Generate components for each slide item
+    return _slide_component_from_fragments(render_slide_fragments(slide_items, slide_props), slide_props,
+                                           component_name)
+
+
+def _slide_component_from_fragments(fragments: Iterable[str], slide_props: Dict[str, Any] = None,
+                                    component_name: str = "SyncfusionSlide") -> str:
+    """Assemble already rendered item fragments into a slide component."""
+    buffer = io.StringIO()
+    write_slide_component(buffer, fragments, slide_props, component_name)
+    return buffer.getvalue()
+
+
+def write_slide_component(sink: TextIO, fragments: Iterable[str], slide_props: Dict[str, Any] = None,
+                          component_name: str = "SyncfusionSlide") -> None:
+    """
+    Write a slide component to a text sink, one fragment at a time.
+    
+    Args:
+        sink: Writable text stream (file, socket file, ``io.StringIO``)
+        fragments: Rendered item fragments, typically a lazy iterator
+        slide_props: Optional slide properties (width, height, background, etc.)
+        component_name: Name of the exported component
+    """
+    if not slide_props:
+        slide_props = DEFAULT_SLIDE_PROPS
+    
+    sink.write(f"""/**
+ * {component_name} - A React component that renders a PowerPoint slide
+ * converted from Syncfusion JSON format.
+ * 
+ * The component preserves the visual properties of the PowerPoint elements including:
+ * - Position (Left, Top, Width, Height)
+ * - Formatting (Fill, LineFormat)
+ * - Text content with formatting
+ * - Rotation
+ * - Shape types
+ */
+export const {component_name} = () => {{
+  return (
+    <div 
+      className="syncfusion-slide"
+      style={{{{
+        position: 'relative',
+        width: '{slide_props['width']}px',
+        height: '{slide_props['height']}px',
+        backgroundColor: '{slide_props['background']}',
+        overflow: 'hidden',
+        boxSizing: 'border-box',
+        fontFamily: 'Arial, sans-serif'
+      }}}}
+    >
+""")
+    
+    # Fragments are newline-separated; skipped items render as empty strings
+    separator = ""
+    for fragment in fragments:
+        if fragment:
+            sink.write(separator)
+            sink.write(fragment)
+            separator = "\n"
+    
+    sink.write("""
+    </div>
+  );
+};
+""")
+
+
+def convert_json_to_react(slide_items: Iterable[SlideItem], slide_props: Dict[str, Any] = None) -> str:
+    """
+    Convert Syncfusion PowerPoint JSON to React components.
+    
+    Args:
+        slide_items: Slide items, either a list or a lazy iterator
+        slide_props: Optional slide properties (width, height, background, etc.)
+        
+    Returns:
+        str: Complete React component code
+    """
+    buffer = io.StringIO()
+    write_react_component(buffer, slide_items, slide_props)
+    return buffer.getvalue()
+
+
+def write_react_component(sink: TextIO, slide_items: Iterable[SlideItem],
+                          slide_props: Dict[str, Any] = None, style_pool: Optional[StylePool] = None) -> None:
+    """
+    Convert slide items and write the module to a text sink as it is rendered.
+    
+    Each item is rendered and written before the next one is read, so with a
+    lazy item iterator memory stays bounded and the caller can forward output
+    while later items are still being converted.
+    
+    Args:
+        sink: Writable text stream (file, socket file, ``io.StringIO``)
+        slide_items: Slide items, either a list or a lazy iterator
+        slide_props: Optional slide properties (width, height, background, etc.)
+        style_pool: Shares repeated inline styles across the module
+    """
+    _write_single_slide_module(sink, render_slide_fragments(slide_items, slide_props), slide_props,
+                               style_pool=style_pool)
+
+
+def _write_single_slide_module(sink: TextIO, fragments: Iterable[str], slide_props: Dict[str, Any] = None,
+                               component_name: str = "SyncfusionSlide",
+                               style_pool: Optional[StylePool] = None) -> None:
+    """Write a single slide component and its imports and default export."""
+    # Create the React component file with proper CSS imports and styling
+    sink.write(_module_header())
+    sink.write("\n")
+    if style_pool is not None:
+        fragments = style_pool.rewrite_all(fragments)
+    components = set()
+    write_slide_component(sink, _noting_components(fragments, components), slide_props, component_name)
+    sink.write("\n")
+    _write_module_footer(sink, component_name, style_pool, components)
+
+
+def _used_components(text: str) -> List[str]:
+    """
+    Names of the on-demand components that rendered output uses, followed by
+    the class prefixes of the table styles it uses.
+    """
+    names = [name for element, name, _ in _ON_DEMAND_COMPONENTS if element in text]
+    if TABLE_STYLE_PREFIX in text:
+        names += sorted(set(_TABLE_STYLE_CLASS.findall(text)))
+    return names
+
+
+def _table_style_sheets(names: Iterable[str]) -> List[str]:
+    """Code adding the style sheet of each used table style to the document."""
+    return [_TABLE_STYLE_SHEET.format(prefix=prefix, css=style_sheet(_TABLE_STYLES[prefix]))
+            for prefix in sorted(name for name in names if name in _TABLE_STYLES)
+            if style_sheet(_TABLE_STYLES[prefix])]
+
+
+def _noting_components(fragments: Iterable[str], found: Set[str]) -> Iterator[str]:
+    """Pass fragments through, adding the on-demand components and table styles they use to ``found``."""
+    for fragment in fragments:
+        found.update(_used_components(fragment))
+        yield fragment
+
+
+def _write_module_footer(sink: TextIO, component_name: str, style_pool: Optional[StylePool],
+                         components: Iterable[str] = ()) -> None:
+    # Shared style constants and on-demand components are only read at render
+    # time, so they can follow the components that use them
+    if style_pool is not None and style_pool.const_declarations():
+        sink.write(style_pool.const_declarations())
+        sink.write("\n")
+    for _, name, definition in _ON_DEMAND_COMPONENTS:
+        if name in components:
+            sink.write(definition)
+            sink.write("\n")
+    for sheet in _table_style_sheets(components):
+        sink.write(sheet)
+        sink.write("\n")
+    sink.write(_COMPONENT_FILE_FOOTER.format(component_name=component_name))
+
+
+def _single_slide_module(slide_component: str, component_name: str = "SyncfusionSlide") -> str:
+    """Wrap a single slide component into a complete module."""
+    components = _used_components(slide_component)
+    definitions = [definition for _, name, definition in _ON_DEMAND_COMPONENTS if name in components]
+    return "\n".join([
+        _module_header(),
+        slide_component,
+        *definitions,
+        *_table_style_sheets(components),
+        _COMPONENT_FILE_FOOTER.format(component_name=component_name),
+    ])
+
+
+class IncrementalSlideConverter:
+    """
+    Re-converts a slide while reusing the fragments of unchanged items.
     
-    parser = argparse.ArgumentParser(description='Convert Syncfusion PowerPoint JSON to React components')
-    parser.add_argument('--input', '-i', type=str, help='Input JSON file path', required=True)
-    parser.add_argument('--output', '-o', type=str, help='Output React component file path', required=True)
-    parser.add_argument('--css', '-c', type=str, help='Output CSS file path', default=None)
+    The previous parse is kept in memory keyed by ``ShapeId`` (items without
+    one are keyed by position). On each update only items that are new or
+    whose validated content differs are rendered; all other fragments are
+    spliced in from the previous run.
     
-    args = parser.parse_args()
+    Args:
+        slide_props: Optional slide properties (width, height, background, etc.)
+    """
     
-    # Load JSON data
-    slide_items = load_json(args.input)
+    def __init__(self, slide_props: Dict[str, Any] = None):
+        self.slide_props = slide_props
+        self.rendered = 0
+        self.total = 0
+        self._items: Dict[Tuple[Any, int], SlideItem] = {}
+        self._fragments: Dict[Tuple[Any, int], str] = {}
     
-    if not slide_items:
-        print(f"Error: No valid slide items found in {args.input}")
-        sys.exit(1)
+    def update(self, slide_items: Iterable[SlideItem]) -> str:
+        """
+        Convert the new item list, rendering only added or changed items.
         
-    # Convert to React
-    react_component = convert_json_to_react(slide_items)
+        Args:
+            slide_items: The complete, freshly parsed slide items
+            
+        Returns:
+            str: Complete React component code
+        """
+        keys = []
+        items = {}
+        changed = []
+        occurrences = {}
+        for index, item in enumerate(slide_items):
+            shape_key = item.ShapeId if item.ShapeId is not None else f"#{index}"
+            # Duplicate ShapeIds are told apart by their occurrence count
+            occurrence = occurrences.get(shape_key, 0)
+            occurrences[shape_key] = occurrence + 1
+            key = (shape_key, occurrence)
+            keys.append(key)
+            previous = self._items.get(key)
+            if previous is not None and previous == item:
+                items[key] = previous
+            else:
+                items[key] = item
+                changed.append(key)
+        
+        changed_set = set(changed)
+        fragments = {key: self._fragments[key] for key in keys if key not in changed_set}
+        for key, fragment in zip(changed, render_item_fragments(items[key] for key in changed)):
+            fragments[key] = fragment
+        
+        self._items = items
+        self._fragments = fragments
+        self.rendered = len(changed)
+        self.total = len(keys)
+        return _single_slide_module(
+            _slide_component_from_fragments((fragments[key] for key in keys), self.slide_props)
+        )
+
+
+def watch_and_convert(input_path: str, output_path: str, interval: float = 0.5) -> None:
+    """
+    Convert ``input_path`` whenever it changes, until interrupted.
     
-    # Write to output file
+    Each save is re-parsed in full, but only items whose ShapeId is new or
+    whose content changed are re-rendered, and the output is replaced
+    atomically so previews never read a half-written file.
+    
+    Args:
+        input_path: Syncfusion JSON file to watch
+        output_path: React component file to keep up to date
+        interval: Polling interval in seconds
+    """
+    converter = IncrementalSlideConverter()
+    last_signature = None
+    print(f"Watching {input_path} for changes (Ctrl+C to stop)")
     try:
-        with open(args.output, 'w', encoding='utf-8') as f:
-            f.write(react_component)
-        print(f"Successfully converted {args.input} to {args.output}")
+        while True:
+            try:
+                stat = os.stat(input_path)
+                signature = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                signature = None
+            if signature is not None and signature != last_signature:
+                last_signature = signature
+                start = time.perf_counter()
+                slide_items = load_json(input_path)
+                if slide_items:
+                    _write_atomic(output_path, converter.update(slide_items))
+                    if _asset_store is not None:
+                        _asset_store.write_manifest()
+                    elapsed_ms = (time.perf_counter() - start) * 1000
+                    print(f"Updated {output_path}: re-rendered {converter.rendered} of "
+                          f"{converter.total} items in {elapsed_ms:.1f} ms")
+                else:
+                    print(f"Error: No valid slide items found in {input_path}")
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("Stopped watching")
+
+
+def _schema_color(color: Any) -> Optional[str]:
+    """Return a CSS color for a schema ``Color`` model or color string."""
+    if color is None or isinstance(color, str):
+        return color
+    if color.R is None or color.G is None or color.B is None:
+        return None
+    return f"#{color.R:02x}{color.G:02x}{color.B:02x}"
+
+
+def _schema_fill_color(fill: Any) -> Optional[str]:
+    """Return the solid color of a schema ``Fill``, if any."""
+    if fill is None or fill.FillType != "Solid" or fill.SolidFill is None:
+        return None
+    return _schema_color(fill.SolidFill.Color)
+
+
+def slide_to_items(slide: Slide, first_shape_id: int = 1) -> List[SlideItem]:
+    """
+    Map the shapes, pictures, tables and charts of a schema ``Slide`` onto
+    the flat ``SlideItem`` model used by the renderer.
+    
+    Args:
+        slide: Validated slide from ``syncfusion.schemas``
+        first_shape_id: ShapeId given to the first item, so ids stay unique
+            across the slides of a presentation
         
-        # Generate CSS file if specified
-        if args.css:
-            css_content = """/* Main slide container */
+    Returns:
+        List[SlideItem]: Slide items in Shapes, Pictures, Tables, Charts order
+    """
+    sources = []
+    for shape in slide.Shapes or []:
+        data = {"SlideItemType": "AutoShape", "AutoShapeType": shape.AutoShapeType.value,
+                "Rotation": shape.Rotation or 0}
+        fill_color = _schema_fill_color(shape.Fill)
+        if fill_color:
+            data["FillFormat"] = {"Color": fill_color}
+        if shape.TextBody:
+            data["TextBody"] = shape.TextBody.model_dump(exclude_none=True, mode='json')
+        sources.append((shape, data))
+    for picture in slide.Pictures or []:
+        image_data = {"Base64": picture.ImageData}
+        if picture.FallbackImageData:
+            image_data["FallbackBase64"] = picture.FallbackImageData
+        sources.append((picture, {"SlideItemType": "Picture", "ImageData": image_data}))
+    for table in slide.Tables or []:
+        data = {"SlideItemType": "Table", "Rows": table.Rows}
+        if table.BuiltInStyle is not None:
+            data["BuiltInStyle"] = table.BuiltInStyle.value
+        for flag in ("HasHeaderRow", "HasTotalRow", "HasFirstColumn", "HasLastColumn", "HasBandedRows",
+                     "HasBandedColumns"):
+            if getattr(table, flag):
+                data[flag] = True
+        sources.append((table, data))
+    for chart in slide.Charts or []:
+        # Series stay models; the chart renderer accepts them without revalidation
+        sources.append((chart, {"SlideItemType": "Chart", "ChartData": chart.ChartData,
+                                "Series": chart.Series, "ChartTitle": chart.ChartTitle}))
+    
+    slide_items = []
+    for shape_id, (source, data) in enumerate(sources, start=first_shape_id):
+        if getattr(source, "Hidden", None):
+            continue
+        line_format = getattr(source, "LineFormat", None)
+        if line_format is not None and line_format.Weight:
+            data["LineFormat"] = {"Color": _schema_fill_color(line_format.Fill) or "black",
+                                  "Width": line_format.Weight, "Style": "solid"}
+        data.update(ShapeId=shape_id, Left=source.Left, Top=source.Top,
+                    Width=source.Width, Height=source.Height)
+        slide_items.append(SlideItem(**data))
+    return slide_items
+
+
+def slide_props_for(slide: Slide) -> Dict[str, Any]:
+    """Build renderer slide properties from a slide's size and background."""
+    slide_props = dict(DEFAULT_SLIDE_PROPS)
+    if slide.SlideSize:
+        slide_props["width"] = round(slide.SlideSize.Width * 1.33333)
+        slide_props["height"] = round(slide.SlideSize.Height * 1.33333)
+    if slide.Background:
+        slide_props["background"] = _schema_fill_color(slide.Background.Fill) or slide_props["background"]
+    return slide_props
+
+
+def _slide_shape_count(slide_data: Any) -> int:
+    if not isinstance(slide_data, dict):
+        return 0
+    return sum(len(slide_data.get(key) or []) for key in ("Shapes", "Pictures", "Tables", "Charts"))
+
+
+def _render_presentation_slide(task) -> Tuple[str, Tuple[int, int]]:
+    """
+    Validate and render one raw slide dict. Runs inside pool workers, so it
+    only takes and returns picklable values.
+
+    Returns:
+        Tuple of the slide component and the font style cache hits and misses
+        it caused
+    """
+    slide_number, first_shape_id, slide_data = task
+    component_name = f"Slide{slide_number}"
+    font_stats = font_style_cache_stats()
+    try:
+        slide = Slide.model_validate(slide_data)
+        slide_props = slide_props_for(slide)
+        slide_items = _culled(slide_to_items(slide, first_shape_id), slide_props, component_name)
+        slide_component = render_slide_component(slide_items, slide_props, component_name)
+    except Exception as e:
+        print(f"Error converting slide {slide_number}: {e}")
+        slide_component = render_slide_component([], None, component_name)
+    return slide_component, _font_style_cache_delta(font_stats)
+
+
+def convert_presentation_to_react(presentation_data: Dict[str, Any], max_workers: Optional[int] = None) -> str:
+    """
+    Convert a Syncfusion ``Presentation`` into one React component per slide.
+    
+    Args:
+        presentation_data: Decoded Presentation JSON (a dict with ``Slides``)
+        max_workers: Worker process count; defaults to the number of CPUs,
+            and 1 renders in the current process
+        
+    Returns:
+        str: Complete React component code
+    """
+    buffer = io.StringIO()
+    write_presentation(buffer, presentation_data, max_workers)
+    return buffer.getvalue()
+
+
+def _slide_components_only(results: Iterable[Tuple[str, Tuple[int, int]]], from_workers: bool) -> Iterator[str]:
+    for slide_component, font_stats in results:
+        if from_workers:
+            # Rendered in-process results are already in the local counters
+            _record_worker_font_style_stats(font_stats)
+        yield slide_component
+
+
+def _presentation_tasks(presentation_data: Dict[str, Any]) -> List[Tuple[int, int, Any]]:
+    """(slide number, first ShapeId, raw slide dict) for every slide, in order."""
+    slides_data = presentation_data.get("Slides") or []
+    first_slide_number = presentation_data.get("FirstSlideNumber") or 1
+    
+    tasks = []
+    next_shape_id = 1
+    for offset, slide_data in enumerate(slides_data):
+        tasks.append((first_slide_number + offset, next_shape_id, slide_data))
+        next_shape_id += _slide_shape_count(slide_data)
+    return tasks
+
+
+def _iter_slide_components(tasks: List[Tuple[int, int, Any]], max_workers: Optional[int] = None) -> Iterator[str]:
+    """
+    Render presentation slides in a process pool (or in-process for one
+    worker or slide) and yield the components in slide order.
+    """
+    if max_workers == 1 or len(tasks) <= 1:
+        slide_components = map(_render_presentation_slide, tasks)
+        executor = None
+    else:
+        max_workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(tasks) // (max_workers * 4))
+        executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                       initargs=(_worker_settings(),))
+        # map() yields results in submission order, i.e. slide order
+        slide_components = executor.map(_render_presentation_slide, tasks, chunksize=chunksize)
+    with executor or contextlib.nullcontext():
+        yield from _slide_components_only(slide_components, from_workers=executor is not None)
+
+
+def write_presentation(sink: TextIO, presentation_data: Dict[str, Any], max_workers: Optional[int] = None,
+                       style_pool: Optional[StylePool] = None) -> None:
+    """
+    Convert a Syncfusion ``Presentation`` and write it to a text sink.
+    
+    Slides are validated and rendered independently in a process pool and
+    written in slide order as soon as each one (and every slide before it) is
+    done, followed by a ``SyncfusionPresentation`` component that stacks them.
+    
+    Args:
+        sink: Writable text stream (file, socket file, ``io.StringIO``)
+        presentation_data: Decoded Presentation JSON (a dict with ``Slides``)
+        max_workers: Worker process count; defaults to the number of CPUs,
+            and 1 renders in the current process
+        style_pool: Shares repeated inline styles across every slide
+    """
+    tasks = _presentation_tasks(presentation_data)
+    
+    sink.write(_module_header())
+    slide_components = _iter_slide_components(tasks, max_workers)
+    if style_pool is not None:
+        slide_components = style_pool.rewrite_all(slide_components)
+    components = set()
+    for slide_component in _noting_components(slide_components, components):
+        sink.write("\n")
+        sink.write(slide_component)
+    
+    slide_lines = []
+    for slide_number, _, slide_data in tasks:
+        if _virtualize:
+            # Placeholders keep the scroll height of unmounted slides
+            width, height = _raw_slide_size(slide_data)
+            slide_lines.append(f'      <LazyMount className="syncfusion-slide-placeholder" '
+                               f'width={{{width}}} height={{{height}}}><Slide{slide_number} /></LazyMount>')
+        else:
+            slide_lines.append(f"      <Slide{slide_number} />")
+    slide_elements = "\n".join(slide_lines)
+    sink.write(f"""
+/**
+ * SyncfusionPresentation - Renders every slide of the presentation in order.
+ */
+export const SyncfusionPresentation = () => {{
+  return (
+    <div className="syncfusion-presentation">
+{slide_elements}
+    </div>
+  );
+}};
+""")
+    sink.write("\n")
+    _write_module_footer(sink, "SyncfusionPresentation", style_pool, components)
+
+
+# Module names of split output, besides one SlideN module per slide
+_SPLIT_INDEX_MODULE = "index"
+_SPLIT_SHARED_MODULE = "shared"
+
+
+def _split_index_module(tasks: List[Tuple[int, int, Any]], prefetch: int) -> str:
+    """Index module that loads every slide module with React.lazy."""
+    loaders = "\n".join(f"  () => import('./Slide{slide_number}')," for slide_number, _, _ in tasks)
+    sizes = ", ".join(f"[{width}, {height}]" for width, height in (_raw_slide_size(data) for _, _, data in tasks))
+    if _virtualize:
+        # The chunk of a slide is only requested once its placeholder nears the viewport
+        slide_element = """<LazyMount key={index} className="syncfusion-slide-placeholder"
+                   width={slideSizes[index][0]} height={slideSizes[index][1]}>
+          <LazySlide index={index} />
+        </LazyMount>"""
+        shared_import = f"import {{ LazyMount }} from './{_SPLIT_SHARED_MODULE}';\n"
+    else:
+        slide_element = "<LazySlide key={index} index={index} />"
+        shared_import = ""
+    return f"""import React from 'react';
+import './SyncfusionSlide.css';
+{shared_import}
+// One chunk per slide, requested on first render
+const slideLoaders = [
+{loaders}
+];
+const slides = slideLoaders.map((load) => React.lazy(load));
+const slideSizes = [{sizes}];
+
+// Slides requested ahead of the one being rendered
+const PREFETCH_AHEAD = {prefetch};
+
+export const prefetchSlides = (index, count = PREFETCH_AHEAD) => {{
+  slideLoaders.slice(index + 1, index + 1 + count).forEach((load) => load());
+}};
+
+/**
+ * LazySlide - Loads one slide's chunk, showing a placeholder of the slide's
+ * size meanwhile, and prefetches the chunks of the following slides.
+ */
+export const LazySlide = ({{ index }}) => {{
+  const Slide = slides[index];
+  const [width, height] = slideSizes[index];
+  React.useEffect(() => {{
+    prefetchSlides(index);
+  }}, [index]);
+  const placeholderStyle = {{ width, height }};
+  return (
+    <React.Suspense fallback={{<div className="syncfusion-slide-placeholder" style={{placeholderStyle}} />}}>
+      <Slide />
+    </React.Suspense>
+  );
+}};
+
+/**
+ * SyncfusionPresentation - Renders every slide of the presentation in order.
+ */
+export const SyncfusionPresentation = () => {{
+  return (
+    <div className="syncfusion-presentation">
+      {{slides.map((_, index) => (
+        {slide_element}
+      ))}}
+    </div>
+  );
+}};
+
+export default SyncfusionPresentation;
+"""
+
+
+def write_split_presentation(output_dir: str, presentation_data: Dict[str, Any], max_workers: Optional[int] = None,
+                             style_pool: Optional[StylePool] = None, prefetch: int = 2) -> List[str]:
+    """
+    Convert a Syncfusion ``Presentation`` into one module per slide, so
+    bundlers can split them into separate chunks.
+
+    Writes ``SlideN.jsx`` for every slide, a ``shared.jsx`` module with what
+    the slides have in common (shared style constants, the chart and table
+    components and, with virtualization, the LazyMount component), and an ``index.jsx`` module
+    whose ``SyncfusionPresentation`` loads each slide with ``React.lazy`` and
+    dynamic ``import()`` and prefetches the next ``prefetch`` slides. Images
+    go to the common asset directory when an asset store is enabled.
+
+    Args:
+        output_dir: Directory for the modules, created if missing
+        presentation_data: Decoded Presentation JSON (a dict with ``Slides``)
+        max_workers: Worker process count; defaults to the number of CPUs,
+            and 1 renders in the current process
+        style_pool: Shares repeated inline styles across every slide module
+        prefetch: Number of following slides requested when a slide renders
+
+    Returns:
+        List[str]: Paths of the written modules
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    tasks = _presentation_tasks(presentation_data)
+    written = []
+
+    slide_components = _iter_slide_components(tasks, max_workers)
+    components = set()
+    for (slide_number, _, _), slide_component in zip(tasks, _noting_components(slide_components, components)):
+        if style_pool is not None:
+            slide_component = style_pool.rewrite(slide_component)
+        # Each module imports only the shared values it uses
+        used = _used_components(slide_component)
+        shared_names = [name for name in used if name not in _TABLE_STYLES] + StylePool.referenced_consts(slide_component)
+        if "<LazyMount" in slide_component:
+            shared_names.insert(0, "LazyMount")
+        shared_import = (f"import {{ {', '.join(shared_names)} }} from './{_SPLIT_SHARED_MODULE}';\n"
+                         if shared_names else "")
+        component_name = f"Slide{slide_number}"
+        path = os.path.join(output_dir, f"{component_name}.jsx")
+        # Table style sheets are added by the slides that use them
+        sheets = "".join(sheet + "\n" for sheet in _table_style_sheets(used))
+        _write_atomic(path, "".join([
+            "import React from 'react';\n",
+            shared_import,
+            "\n",
+            slide_component,
+            "\n",
+            sheets,
+            _COMPONENT_FILE_FOOTER.format(component_name=component_name),
+        ]))
+        written.append(path)
+
+    # Written after the slides, once every shared style is known
+    shared_parts = ["// Shared by the slide modules of the presentation\n"]
+    if _virtualize or components:
+        shared_parts.insert(0, "import React from 'react';\n\n")
+    if _virtualize:
+        shared_parts.append(_LAZY_MOUNT_COMPONENT.replace("\nconst LazyMount", "\nexport const LazyMount"))
+    for _, name, definition in _ON_DEMAND_COMPONENTS:
+        if name in components:
+            shared_parts.append(definition.replace(f"\nconst {name} =", f"\nexport const {name} ="))
+    if style_pool is not None and style_pool.const_declarations():
+        shared_parts.append("\n" + style_pool.const_declarations(exported=True))
+    path = os.path.join(output_dir, f"{_SPLIT_SHARED_MODULE}.jsx")
+    _write_atomic(path, "".join(shared_parts))
+    written.append(path)
+
+    path = os.path.join(output_dir, f"{_SPLIT_INDEX_MODULE}.jsx")
+    _write_atomic(path, _split_index_module(tasks, prefetch))
+    written.append(path)
+    return written
+
+
+def convert_presentation_slide_to_react(presentation_data: Dict[str, Any], slide_number: int,
+                                        style_pool: Optional[StylePool] = None) -> Optional[str]:
+    """
+    Convert a single slide of a presentation, validating only that slide.
+    
+    Shape ids match the ones the slide gets in a full conversion.
+    
+    Args:
+        presentation_data: Decoded Presentation JSON (a dict with ``Slides``)
+        slide_number: Slide number, counted from ``FirstSlideNumber``
+        style_pool: Shares repeated inline styles across the module
+        
+    Returns:
+        Optional[str]: Module exporting the ``SlideN`` component, or None if
+        there is no such slide
+    """
+    presentation = Presentation.lazy(presentation_data)
+    index = slide_number - presentation.FirstSlideNumber
+    if not 0 <= index < len(presentation.Slides):
+        print(f"Error: Slide {slide_number} not found ({len(presentation.Slides)} slides, "
+              f"numbered from {presentation.FirstSlideNumber})")
+        return None
+    first_shape_id = 1 + sum(_slide_shape_count(presentation.Slides.raw(i)) for i in range(index))
+    component_name = f"Slide{slide_number}"
+    try:
+        slide = presentation.Slides[index]
+        slide_props = slide_props_for(slide)
+        slide_items = _culled(slide_to_items(slide, first_shape_id), slide_props, component_name)
+    except Exception as e:
+        # Like a full conversion: report the slide and render it empty
+        print(f"Error converting slide {slide_number}: {e}")
+        slide_props, slide_items = dict(DEFAULT_SLIDE_PROPS), []
+    buffer = io.StringIO()
+    _write_single_slide_module(buffer, render_slide_fragments(slide_items, slide_props), slide_props,
+                               component_name, style_pool)
+    return buffer.getvalue()
+
+
+def load_presentation_data(file_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a Presentation JSON file, also accepting a ``SlideUpdateRequest``
+    style wrapper with the presentation under ``Presentation``.
+    
+    Args:
+        file_path: Path to the Syncfusion Presentation JSON file
+        
+    Returns:
+        Optional[Dict[str, Any]]: Raw presentation data, or None on error
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            json_data = pydantic_core.from_json(f.read())
+    except Exception as e:
+        print(f"Error loading JSON file: {e}")
+        return None
+    if isinstance(json_data, dict) and isinstance(json_data.get("Presentation"), dict):
+        json_data = json_data["Presentation"]
+    if not isinstance(json_data, dict) or not isinstance(json_data.get("Slides"), list):
+        print("Error: JSON data is not a Presentation with a Slides list")
+        return None
+    # Only the slides are rendered; drop the embedded .pptx so it is not kept
+    # alive (or pickled to workers) alongside them
+    json_data.pop("PptxBase64String", None)
+    return json_data
+
+
+@contextlib.contextmanager
+def _atomic_writer(path: str) -> Iterator[TextIO]:
+    """
+    Open a temporary file in the same directory as ``path`` for writing, and
+    atomically rename it over ``path`` once the block completes, so output can
+    be streamed while readers never see a partially written file.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".", suffix=".tmp")
+    try:
+        # mkstemp creates the file owner-only; give it the usual umask mode
+        os.chmod(tmp_path, default_file_mode())
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+def _write_text(sink: TextIO, text: str) -> None:
+    sink.write(text)
+
+
+def _write_atomic(path: str, text: str) -> None:
+    """Write text to a file atomically (see ``_atomic_writer``)."""
+    with _atomic_writer(path) as f:
+        f.write(text)
+
+
+def _read_manifest(manifest_path: str) -> List[Tuple[str, Optional[str]]]:
+    """
+    Read (input, output) pairs from a manifest file listing one input per
+    line, optionally followed by a tab and the output path. Blank lines and
+    lines starting with ``#`` are ignored, and relative paths are resolved
+    against the manifest's directory.
+    """
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    entries = []
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            input_path, _, output_path = line.partition("\t")
+            output_path = output_path.strip()
+            entries.append((os.path.join(base_dir, input_path.strip()),
+                            os.path.join(base_dir, output_path) if output_path else None))
+    return entries
+
+
+def resolve_batch_inputs(source: str, output_dir: str) -> List[Tuple[str, str]]:
+    """
+    Expand a batch source into (input, output) path pairs.
+
+    Args:
+        source: A directory (every ``*.json`` file in it), a glob pattern, a
+            single ``.json`` deck, or any other file as a manifest (see
+            ``_read_manifest``)
+        output_dir: Directory for outputs the manifest does not name
+
+    Returns:
+        List[Tuple[str, str]]: Input and output paths, in a stable order
+    """
+    if os.path.isdir(source):
+        entries = [(path, None) for path in sorted(glob.glob(os.path.join(source, "*.json")))]
+    elif os.path.isfile(source) and not source.lower().endswith(".json"):
+        entries = _read_manifest(source)
+    else:
+        entries = [(path, None) for path in sorted(glob.glob(source, recursive=True))]
+
+    pairs = []
+    used_outputs = set()
+    for input_path, output_path in entries:
+        if not output_path:
+            stem = os.path.splitext(os.path.basename(input_path))[0]
+            output_path = os.path.join(output_dir, f"{stem}.jsx")
+            suffix = 1
+            while output_path in used_outputs:
+                suffix += 1
+                output_path = os.path.join(output_dir, f"{stem}_{suffix}.jsx")
+        used_outputs.add(output_path)
+        pairs.append((input_path, output_path))
+    return pairs
+
+
+def _worker_settings() -> Dict[str, Any]:
+    """Picklable render cache, asset and chart store and output mode configuration for pool workers."""
+    return {"render_cache": _render_cache_settings(), "asset_store": _asset_store_settings(),
+            "chart_store": _chart_store_settings(), "chart_downsampling": _chart_downsampling,
+            "table_window_rows": _table_window_rows, "culling": _cull_invisible, "virtualize": _virtualize,
+            "svg_shapes": _svg_shapes, "pixel_step": _pixel_step}
+
+
+def _init_worker(settings: Dict[str, Any]) -> None:
+    """Pool initializer: share the parent's render cache, asset and chart store and output mode configuration."""
+    if settings["render_cache"]:
+        enable_render_cache(*settings["render_cache"])
+    if settings["asset_store"]:
+        enable_asset_store(*settings["asset_store"])
+    if settings["chart_store"]:
+        enable_chart_store(*settings["chart_store"])
+    if settings["chart_downsampling"]:
+        enable_chart_downsampling(settings["chart_downsampling"])
+    set_table_window_rows(settings["table_window_rows"])
+    if settings["culling"]:
+        enable_culling()
+    if settings["virtualize"]:
+        enable_virtualization()
+    if settings["svg_shapes"]:
+        enable_svg_shapes()
+    set_pixel_quantization(settings["pixel_step"])
+
+
+def _warm_worker(settings: Dict[str, Any]) -> None:
+    """
+    Pool initializer: build the validators and run the render path once, so
+    the first deck a worker receives does not pay for it.
+    """
+    _init_worker(settings)
+    _SLIDE_ITEM_LIST.validate_python([{}])
+    Slide.model_validate({})
+    generate_react_component_for_item(SlideItem())
+
+
+def _convert_deck(task) -> Tuple[str, str, int, Optional[str], int, Tuple[int, int]]:
+    """
+    Convert one deck inside a batch worker.
+
+    Returns:
+        Tuple of input path, output path, shape count, error message (None on
+        success), bytes saved by style dedupe and font style cache hits and
+        misses
+    """
+    input_path, output_path, presentation, dedupe_styles = task
+    style_pool = StylePool(dedupe_styles) if dedupe_styles else None
+    font_stats = font_style_cache_stats()
+    try:
+        if presentation:
+            presentation_data = load_presentation_data(input_path)
+            if presentation_data is None:
+                return input_path, output_path, 0, "Not a valid Presentation JSON", 0, (0, 0)
+            shape_count = sum(_slide_shape_count(slide) for slide in presentation_data["Slides"])
+            # Already inside a pool worker, so render the slides in-process
+            write_output = functools.partial(write_presentation, presentation_data=presentation_data,
+                                             max_workers=1, style_pool=style_pool)
+        else:
+            slide_items = load_json(input_path)
+            if not slide_items:
+                return input_path, output_path, 0, "No valid slide items found", 0, (0, 0)
+            shape_count = len(slide_items)
+            slide_items = _culled(slide_items, label=input_path)
+            write_output = functools.partial(write_react_component, slide_items=slide_items,
+                                             style_pool=style_pool)
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        with _atomic_writer(output_path) as f:
+            write_output(f)
+    except Exception as e:
+        return input_path, output_path, 0, str(e), 0, _font_style_cache_delta(font_stats)
+    return (input_path, output_path, shape_count, None, style_pool.bytes_saved if style_pool else 0,
+            _font_style_cache_delta(font_stats))
+
+
+def convert_batch(pairs: List[Tuple[str, str]], presentation: bool = False,
+                  max_workers: Optional[int] = None, dedupe_styles: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Convert many decks over one pool of pre-warmed worker processes.
+
+    Each worker process is started and warmed once and then reused for every
+    deck, so interpreter startup, imports and model construction are paid
+    once per worker instead of once per deck.
+
+    Args:
+        pairs: (input, output) paths from ``resolve_batch_inputs``
+        presentation: Whether the inputs are Presentation JSON files
+        max_workers: Worker process count; defaults to the number of CPUs
+        dedupe_styles: Style dedupe mode applied to each deck (``"const"``)
+
+    Returns:
+        Dict[str, Any]: Throughput statistics (decks, shapes, failures,
+        seconds, style_bytes_saved, font_style_hits, font_style_misses)
+    """
+    start = time.perf_counter()
+    decks = 0
+    shapes = 0
+    style_bytes_saved = 0
+    font_style_hits = font_style_misses = 0
+    failures = []
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_warm_worker,
+                             initargs=(_worker_settings(),)) as executor:
+        futures = [executor.submit(_convert_deck, (input_path, output_path, presentation, dedupe_styles))
+                   for input_path, output_path in pairs]
+        for future in as_completed(futures):
+            input_path, output_path, shape_count, error, bytes_saved, font_stats = future.result()
+            font_style_hits += font_stats[0]
+            font_style_misses += font_stats[1]
+            if error:
+                print(f"Error converting {input_path}: {error}")
+                failures.append(input_path)
+            else:
+                print(f"Successfully converted {input_path} to {output_path}")
+                decks += 1
+                shapes += shape_count
+                style_bytes_saved += bytes_saved
+    return {
+        "decks": decks,
+        "shapes": shapes,
+        "failures": failures,
+        "seconds": time.perf_counter() - start,
+        "style_bytes_saved": style_bytes_saved,
+        "font_style_hits": font_style_hits,
+        "font_style_misses": font_style_misses,
+    }
+
+
+SLIDE_CSS = """/* Main slide container */
 .syncfusion-slide {
   border: 1px solid #ccc;
   box-shadow: 0 2px 5px rgba(0,0,0,0.1);
@@ -731,6 +3061,11 @@ def main():
   padding: 4px;
 }
 
+/* Stacked slides of a presentation */
+.syncfusion-presentation .syncfusion-slide {
+  margin-bottom: 20px;
+}
+
 /* Indented bullet points */
 .bullet-indent {
   text-align: left;
@@ -760,6 +3095,23 @@ def main():
   border-radius: 50%;
 }
 
+/* Tables */
+.syncfusion-table {
+  border-collapse: collapse;
+  table-layout: fixed;
+  width: 100%;
+}
+
+.syncfusion-table td,
+.syncfusion-shape .syncfusion-table-cell {
+  border: 1px solid #bfbfbf;
+  box-sizing: border-box;
+  overflow: hidden;
+  padding: 2px 4px;
+  white-space: pre-line;
+  vertical-align: top;
+}
+
 /* Shape clipPaths for modern browsers */
 .shape-rightarrow {
   clip-path: polygon(0 25%, 75% 25%, 75% 0, 100% 50%, 75% 100%, 75% 75%, 0 75%);
@@ -831,13 +3183,234 @@ def main():
   }
 }
 """
-            with open(args.css, 'w', encoding='utf-8') as f:
-                f.write(css_content)
+
+
+def _print_cache_summary(render_cache: RenderCache, totals_before: Dict[str, int]) -> None:
+    """Print render cache activity since ``totals_before``, across all workers."""
+    totals = render_cache.totals()
+    hits = totals["hits"] - totals_before["hits"]
+    misses = totals["misses"] - totals_before["misses"]
+    lookups = hits + misses
+    hit_rate = hits / lookups if lookups else 0.0
+    print(f"Render cache: {hits} hits, {misses} misses ({hit_rate:.0%} hit rate), "
+          f"{totals['evictions'] - totals_before['evictions']} evictions, "
+          f"{totals['entries']} entries ({totals['bytes'] / (1024 * 1024):.1f} MB)")
+
+
+def _print_font_style_summary(hits: int, misses: int) -> None:
+    lookups = hits + misses
+    if lookups:
+        print(f"Font style cache: {hits} hits, {misses} misses ({hits / lookups:.0%} hit rate)")
+
+
+def main():
+    """Main function to execute the conversion."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Convert Syncfusion PowerPoint JSON to React components')
+    parser.add_argument('--input', '-i', type=str, help='Input JSON file path', required=True)
+    parser.add_argument('--output', '-o', type=str, help='Output React component file path', required=True)
+    parser.add_argument('--css', '-c', type=str, help='Output CSS file path', default=None)
+    parser.add_argument('--stream', action='store_true',
+                        help='Decode and validate slide items incrementally instead of loading the whole file')
+    parser.add_argument('--presentation', '-p', action='store_true',
+                        help='Input is a Presentation JSON; emit one component per slide')
+    parser.add_argument('--slide', type=int, default=None,
+                        help='With --presentation, convert only this slide number; other slides are '
+                             'not validated')
+    parser.add_argument('--workers', '-w', type=int, default=None,
+                        help='Worker processes for --presentation and --batch (default: CPU count)')
+    parser.add_argument('--batch', '-b', action='store_true',
+                        help='Treat --input as a directory, glob pattern or manifest file and '
+                             '--output as the output directory')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and re-convert --input whenever it changes, re-rendering only '
+                             'added or changed shapes')
+    parser.add_argument('--watch-interval', type=float, default=0.5,
+                        help='Polling interval in seconds for --watch (default: 0.5)')
+    parser.add_argument('--cache-dir', type=str, default=None,
+                        help='Directory of the on-disk rendered fragment cache (disabled by default)')
+    parser.add_argument('--cache-size', type=int, default=256,
+                        help='Render cache size cap in MB (default: 256)')
+    parser.add_argument('--dedupe-styles', choices=['const', 'class'], default=None,
+                        help='Share repeated inline styles as module-level constants, or as CSS classes '
+                             'written to the --css file')
+    parser.add_argument('--assets-dir', type=str, default=None,
+                        help='Write embedded images to content-hashed files in this directory and '
+                             'reference them by URL instead of inlining base64 data')
+    parser.add_argument('--cull', action='store_true',
+                        help='Drop provably invisible items: zero-size, off-slide, or fully covered by an '
+                             'opaque shape above them')
+    parser.add_argument('--virtualize', action='store_true',
+                        help='Mount each slide, picture and chart only when it scrolls near the viewport '
+                             '(IntersectionObserver), behind a placeholder of the same size')
+    parser.add_argument('--svg-shapes', action='store_true',
+                        help='Draw text-free arrows, diamonds, triangles and other polygonal shapes as paths '
+                             'in one inline <svg> per run of such shapes instead of clipped divs')
+    parser.add_argument('--split', action='store_true',
+                        help='With --presentation, write one module per slide plus index.jsx and shared.jsx '
+                             'into the --output directory, loading slides with React.lazy')
+    parser.add_argument('--prefetch', type=int, default=2,
+                        help='With --split, number of following slides prefetched when a slide renders '
+                             '(default: 2)')
+    parser.add_argument('--assets-url', type=str, default='assets',
+                        help='URL path the --assets-dir directory is served from (default: assets)')
+    parser.add_argument('--charts-dir', type=str, default=None,
+                        help='Write chart data to content-hashed JSON modules in this directory, imported '
+                             'by the chart component on first render, instead of inlining it')
+    parser.add_argument('--charts-import', type=str, default='./charts',
+                        help='Module path of the --charts-dir directory as imported from the generated '
+                             'components (default: ./charts)')
+    parser.add_argument('--table-window-rows', type=int, default=200,
+                        help='Render tables with more rows as a scrollable table that mounts only the rows '
+                             'in view; 0 renders every table in full (default: 200)')
+    parser.add_argument('--downsample', choices=DOWNSAMPLE_METHODS, default=None,
+                        help='Reduce line, area and scatter chart series longer than the chart is wide in '
+                             'pixels with Largest-Triangle-Three-Buckets or min/max bucketing')
+    parser.add_argument('--quantize', type=float, default=None, metavar='PX',
+                        help='Snap item positions, sizes and border widths to a grid of PX pixels (e.g. 1 or 0.5), '
+                             'computed for all items in one vectorized pass')
+
+    args = parser.parse_args()
+
+    if args.stream and (args.presentation or args.batch or args.watch):
+        parser.error("--stream is not supported with --presentation, --batch or --watch")
+    if args.dedupe_styles and args.watch:
+        # Watch output is spliced from cached per-item fragments the style pool never sees
+        parser.error("--dedupe-styles is not supported with --watch")
+    if args.dedupe_styles == 'class' and (args.batch or not args.css):
+        parser.error("--dedupe-styles class needs --css and is not supported with --batch")
+    if args.split and (not args.presentation or args.slide is not None or args.batch or args.watch):
+        parser.error("--split needs --presentation and is not supported with --slide, --batch or --watch")
+    if args.quantize is not None and not args.quantize > 0:
+        parser.error("--quantize needs a positive pixel step")
+    for flag, enabled in (("--cull", args.cull), ("--svg-shapes", args.svg_shapes)):
+        if enabled and (args.stream or args.watch):
+            parser.error(f"{flag} needs every item of a slide at once and is not supported with --stream or --watch")
+    if args.cull:
+        enable_culling()
+    if args.virtualize:
+        enable_virtualization()
+    if args.svg_shapes:
+        enable_svg_shapes()
+
+    render_cache = None
+    if args.cache_dir:
+        render_cache = enable_render_cache(args.cache_dir, args.cache_size * 1024 * 1024)
+        cache_totals = render_cache.totals()
+
+    asset_store = None
+    if args.assets_dir:
+        asset_store = enable_asset_store(args.assets_dir, args.assets_url)
+    if args.charts_dir:
+        enable_chart_store(args.charts_dir, args.charts_import)
+    if args.downsample:
+        enable_chart_downsampling(args.downsample)
+    set_table_window_rows(args.table_window_rows)
+    set_pixel_quantization(args.quantize)
+
+    if args.watch:
+        if args.css:
+            _write_atomic(args.css, generated_css())
+            print(f"Generated CSS file: {args.css}")
+        watch_and_convert(args.input, args.output, args.watch_interval)
+        return
+
+    if args.batch:
+        pairs = resolve_batch_inputs(args.input, args.output)
+        if not pairs:
+            print(f"Error: No input files found for {args.input}")
+            sys.exit(1)
+        os.makedirs(args.output, exist_ok=True)
+        stats = convert_batch(pairs, args.presentation, args.workers, args.dedupe_styles)
+        seconds = stats["seconds"] or 1e-9
+        print(f"Converted {stats['decks']} decks ({stats['shapes']} shapes) in {seconds:.2f}s: "
+              f"{stats['decks'] / seconds:.2f} decks/s, {stats['shapes'] / seconds:.0f} shapes/s, "
+              f"{len(stats['failures'])} failures")
+        if args.dedupe_styles:
+            print(f"Style dedupe ({args.dedupe_styles}): {stats['style_bytes_saved']} bytes saved")
+        _print_font_style_summary(stats["font_style_hits"], stats["font_style_misses"])
+        if args.css:
+            _write_atomic(args.css, generated_css())
+            print(f"Generated CSS file: {args.css}")
+        if asset_store:
+            print(f"Generated asset manifest: {asset_store.write_manifest()}")
+        if render_cache:
+            _print_cache_summary(render_cache, cache_totals)
+        sys.exit(1 if stats["failures"] else 0)
+
+    style_pool = StylePool(args.dedupe_styles) if args.dedupe_styles else None
+    if args.presentation:
+        presentation_data = load_presentation_data(args.input)
+        if presentation_data is None:
+            sys.exit(1)
+        if args.split:
+            write_output = None
+        elif args.slide is not None:
+            react_component = convert_presentation_slide_to_react(presentation_data, args.slide, style_pool)
+            if react_component is None:
+                sys.exit(1)
+            write_output = functools.partial(_write_text, text=react_component)
+        else:
+            write_output = functools.partial(write_presentation, presentation_data=presentation_data,
+                                             max_workers=args.workers, style_pool=style_pool)
+    else:
+        # Load JSON data
+        if args.stream:
+            slide_items = iter_slide_items(args.input)
+            try:
+                first_item = next(slide_items, None)
+            except (OSError, ValueError):
+                sys.exit(1)
+            if first_item is not None:
+                slide_items = itertools.chain([first_item], slide_items)
+        else:
+            slide_items = load_json(args.input)
+            first_item = slide_items[0] if slide_items else None
+
+        if first_item is None:
+            print(f"Error: No valid slide items found in {args.input}")
+            sys.exit(1)
+        slide_items = _culled(slide_items)
+
+        # Convert to React, writing each fragment as soon as it is rendered
+        write_output = functools.partial(write_react_component, slide_items=slide_items,
+                                         style_pool=style_pool)
+
+    # Write to output file
+    try:
+        if args.split:
+            modules = write_split_presentation(args.output, presentation_data, args.workers, style_pool,
+                                               args.prefetch)
+            print(f"Successfully converted {args.input} to {len(modules)} modules in {args.output}")
+        else:
+            with _atomic_writer(args.output) as f:
+                write_output(f)
+            print(f"Successfully converted {args.input} to {args.output}")
+        
+        # Generate CSS file if specified
+        if args.css:
+            with _atomic_writer(args.css) as f:
+                f.write(generated_css(placeholders=args.split))
+                if style_pool:
+                    f.write(style_pool.css_rules())
             print(f"Generated CSS file: {args.css}")
+        
+        if style_pool:
+            print(style_pool.summary())
+        
+        font_stats = font_style_cache_stats()
+        _print_font_style_summary(font_stats["hits"], font_stats["misses"])
+        
+        if asset_store:
+            print(f"Generated asset manifest: {asset_store.write_manifest()}")
     except Exception as e:
         print(f"Error writing output file: {e}")
         sys.exit(1)
 
+    if render_cache:
+        _print_cache_summary(render_cache, cache_totals)
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark the bulk ``load_json`` validation path against the per-item loop.
+
+Builds a synthetic deck by repeating the shapes of sample_slide.json until it
+holds the requested number of shapes, then times both loaders on it.
+
+Usage:
+    python benchmarks/bench_load_json.py [--shapes 50000] [--repeat 3]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from pydantic import field_validator  # noqa: E402
+
+from app import SlideItem, TextBody, load_json  # noqa: E402
+
+
+class LegacySlideItem(SlideItem):
+    """SlideItem with the previous per-item TextBody re-validation."""
+
+    @field_validator('TextBody', mode='before')
+    @classmethod
+    def validate_text_body(cls, v):
+        if isinstance(v, dict):
+            try:
+                return TextBody(**v)
+            except Exception:
+                return v
+        return v
+
+
+def build_deck(shape_count: int) -> list:
+    with open(os.path.join(PROJECT_DIR, "sample_slide.json"), "r", encoding="utf-8") as f:
+        template = [item for item in json.load(f) if "Info" not in item]
+    deck = []
+    for index in range(shape_count):
+        item = dict(template[index % len(template)])
+        item["ShapeId"] = index
+        deck.append(item)
+    return deck
+
+
+def load_json_per_item(file_path: str) -> list:
+    """The previous loader: json.load followed by one SlideItem(**item) per element."""
+    with open(file_path, "r", encoding="utf-8") as f:
+        json_data = json.load(f)
+    slide_items = []
+    for item in json_data:
+        try:
+            slide_items.append(LegacySlideItem(**item))
+        except Exception as e:
+            slide_items.append(LegacySlideItem(Info=f"Error parsing: {str(e)}"))
+    return slide_items
+
+
+def best_of(func, file_path: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(file_path)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark slide item loading")
+    parser.add_argument("--shapes", type=int, default=50000, help="Number of shapes in the synthetic deck")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per loader; the best time is reported")
+    args = parser.parse_args()
+
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8") as f:
+        json.dump(build_deck(args.shapes), f)
+        deck_path = f.name
+
+    try:
+        per_item = best_of(load_json_per_item, deck_path, args.repeat)
+        bulk = best_of(load_json, deck_path, args.repeat)
+    finally:
+        os.unlink(deck_path)
+
+    print(f"shapes:           {args.shapes}")
+    print(f"per-item loop:    {per_item:.3f}s ({args.shapes / per_item:,.0f} shapes/s)")
+    print(f"bulk validation:  {bulk:.3f}s ({args.shapes / bulk:,.0f} shapes/s)")
+    print(f"speedup:          {per_item / bulk:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark the keyed ``StyleBuilder`` against the previous string-list styles.
+
+The previous code kept a shape's inline style as a list of ``"key: 'value'"``
+strings and rescanned (and re-split) it for the background color once per
+text run, so a text box with many runs cost O(runs x properties). Both style
+passes are timed over a synthetic shape with the requested number of runs,
+followed by the full ``generate_react_component_for_item`` on the same shape.
+
+Usage:
+    python benchmarks/bench_style_builder.py [--parts 500] [--props 12] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_DIR)
+
+from app import SlideItem, generate_react_component_for_item  # noqa: E402
+from syncfusion.style_builder import StyleBuilder  # noqa: E402
+
+
+def build_item(part_count: int) -> SlideItem:
+    parts = [
+        {"Text": f"run {index} ", "Font": {"FontName": "Aptos", "FontSize": 12 + index % 4, "Color": "#333333"}}
+        for index in range(part_count)
+    ]
+    return SlideItem(
+        SlideItemType="AutoShape", AutoShapeType="Rectangle", ShapeId=1,
+        Left=10, Top=20, Width=300, Height=200, ZIndex=1,
+        FillFormat={"Type": "Solid", "Color": "#f0f0f0"},
+        TextBody={"Paragraphs": [{"Text": "".join(part["Text"] for part in parts), "TextParts": parts}]},
+    )
+
+
+def legacy_style_pass(item: SlideItem, prop_count: int) -> str:
+    """The previous pattern: append strings, rescan for the background per run."""
+    style_props = [
+        "position: 'absolute'",
+        f"left: '{item.Left * 1.33333}px'",
+        f"top: '{item.Top * 1.33333}px'",
+        f"width: '{item.Width * 1.33333}px'",
+        f"height: '{item.Height * 1.33333}px'",
+    ]
+    # Extra properties stand in for the line, shadow and shape styles
+    style_props.extend(f"extra{index}: '{index}px'" for index in range(prop_count))
+    style_props.append(f"backgroundColor: '{item.FillFormat['Color']}'")
+    colors = []
+    for _ in item.TextBody.Paragraphs[0].TextParts:
+        bg_color = next((prop.split(":")[1].strip(" '") for prop in style_props if "backgroundColor" in prop), None)
+        colors.append(bg_color)
+    if not any("backgroundColor" in prop for prop in style_props):
+        style_props.append("backgroundColor: '#f0f0f0'")
+    return ",\n        ".join(style_props)
+
+
+def builder_style_pass(item: SlideItem, prop_count: int) -> str:
+    style = StyleBuilder((
+        ("position", "absolute"),
+        ("left", f"{item.Left * 1.33333}px"),
+        ("top", f"{item.Top * 1.33333}px"),
+        ("width", f"{item.Width * 1.33333}px"),
+        ("height", f"{item.Height * 1.33333}px"),
+    ))
+    style.update((f"extra{index}", f"{index}px") for index in range(prop_count))
+    style.set("backgroundColor", item.FillFormat["Color"])
+    bg_color = style.get("backgroundColor")
+    colors = [bg_color for _ in item.TextBody.Paragraphs[0].TextParts]
+    style.setdefault("backgroundColor", "#f0f0f0")
+    return style.serialize(",\n        ")
+
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark inline style construction")
+    parser.add_argument("--parts", type=int, default=500, help="Text runs in the synthetic shape")
+    parser.add_argument("--props", type=int, default=12, help="Extra style properties on the shape")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per variant; the best time is reported")
+    args = parser.parse_args()
+
+    item = build_item(args.parts)
+    legacy = best_of(lambda: legacy_style_pass(item, args.props), args.repeat)
+    builder = best_of(lambda: builder_style_pass(item, args.props), args.repeat)
+    full = best_of(lambda: generate_react_component_for_item(item), args.repeat)
+
+    print(f"text runs:        {args.parts}")
+    print(f"style properties: {5 + args.props + 1}")
+    print(f"string list:      {legacy * 1000:.3f}ms")
+    print(f"style builder:    {builder * 1000:.3f}ms")
+    print(f"speedup:          {legacy / builder:.2f}x")
+    print(f"full shape:       {full * 1000:.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Content-addressed asset files for embedded images.
+
+Base64 image payloads are decoded once, written to files named after the hash
+of their content (so identical images share one file and the bundler can cache
+them forever), and referenced by URL instead of inline data URIs.
+"""
+
+import binascii
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, Optional, Tuple
+
+from syncfusion.utils import default_file_mode
+
+# (signature, offset, MIME type, file extension), checked in order
+_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", 0, "image/png", ".png"),
+    (b"\xff\xd8\xff", 0, "image/jpeg", ".jpg"),
+    (b"GIF87a", 0, "image/gif", ".gif"),
+    (b"GIF89a", 0, "image/gif", ".gif"),
+    (b"WEBP", 8, "image/webp", ".webp"),
+    (b"II*\x00", 0, "image/tiff", ".tif"),
+    (b"MM\x00*", 0, "image/tiff", ".tif"),
+    (b" EMF", 40, "image/x-emf", ".emf"),
+    (b"\xd7\xcd\xc6\x9a", 0, "image/x-wmf", ".wmf"),
+    (b"\x01\x00\x09\x00", 0, "image/x-wmf", ".wmf"),
+    (b"\x00\x00\x01\x00", 0, "image/x-icon", ".ico"),
+    (b"BM", 0, "image/bmp", ".bmp"),
+)
+
+_UNKNOWN = ("application/octet-stream", ".bin")
+
+# Formats browsers cannot display; a fallback image is preferred for these
+NON_WEB_MIME_TYPES = frozenset({"image/x-emf", "image/x-wmf", "image/tiff"})
+
+# Enough base64 characters to cover every signature above
+_SNIFF_CHARS = 88
+
+
+def sniff_mime(data: bytes) -> Tuple[str, str]:
+    """
+    Detect an image format from its leading bytes.
+
+    Returns:
+        Tuple[str, str]: MIME type and file extension
+    """
+    for signature, offset, mime, extension in _SIGNATURES:
+        if data[offset:offset + len(signature)] == signature:
+            return mime, extension
+    head = data[:1024].lstrip()
+    if head.startswith(b"<svg") or (head.startswith(b"<?xml") and b"<svg" in head):
+        return "image/svg+xml", ".svg"
+    return _UNKNOWN
+
+
+def strip_data_uri(data: str) -> str:
+    """Remove a ``data:<mime>;base64,`` prefix, if present."""
+    if data.startswith("data:"):
+        return data.partition(",")[2]
+    return data
+
+
+def decode_base64(data: str) -> bytes:
+    """Decode base64 text, ignoring line breaks and a data URI prefix."""
+    return binascii.a2b_base64(strip_data_uri(data))
+
+
+def sniff_base64_mime(data: str) -> Tuple[str, str]:
+    """
+    Detect the image format of a base64 payload by decoding only its head.
+    Payloads that are not valid base64, including non-ASCII text, are of
+    unknown format.
+
+    >>> sniff_base64_mime("iVBORw0KGgoAAAANSUhEUg==")
+    ('image/png', '.png')
+    >>> sniff_base64_mime("iVBORw0KGgo\u00e9AAAANSUhEUg==")
+    ('application/octet-stream', '.bin')
+    """
+    head = "".join(strip_data_uri(data)[:_SNIFF_CHARS * 2].split())[:_SNIFF_CHARS]
+    try:
+        return sniff_mime(binascii.a2b_base64(head[:len(head) - len(head) % 4]))
+    except (binascii.Error, ValueError):
+        # a2b_base64 raises a plain ValueError on non-ASCII text
+        return _UNKNOWN
+
+
+def write_content_file(directory: str, name: str, data: bytes) -> str:
+    """
+    Write a file named after its content, unless it exists already.
+
+    The file is written atomically and readable by everyone (it is served to
+    browsers), so concurrent writers of the same content are safe.
+
+    Returns:
+        str: Path of the file
+    """
+    path = os.path.join(directory, name)
+    if not os.path.exists(path):
+        _replace_file(path, data)
+    return path
+
+
+def _replace_file(path: str, data: bytes) -> None:
+    """Write a file through a temporary file renamed over it, so readers never see it partly written."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".", suffix=".tmp")
+    try:
+        # Not owner-only like mkstemp
+        os.chmod(tmp_path, default_file_mode())
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class AssetStore:
+    """
+    Writes decoded images to content-hashed files in one directory.
+
+    Several processes may share a directory: file names depend only on the
+    content and files are written atomically, so concurrent writers of the
+    same image produce the same file.
+
+    Args:
+        directory: Output directory for the asset files, created if missing
+        url_prefix: URL path under which the directory is served
+    """
+
+    def __init__(self, directory: str, url_prefix: str = "assets"):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.url_prefix = url_prefix.rstrip("/")
+        # Hash of the base64 text -> (file name, MIME type), so repeated
+        # payloads are neither decoded nor hashed again
+        self._by_payload: Dict[str, Tuple[str, str]] = {}
+
+    def add_base64(self, data: str) -> Tuple[str, str]:
+        """
+        Store a base64 image payload.
+
+        Returns:
+            Tuple[str, str]: Asset URL and MIME type
+
+        Raises:
+            ValueError: If the payload is not valid base64 (``binascii.Error``)
+                or not ASCII
+        """
+        payload_key = hashlib.sha256(data.encode("ascii", "ignore")).hexdigest()
+        stored = self._by_payload.get(payload_key)
+        if stored is None:
+            stored = self._write(decode_base64(data))
+            self._by_payload[payload_key] = stored
+        name, mime = stored
+        return f"{self.url_prefix}/{name}", mime
+
+    def _write(self, data: bytes) -> Tuple[str, str]:
+        mime, extension = sniff_mime(data)
+        name = hashlib.sha256(data).hexdigest()[:20] + extension
+        write_content_file(self.directory, name, data)
+        return name, mime
+
+    def write_manifest(self, path: Optional[str] = None) -> str:
+        """
+        Write a JSON manifest of every asset in the directory, including those
+        written by other processes.
+
+        Args:
+            path: Manifest path; defaults to ``manifest.json`` in the directory
+
+        Returns:
+            str: Path of the written manifest
+        """
+        path = path or os.path.join(self.directory, "manifest.json")
+        manifest = {}
+        for name in sorted(os.listdir(self.directory)):
+            file_path = os.path.join(self.directory, name)
+            if name.startswith(".") or name == os.path.basename(path) or not os.path.isfile(file_path):
+                continue
+            with open(file_path, "rb") as f:
+                mime, _ = sniff_mime(f.read(1024))
+            manifest[name] = {
+                "url": f"{self.url_prefix}/{name}",
+                "mime": mime,
+                "bytes": os.path.getsize(file_path),
+                "immutable": True,
+            }
+        _replace_file(path, json.dumps(manifest, indent=2).encode("utf-8"))
+        return path
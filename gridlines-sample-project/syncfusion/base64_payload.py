@@ -0,0 +1,213 @@
+"""
+File-backed handles for large base64 payloads.
+
+A ``.pptx`` embedded as base64 text is decoded in fixed-size chunks straight
+into a spool file, so neither a full-size ``bytes`` copy nor a second string is
+ever built. Models keep a small ``Base64Payload`` handle (path, offset, length)
+and the decoded bytes are read back through ``memoryview`` slices of a
+memory-mapped file.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import mmap
+import os
+import tempfile
+import weakref
+from typing import Any, BinaryIO, Iterable, Iterator, Optional, Union
+
+from pydantic_core import core_schema
+
+# Base64 characters decoded per step; a multiple of 4 so chunks decode alone
+_DECODE_CHUNK_CHARS = 4 * 256 * 1024
+# Bytes encoded per step when serializing; a multiple of 3 for the same reason
+_ENCODE_CHUNK_BYTES = 3 * 256 * 1024
+
+
+def _iter_base64_chunks(data: Union[str, Iterable[str]]) -> Iterator[str]:
+    if isinstance(data, str):
+        if data.startswith("data:"):
+            start = data.index(",") + 1
+        else:
+            start = 0
+        for offset in range(start, len(data), _DECODE_CHUNK_CHARS):
+            yield data[offset:offset + _DECODE_CHUNK_CHARS]
+    else:
+        yield from data
+
+
+def decode_base64_to(data: Union[str, Iterable[str]], sink: BinaryIO) -> int:
+    """
+    Decode base64 text into a binary sink in bounded chunks.
+
+    Args:
+        data: Base64 text, or an iterable of consecutive pieces of it (for
+            example a text file opened for reading). Whitespace is ignored,
+            as is a data URI prefix on a single string.
+        sink: Writable binary file object, e.g. a file or ``io.BytesIO``
+
+    Returns:
+        int: Number of decoded bytes written
+
+    Raises:
+        binascii.Error: If the text is not valid base64
+    """
+    written = 0
+    carry = ""
+    for chunk in _iter_base64_chunks(data):
+        # Drop whitespace so every decoded slice is a whole number of quanta
+        chunk = carry + "".join(chunk.split())
+        usable = len(chunk) - len(chunk) % 4
+        carry = chunk[usable:]
+        if usable:
+            written += sink.write(binascii.a2b_base64(chunk[:usable]))
+    if carry:
+        written += sink.write(binascii.a2b_base64(carry))
+    return written
+
+
+class Base64Payload:
+    """
+    Handle to decoded base64 content stored in a file.
+
+    Validates only from base64 text or bytes (decoded into a spool file) or
+    from another handle, so model input can never point a handle at a local
+    file; handles on existing files are made with ``from_file``. Dumping to
+    JSON re-encodes the content as base64; dumping to Python keeps the handle.
+
+    Args:
+        path: File holding the decoded bytes
+        offset: Start of the content within the file
+        length: Content length in bytes
+        owned: Delete the file when the handle is garbage collected
+    """
+
+    __slots__ = ("path", "offset", "length", "_finalizer", "__weakref__")
+
+    def __init__(self, path: str, offset: int = 0, length: Optional[int] = None, owned: bool = False):
+        self.path = path
+        self.offset = offset
+        self.length = os.path.getsize(path) - offset if length is None else length
+        self._finalizer = weakref.finalize(self, os.unlink, path) if owned else None
+
+    @classmethod
+    def from_file(cls, path: str, offset: int = 0, length: Optional[int] = None) -> "Base64Payload":
+        """
+        Handle on decoded content already stored in a file, which the handle
+        does not own. For internal use only; never built from model input.
+        """
+        return cls(path, offset, length)
+
+    @classmethod
+    def from_base64(cls, data: Union[str, Iterable[str]], directory: Optional[str] = None) -> "Base64Payload":
+        """
+        Decode base64 text into a new spool file owned by the returned handle.
+
+        Args:
+            data: Base64 text or an iterable of its pieces
+            directory: Spool directory; defaults to the system temp directory
+        """
+        fd, path = tempfile.mkstemp(dir=directory, prefix="payload-", suffix=".bin")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                length = decode_base64_to(data, f)
+        except BaseException:
+            os.unlink(path)
+            raise
+        return cls(path, 0, length, owned=True)
+
+    @classmethod
+    def from_base64_file(cls, base64_path: str, directory: Optional[str] = None) -> "Base64Payload":
+        """Decode a file of base64 text without reading it into memory."""
+        with open(base64_path, "r", encoding="ascii") as f:
+            return cls.from_base64(iter(lambda: f.read(_DECODE_CHUNK_CHARS), ""), directory)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __repr__(self) -> str:
+        return f"Base64Payload(path={self.path!r}, offset={self.offset}, length={self.length})"
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Base64Payload):
+            return NotImplemented
+        return (self.path, self.offset, self.length) == (other.path, other.offset, other.length)
+
+    def __hash__(self) -> int:
+        return hash((self.path, self.offset, self.length))
+
+    def __reduce__(self):
+        # Pickled copies (e.g. sent to worker processes) never own the file
+        return Base64Payload.from_file, (self.path, self.offset, self.length)
+
+    def memoryview(self) -> memoryview:
+        """
+        Zero-copy read-only view of the content, backed by a memory map.
+        Release the view when done so the mapping can be closed.
+        """
+        if not self.length:
+            return memoryview(b"")
+        with open(self.path, "rb") as f:
+            start = self.offset - self.offset % mmap.ALLOCATIONGRANULARITY
+            mapping = mmap.mmap(f.fileno(), self.offset + self.length - start,
+                                access=mmap.ACCESS_READ, offset=start)
+        return memoryview(mapping)[self.offset - start:]
+
+    def iter_chunks(self, chunk_size: int = _ENCODE_CHUNK_BYTES) -> Iterator[bytes]:
+        """Yield the content in chunks of at most ``chunk_size`` bytes."""
+        remaining = self.length
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            while remaining > 0:
+                chunk = f.read(min(chunk_size, remaining))
+                if not chunk:
+                    raise EOFError(f"{self.path} is shorter than the payload it holds")
+                remaining -= len(chunk)
+                yield chunk
+
+    def copy_to(self, sink: BinaryIO) -> int:
+        """Write the content to a binary sink; returns the bytes written."""
+        return sum(sink.write(chunk) for chunk in self.iter_chunks())
+
+    def read_bytes(self) -> bytes:
+        """Return the whole content as one ``bytes`` object (a full copy)."""
+        return b"".join(self.iter_chunks())
+
+    def iter_base64(self) -> Iterator[str]:
+        """Yield the content re-encoded as consecutive pieces of base64 text."""
+        for chunk in self.iter_chunks(_ENCODE_CHUNK_BYTES):
+            yield base64.b64encode(chunk).decode("ascii")
+
+    @classmethod
+    def _validate(cls, value: Any) -> "Base64Payload":
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, (bytes, bytearray)):
+            try:
+                value = value.decode("ascii")
+            except UnicodeDecodeError:
+                raise ValueError("Base64 bytes must be ASCII") from None
+        if isinstance(value, str):
+            try:
+                return cls.from_base64(value)
+            except binascii.Error as e:
+                raise ValueError(f"Invalid base64 text: {e}") from None
+        raise ValueError("Expected base64 text")
+
+    def _serialize(self) -> str:
+        return "".join(self.iter_base64())
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: Any) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                cls._serialize, when_used="json"
+            ),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, schema: Any, handler: Any) -> dict:
+        return {"type": "string", "contentEncoding": "base64"}
@@ -0,0 +1,356 @@
+"""
+Columnar chart data.
+
+A chart's ``ChartData`` is a worksheet of strings, and each ``ChartSerie``
+points into it with ``ChartDataRange``s (1-based, inclusive worksheet rows and
+columns): its values, category labels and bubble sizes, and the cells its
+data labels are taken from. The worksheet is parsed once into a 2-D
+column-major float store - a float64 NumPy array when NumPy is installed, one
+``array('d')`` per worksheet column otherwise - and every range is handed out
+as a view into it (a NumPy slice or a ``memoryview``), so series sharing a
+large sheet do not each copy their part of it. The columns are serialized
+into one compact columnar JSON document per chart, which the generated chart
+component loads as a separate module.
+"""
+
+import hashlib
+import json
+import math
+import os
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy
+except ImportError:  # Optional: columns fall back to array('d')
+    numpy = None
+
+from syncfusion.assets import write_content_file
+from syncfusion.downsample import downsample_indices
+
+# Numeric column; missing or non-numeric cells are NaN
+Column = Union["numpy.ndarray", array, memoryview]
+
+# (first row, first column, last row, last column), 1-based and inclusive
+RangeKey = Tuple[int, int, int, int]
+
+# Series kinds drawn as connected or scattered points, which may be downsampled
+_DOWNSAMPLED_KINDS = ("line", "area", "scatter")
+
+# How the chart component draws a series, by SerieType prefix, checked in order
+_SERIES_KINDS = (
+    ("Column", "bar"), ("Bar", "bar"), ("Cone", "bar"), ("Cylinder", "bar"), ("Pyramid", "bar"),
+    ("Histogram", "bar"), ("Pareto", "bar"), ("Waterfall", "bar"),
+    ("Area", "area"),
+    ("Scatter", "scatter"), ("XYScatter", "scatter"), ("Bubble", "scatter"),
+    ("Pie", "pie"), ("Doughnut", "pie"),
+)
+
+
+def series_kind(serie_type: str) -> str:
+    """Map a ChartType value to the series kind drawn by the chart component."""
+    for prefix, kind in _SERIES_KINDS:
+        if serie_type.startswith(prefix):
+            return kind
+    return "line"
+
+
+def range_key(data_range: Any) -> Optional[RangeKey]:
+    """Normalize a ``ChartDataRange``, or None if it does not select any cell."""
+    bounds = (data_range.FirstRow, data_range.FirstColumn, data_range.LastRow, data_range.LastColumn)
+    if any(bound is None for bound in bounds):
+        return None
+    first_row, first_column, last_row, last_column = bounds
+    if first_row < 1 or first_column < 1 or last_row < first_row or last_column < first_column:
+        return None
+    return bounds
+
+
+def range_cells(grid: Sequence[Sequence[str]], key: RangeKey) -> List[str]:
+    """
+    Cell texts of a range, row by row; cells beyond the end of a row are empty.
+    """
+    first_row, first_column, last_row, last_column = key
+    rows = grid[first_row - 1:last_row]
+    if first_column == last_column:
+        # The common case: one column of a long sheet
+        column = first_column - 1
+        return [row[column] if column < len(row) else "" for row in rows]
+    width = last_column - first_column + 1
+    cells = []
+    for row in rows:
+        row_cells = list(row[first_column - 1:last_column])
+        cells.extend(row_cells + [""] * (width - len(row_cells)))
+    return cells
+
+
+def _to_float(cell: str) -> float:
+    try:
+        return float(cell)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def numeric_column(cells: List[str]) -> Column:
+    """
+    Convert cell texts into a float column in one pass, NaN for cells that
+    are not numbers.
+    """
+    if numpy is not None:
+        try:
+            # NumPy parses the whole column in C when every cell is a number
+            return numpy.array(cells, dtype=numpy.float64)
+        except (TypeError, ValueError):
+            return numpy.fromiter(map(_to_float, cells), dtype=numpy.float64, count=len(cells))
+    try:
+        return array("d", map(float, cells))
+    except (TypeError, ValueError):
+        return array("d", map(_to_float, cells))
+
+
+def _format_number(value: float) -> str:
+    if not math.isfinite(value):
+        return "null"
+    if value.is_integer() and abs(value) < 2 ** 53:
+        return str(int(value))
+    return repr(value)
+
+
+def format_column(column: Column) -> str:
+    """Serialize a numeric column as a JSON array, ``null`` for missing values."""
+    values = column.tolist()
+    return "[" + ",".join(map(_format_number, values)) + "]"
+
+
+def format_indices(indices: Any) -> str:
+    """Serialize integer indices as a JSON array."""
+    return "[" + ",".join(map(str, indices.tolist() if numpy is not None else indices)) + "]"
+
+
+def take(column: Column, indices: Any) -> Column:
+    """Values of a column at the given indices."""
+    if numpy is not None:
+        return column[indices]
+    return array("d", (column[index] for index in indices))
+
+
+def _json_string(text: str) -> str:
+    return json.dumps(text, ensure_ascii=False)
+
+
+class ChartColumns:
+    """
+    Parses the worksheet of one chart into a column-major float store and
+    resolves ranges into views of it.
+
+    Each worksheet column is parsed the first time a range needs it. A range
+    within one column or one row is a view of the store; only ranges over
+    several rows and columns, flattened row by row, are copied.
+
+    Args:
+        grid: The chart's ``ChartData`` rows
+    """
+
+    def __init__(self, grid: Sequence[Sequence[str]]):
+        self.grid = grid
+        self.height = len(grid)
+        self.width = max(map(len, grid), default=0)
+        if numpy is not None:
+            # Column-major, so a column slice is contiguous
+            self._store = numpy.empty((self.height, self.width), dtype=numpy.float64, order="F")
+            self._parsed = [False] * self.width
+        else:
+            self._store = [None] * self.width
+        self._missing = None
+        self._cells: Dict[RangeKey, List[str]] = {}
+
+    def cells(self, key: RangeKey) -> List[str]:
+        cells = self._cells.get(key)
+        if cells is None:
+            cells = self._cells[key] = range_cells(self.grid, key)
+        return cells
+
+    def _column(self, index: int) -> Column:
+        """Worksheet column ``index`` (0-based), parsed on first use."""
+        if index >= self.width:
+            # Beyond every row: all cells are missing
+            if self._missing is None:
+                self._missing = numeric_column([""] * self.height)
+            return self._missing
+        if numpy is not None:
+            if not self._parsed[index]:
+                self._store[:, index] = numeric_column([row[index] if index < len(row) else "" for row in self.grid])
+                self._parsed[index] = True
+            return self._store[:, index]
+        column = self._store[index]
+        if column is None:
+            column = self._store[index] = numeric_column(
+                [row[index] if index < len(row) else "" for row in self.grid])
+        return column
+
+    def numeric(self, key: RangeKey) -> Column:
+        """
+        Values of a range as floats, row by row; a view of the store unless
+        the range spans several rows and columns.
+        """
+        first_row, first_column, last_row, last_column = key
+        rows = slice(first_row - 1, min(last_row, self.height))
+        if first_column == last_column:
+            column = self._column(first_column - 1)
+            return column[rows] if numpy is not None else memoryview(column)[rows]
+        columns = [self._column(index) for index in range(first_column - 1, last_column)]
+        if numpy is not None:
+            if first_row == last_row and first_row <= self.height and last_column <= self.width:
+                # One row of the store: a strided view
+                return self._store[first_row - 1, first_column - 1:last_column]
+            return numpy.stack([column[rows] for column in columns], axis=1).ravel()
+        return array("d", (column[row] for row in range(rows.start, rows.stop) for column in columns))
+
+    def x_values(self, key: RangeKey) -> Optional[Column]:
+        """The category labels as numbers, or None unless every label is a number."""
+        column = self.numeric(key)
+        finite = bool(numpy.isfinite(column).all()) if numpy is not None else all(map(math.isfinite, column))
+        return column if finite and len(column) else None
+
+    def labels(self, key: RangeKey) -> str:
+        """
+        Serialize category labels: numbers when every label is a number (so
+        scatter charts get a numeric x axis), strings otherwise.
+        """
+        x_values = self.x_values(key)
+        if x_values is not None:
+            return format_column(x_values)
+        return "[" + ",".join(_json_string(cell) for cell in self.cells(key)) + "]"
+
+
+def _labels_range(serie: Any) -> Optional[Any]:
+    """The ``ValueFromCellsRange`` of a series' data labels, if they show it."""
+    point = serie.DefaultDataPoint
+    data_labels = point.DataLabels if point is not None else None
+    if data_labels is None or not data_labels.IsValueFromCells:
+        return None
+    return data_labels.ValueFromCellsRange
+
+
+def _aligned(resolve: Any, data_range: Optional[Any], values: Column) -> Optional[Any]:
+    """Resolve a range that belongs to each value, or None unless it has one cell per value."""
+    key = range_key(data_range) if data_range is not None else None
+    if key is None:
+        return None
+    resolved = resolve(key)
+    return resolved if len(resolved) == len(values) else None
+
+
+def chart_document(grid: Sequence[Sequence[str]], series: Sequence[Any], title: Optional[str] = None,
+                   downsample: Optional[str] = None, pixels: int = 0) -> Optional[str]:
+    """
+    Build the columnar JSON document of a chart.
+
+    The document holds the title, the category labels of the first series,
+    ``xDomain`` (lowest and highest label) when the labels are numbers and,
+    per series, its name, kind (see ``series_kind``) and values, the bubble
+    sizes of bubble series (``sizes``) and the data labels taken from cells
+    (``labels``).
+
+    With ``downsample``, line, area and scatter series longer than the plot
+    is wide are reduced (see ``syncfusion.downsample``). A reduced series
+    also holds ``index``, the category position of each value, and ``x``,
+    the label of each value when the labels are numbers. The document then
+    holds ``count``, the number of category positions, and drops the labels
+    when every series was reduced, so its size is bounded by the width.
+
+    Args:
+        grid: The chart's ``ChartData`` rows
+        series: The chart's ``ChartSerie`` models
+        title: Chart title
+        downsample: ``"lttb"``, ``"minmax"``, or None to keep every point
+        pixels: Plot width in pixels, the downsampling target
+
+    Returns:
+        Optional[str]: Compact JSON text, or None if no series selects any cell
+    """
+    columns = ChartColumns(grid)
+    series_parts = []
+    labels_key = None
+    x_values = None
+    count = 0
+    reduced = 0
+    for serie in series:
+        values_key = range_key(serie.Values)
+        if values_key is None:
+            continue
+        if not series_parts:
+            labels_key = range_key(serie.CategoryLabels)
+            x_values = columns.x_values(labels_key) if labels_key else None
+        kind = series_kind(serie.SerieType.value)
+        values = columns.numeric(values_key)
+        count = max(count, len(values))
+        sizes = _aligned(columns.numeric, serie.Bubbles, values)
+        point_labels = _aligned(columns.cells, _labels_range(serie), values)
+        part = f'{{"name":{_json_string(serie.Name)},"kind":"{kind}"'
+        if downsample and kind in _DOWNSAMPLED_KINDS and len(values) > pixels > 0:
+            # Labels only line up with the values when both cover the same rows
+            aligned_x = x_values if x_values is not None and len(x_values) == len(values) else None
+            indices = downsample_indices(downsample, aligned_x, values, pixels)
+            if len(indices) < len(values):
+                part += f',"index":{format_indices(indices)}'
+                if aligned_x is not None:
+                    part += f',"x":{format_column(take(aligned_x, indices))}'
+                values = take(values, indices)
+                if sizes is not None:
+                    sizes = take(sizes, indices)
+                if point_labels is not None:
+                    point_labels = [point_labels[index] for index in indices]
+                reduced += 1
+        if sizes is not None:
+            part += f',"sizes":{format_column(sizes)}'
+        if point_labels is not None:
+            part += f',"labels":[{",".join(map(_json_string, point_labels))}]'
+        series_parts.append(f'{part},"values":{format_column(values)}}}')
+    if not series_parts:
+        return None
+
+    fields = []
+    if title:
+        fields.append(f'"title":{_json_string(title)}')
+    if reduced < len(series_parts):
+        fields.append(f'"categories":{columns.labels(labels_key) if labels_key else "[]"}')
+    if reduced:
+        fields.append(f'"count":{count}')
+    if x_values is not None:
+        low, high = (float(x_values.min()), float(x_values.max())) if numpy is not None else (min(x_values), max(x_values))
+        fields.append(f'"xDomain":[{_format_number(low)},{_format_number(high)}]')
+    fields.append(f'"series":[{",".join(series_parts)}]')
+    return "{" + ",".join(fields) + "}"
+
+
+class ChartStore:
+    """
+    Writes chart documents to content-hashed JSON modules in one directory,
+    which generated components load with a dynamic ``import()``.
+
+    Several processes may share a directory: file names depend only on the
+    content and files are written atomically.
+
+    Args:
+        directory: Output directory for the data modules, created on first write
+        import_prefix: Module path of the directory as imported from the
+            generated components
+    """
+
+    def __init__(self, directory: str, import_prefix: str = "./charts"):
+        self.directory = directory
+        self.import_prefix = import_prefix.rstrip("/")
+
+    def add(self, document: str) -> str:
+        """
+        Store a chart document.
+
+        Returns:
+            str: Module path to import the document from
+        """
+        data = document.encode("utf-8")
+        name = hashlib.sha256(data).hexdigest()[:20] + ".json"
+        os.makedirs(self.directory, exist_ok=True)
+        write_content_file(self.directory, name, data)
+        return f"{self.import_prefix}/{name}"
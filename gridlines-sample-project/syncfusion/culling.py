@@ -0,0 +1,163 @@
+"""
+Occlusion culling for slide items.
+
+Finds items that cannot contribute a visible pixel: zero-size shapes, shapes
+entirely outside the slide (which clips its content), and shapes completely
+covered by an opaque shape painted above them. Occluders are looked up in a
+uniform grid, so each item is tested against the few occluders whose area
+includes its top-left corner instead of against every other item.
+
+The pass works on plain boxes so it does not depend on the renderer; callers
+decide which items are opaque and how large their painted area is.
+"""
+
+import math
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+# (x0, y0, x1, y1) in slide pixels
+Bounds = Tuple[float, float, float, float]
+
+# Grid cell edge in pixels; a 960x720 slide has 15x12 cells
+DEFAULT_CELL_SIZE = 64.0
+
+
+class CullBox(NamedTuple):
+    """
+    Geometry of one slide item.
+
+    Attributes:
+        key: Identifier reported for culled items (e.g. the ShapeId)
+        bounds: Everything the item may paint, including borders, shadows and
+            the bounding box of a rotation
+        occluder: Area the item is guaranteed to paint opaquely, or None if it
+            cannot hide anything
+        order: Paint order; higher values are painted on top
+        degenerate: The item has no area and paints nothing (no border or
+            shadow)
+    """
+    key: object
+    bounds: Bounds
+    occluder: Optional[Bounds]
+    order: Tuple[float, int]
+    degenerate: bool = False
+
+
+class CullReport:
+    """Keys of the culled items, by reason."""
+
+    def __init__(self, total: int = 0):
+        self.total = total
+        self.zero_size: List[object] = []
+        self.off_slide: List[object] = []
+        self.occluded: List[object] = []
+
+    @property
+    def culled(self) -> int:
+        return len(self.zero_size) + len(self.off_slide) + len(self.occluded)
+
+    def summary(self) -> str:
+        reasons = [f"{len(keys)} {reason}" for reason, keys in
+                   (("zero-size", self.zero_size), ("off-slide", self.off_slide), ("occluded", self.occluded))
+                   if keys]
+        culled_keys = ", ".join(str(key) for key in self.zero_size + self.off_slide + self.occluded)
+        return f"Culled {self.culled} of {self.total} items: {', '.join(reasons) or 'none'}" + (
+            f" (ids {culled_keys})" if culled_keys else "")
+
+
+def rotated_bounds(left: float, top: float, width: float, height: float, rotation: float) -> Bounds:
+    """Axis-aligned bounding box of a rectangle rotated about its center."""
+    if not rotation or rotation % 180 == 0:
+        return left, top, left + width, top + height
+    if rotation % 90 == 0:
+        # Quarter turns swap width and height exactly
+        center_x, center_y = left + width / 2, top + height / 2
+        return center_x - height / 2, center_y - width / 2, center_x + height / 2, center_y + width / 2
+    radians = math.radians(rotation)
+    cos, sin = abs(math.cos(radians)), abs(math.sin(radians))
+    half_width = (width * cos + height * sin) / 2
+    half_height = (width * sin + height * cos) / 2
+    center_x, center_y = left + width / 2, top + height / 2
+    return center_x - half_width, center_y - half_height, center_x + half_width, center_y + half_height
+
+
+def _contains(outer: Bounds, inner: Bounds) -> bool:
+    return outer[0] <= inner[0] and outer[1] <= inner[1] and outer[2] >= inner[2] and outer[3] >= inner[3]
+
+
+class UniformGrid:
+    """
+    Uniform grid over a fixed region, mapping cells to the occluders that
+    overlap them. Boxes reaching outside the region are clamped to its edge
+    cells, so a point query outside the region is answered by the nearest
+    cell.
+
+    Args:
+        width: Region width in pixels
+        height: Region height in pixels
+        cell_size: Cell edge in pixels
+    """
+
+    def __init__(self, width: float, height: float, cell_size: float = DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self.columns = max(1, math.ceil(width / cell_size))
+        self.rows = max(1, math.ceil(height / cell_size))
+        self._cells: Dict[Tuple[int, int], List[CullBox]] = {}
+
+    def _column(self, x: float) -> int:
+        return min(max(int(x // self.cell_size), 0), self.columns - 1)
+
+    def _row(self, y: float) -> int:
+        return min(max(int(y // self.cell_size), 0), self.rows - 1)
+
+    def insert(self, box: CullBox) -> None:
+        x0, y0, x1, y1 = box.occluder
+        for column in range(self._column(x0), self._column(x1) + 1):
+            for row in range(self._row(y0), self._row(y1) + 1):
+                self._cells.setdefault((column, row), []).append(box)
+
+    def at(self, x: float, y: float) -> List[CullBox]:
+        """Occluders overlapping the cell that holds (x, y)."""
+        return self._cells.get((self._column(x), self._row(y)), [])
+
+
+def cull(boxes: Sequence[CullBox], slide_width: float, slide_height: float,
+         cell_size: float = DEFAULT_CELL_SIZE) -> Tuple[Set[int], CullReport]:
+    """
+    Find the boxes that cannot be seen.
+
+    A box is occluded only if a single opaque box painted above it contains
+    it entirely; coverage by a union of several boxes is not detected, so the
+    result never drops a visible item.
+
+    Args:
+        boxes: One box per item
+        slide_width: Slide width in pixels; the slide clips its content
+        slide_height: Slide height in pixels
+        cell_size: Grid cell edge in pixels
+
+    Returns:
+        Tuple[Set[int], CullReport]: Indices into ``boxes`` of the culled
+        items, and the report of what was culled
+    """
+    report = CullReport(len(boxes))
+    grid = UniformGrid(slide_width, slide_height, cell_size)
+    for box in boxes:
+        if box.occluder is not None:
+            grid.insert(box)
+
+    culled = set()
+    for index, box in enumerate(boxes):
+        x0, y0, x1, y1 = box.bounds
+        if box.degenerate:
+            report.zero_size.append(box.key)
+        elif x1 <= 0 or y1 <= 0 or x0 >= slide_width or y0 >= slide_height:
+            report.off_slide.append(box.key)
+        elif any(other.order > box.order and _contains(other.occluder, box.bounds)
+                 for other in grid.at(x0, y0)):
+            # An occluder containing the box contains its top-left corner,
+            # so the corner's cell lists every candidate
+            report.occluded.append(box.key)
+        else:
+            continue
+        culled.add(index)
+    return culled, report
@@ -0,0 +1,178 @@
+"""
+Downsampling of long chart series.
+
+A chart cannot show more detail than it has pixel columns, so series much
+longer than that are reduced before they are written:
+
+- Largest-Triangle-Three-Buckets (LTTB) keeps the first and last points and,
+  from each bucket in between, the point forming the largest triangle with
+  the point kept from the previous bucket and the average of the next bucket,
+  which preserves the visual shape of the line.
+- Min/max bucketing keeps the lowest and highest point of each bucket, so no
+  spike is lost.
+
+Both return sorted indices into the series, so values and their x positions
+stay aligned. NaN (missing) values are only kept when a bucket has nothing
+else. NumPy is used when installed; the pure Python versions give the same
+result.
+"""
+
+import math
+from typing import List, Optional, Sequence, Union
+
+try:
+    import numpy
+except ImportError:  # Optional: pure Python fallback
+    numpy = None
+
+# Sorted indices into a series
+Indices = Union["numpy.ndarray", List[int]]
+
+METHODS = ("lttb", "minmax")
+
+
+def lttb_indices(x: Optional[Sequence[float]], y: Sequence[float], threshold: int) -> Indices:
+    """
+    Select ``threshold`` points of a series with Largest-Triangle-Three-Buckets.
+
+    Args:
+        x: X values in series order, or None for evenly spaced points
+        y: Y values, NaN where missing
+        threshold: Number of points to keep
+
+    Returns:
+        Indices: Indices of the kept points; every index when the series is
+        not longer than ``threshold``
+    """
+    count = len(y)
+    if threshold >= count or threshold < 3:
+        return numpy.arange(count) if numpy is not None else list(range(count))
+    if numpy is None:
+        return _lttb_indices_python(x, y, threshold)
+
+    y = numpy.asarray(y, dtype=numpy.float64)
+    x = numpy.arange(count, dtype=numpy.float64) if x is None else numpy.asarray(x, dtype=numpy.float64)
+    # threshold - 2 buckets over the interior points; with more points than
+    # buckets the edges are strictly increasing
+    edges = numpy.linspace(1, count - 1, threshold - 1).astype(numpy.int64)
+    sizes = numpy.diff(edges)
+    finite = numpy.isfinite(y[:count - 1])
+    # Bucket averages in one pass each; a bucket without numbers averages to NaN
+    with numpy.errstate(invalid="ignore", divide="ignore"):
+        average_x = numpy.add.reduceat(x[:count - 1], edges[:-1]) / sizes
+        average_y = (numpy.add.reduceat(numpy.where(finite, y[:count - 1], 0.0), edges[:-1])
+                     / numpy.add.reduceat(finite, edges[:-1]))
+    # The last bucket looks ahead to the last point
+    next_x = numpy.append(average_x[1:], x[count - 1])
+    next_y = numpy.append(average_y[1:], y[count - 1])
+
+    selected = numpy.empty(threshold, dtype=numpy.int64)
+    selected[0], selected[-1] = 0, count - 1
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        # Twice the triangle area, for every point of the bucket at once
+        area = numpy.abs((x[previous] - next_x[bucket]) * (y[start:stop] - y[previous])
+                         - (x[previous] - x[start:stop]) * (next_y[bucket] - y[previous]))
+        previous = start + int(numpy.where(numpy.isnan(area), -1.0, area).argmax())
+        selected[bucket + 1] = previous
+    return selected
+
+
+def _lttb_indices_python(x: Optional[Sequence[float]], y: Sequence[float], threshold: int) -> List[int]:
+    count = len(y)
+    if x is None:
+        x = range(count)
+    step = (count - 2) / (threshold - 2)
+    edges = [int(1 + bucket * step) for bucket in range(threshold - 2)] + [count - 1]
+
+    def average(start: int, stop: int):
+        numbers = [value for value in y[start:stop] if math.isfinite(value)]
+        mean_y = sum(numbers) / len(numbers) if numbers else math.nan
+        return sum(x[start:stop]) / (stop - start), mean_y
+
+    selected = [0]
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        if bucket + 1 < threshold - 2:
+            next_x, next_y = average(stop, edges[bucket + 2])
+        else:
+            next_x, next_y = x[count - 1], y[count - 1]
+        best, best_area = start, -1.0
+        for index in range(start, stop):
+            area = abs((x[previous] - next_x) * (y[index] - y[previous])
+                       - (x[previous] - x[index]) * (next_y - y[previous]))
+            if area > best_area:
+                best, best_area = index, area
+        previous = best
+        selected.append(best)
+    selected.append(count - 1)
+    return selected
+
+
+def minmax_indices(y: Sequence[float], buckets: int) -> Indices:
+    """
+    Keep the first and last point and the lowest and highest point of each of
+    ``buckets`` equal-sized buckets.
+
+    Args:
+        y: Y values, NaN where missing
+        buckets: Number of buckets
+
+    Returns:
+        Indices: Indices of the kept points; every index when the series has
+        at most two points per bucket
+    """
+    count = len(y)
+    if buckets < 1 or 2 * buckets >= count:
+        return numpy.arange(count) if numpy is not None else list(range(count))
+    size = -(-count // buckets)
+    if numpy is None:
+        return _minmax_indices_python(y, size)
+
+    padded = numpy.full(size * buckets, numpy.nan)
+    padded[:count] = y
+    rows = padded.reshape(buckets, size)
+    missing = numpy.isnan(rows)
+    offsets = numpy.arange(buckets) * size
+    low = numpy.where(missing, numpy.inf, rows).argmin(axis=1) + offsets
+    high = numpy.where(missing, -numpy.inf, rows).argmax(axis=1) + offsets
+    indices = numpy.unique(numpy.concatenate((low, high, [0, count - 1])))
+    # Buckets past the end hold only padding
+    return indices[indices < count]
+
+
+def _minmax_indices_python(y: Sequence[float], size: int) -> List[int]:
+    count = len(y)
+    indices = {0, count - 1}
+    for start in range(0, count, size):
+        numbers = [index for index in range(start, min(start + size, count)) if not math.isnan(y[index])]
+        if numbers:
+            indices.add(min(numbers, key=y.__getitem__))
+            indices.add(max(numbers, key=y.__getitem__))
+        else:
+            indices.add(start)
+    return sorted(indices)
+
+
+def downsample_indices(method: str, x: Optional[Sequence[float]], y: Sequence[float], pixels: int) -> Indices:
+    """
+    Reduce a series to what ``pixels`` columns can show: one point per
+    column with LTTB, or the lowest and highest point per column with
+    min/max bucketing.
+
+    Args:
+        method: ``"lttb"`` or ``"minmax"``
+        x: X values in series order, or None for evenly spaced points
+        y: Y values, NaN where missing
+        pixels: Width of the plot in pixels
+
+    Returns:
+        Indices: Sorted indices of the kept points
+    """
+    if method == "lttb":
+        return lttb_indices(x, y, pixels)
+    if method == "minmax":
+        return minmax_indices(y, pixels)
+    raise ValueError(f"Unknown downsampling method {method!r}, expected one of {', '.join(METHODS)}")
@@ -0,0 +1,165 @@
+"""
+Item geometry in pixels.
+
+Item boxes and border widths are given in points. ``item_geometry`` converts
+the boxes of many items at once: it packs them into a NumPy structured array
+and in one vectorized pass converts them to pixels, snaps them to a pixel
+grid and computes the axis-aligned bounds of each rotated box. Edges are
+snapped rather than sizes, so shapes that touch keep touching, and boxes and
+borders that are not empty stay at least one grid step wide. NumPy is used
+when installed; the pure Python version gives the same result.
+"""
+
+import math
+from decimal import Decimal
+from typing import List, NamedTuple, Sequence, Tuple
+
+try:
+    import numpy
+except ImportError:  # Optional: pure Python fallback
+    numpy = None
+
+# 1 pt = 1.33333 px
+POINTS_TO_PIXELS = 1.33333
+
+# (left, top, width, height, border width, rotation), in points and degrees
+Box = Tuple[float, float, float, float, float, float]
+
+
+class ItemGeometry(NamedTuple):
+    """
+    Pixel geometry of one item.
+
+    Attributes:
+        left, top, width, height: Snapped box, in pixels
+        border: Snapped border width, in pixels
+        rotation: Rotation in degrees, as given
+        x0, y0, x1, y1: Axis-aligned bounds of the rotated box
+    """
+    left: float
+    top: float
+    width: float
+    height: float
+    border: float
+    rotation: float
+    x0: float
+    y0: float
+    x1: float
+    y1: float
+
+    @property
+    def bounds(self) -> Tuple[float, float, float, float]:
+        return self.x0, self.y0, self.x1, self.y1
+
+
+_FIELDS = ("left", "top", "width", "height", "border", "rotation")
+
+if numpy is not None:
+    # One record per item, in ItemGeometry field order
+    GEOMETRY_DTYPE = numpy.dtype([(name, numpy.float64) for name in ItemGeometry._fields])
+
+
+def grid_decimals(step: float) -> int:
+    """Decimals needed to write multiples of ``step`` exactly."""
+    return max(-Decimal(repr(step)).normalize().as_tuple().exponent, 0)
+
+
+def format_pixels(value: float) -> str:
+    """Shortest text of a snapped pixel value, without a trailing ``.0``."""
+    text = repr(value)
+    return text[:-2] if text.endswith(".0") else text
+
+
+def item_geometry(boxes: Sequence[Box], step: float) -> List[ItemGeometry]:
+    """
+    Convert item boxes to snapped pixel geometry.
+
+    Args:
+        boxes: (left, top, width, height, border width, rotation) of each
+            item, in points and degrees
+        step: Pixel grid step, e.g. 1 for whole pixels or 0.5 for half pixels
+
+    Returns:
+        List[ItemGeometry]: Geometry of each item, in order
+    """
+    if not boxes:
+        return []
+    decimals = grid_decimals(step)
+    if numpy is None:
+        return [_item_geometry_python(box, step, decimals) for box in boxes]
+
+    packed = numpy.zeros(len(boxes), dtype=GEOMETRY_DTYPE)
+    values = numpy.array(boxes, dtype=numpy.float64)
+    for column, name in enumerate(_FIELDS):
+        packed[name] = values[:, column]
+
+    def snap(pixels):
+        return numpy.round(numpy.round(pixels / step) * step, decimals)
+
+    left, top = packed["left"] * POINTS_TO_PIXELS, packed["top"] * POINTS_TO_PIXELS
+    right = left + packed["width"] * POINTS_TO_PIXELS
+    bottom = top + packed["height"] * POINTS_TO_PIXELS
+    border = packed["border"] * POINTS_TO_PIXELS
+    packed["left"], packed["top"] = snap(left), snap(top)
+    # Differences of snapped edges are rounded again to drop float noise
+    packed["width"] = _at_least_step(numpy.round(snap(right) - packed["left"], decimals), packed["width"], step,
+                                     decimals)
+    packed["height"] = _at_least_step(numpy.round(snap(bottom) - packed["top"], decimals), packed["height"], step,
+                                      decimals)
+    packed["border"] = _at_least_step(snap(border), border, step, decimals)
+
+    # Bounds of the snapped box turned about its center; half turns keep the
+    # box and quarter turns swap its sides exactly
+    rotation = packed["rotation"]
+    turn = numpy.mod(rotation, 180)
+    radians = numpy.radians(rotation)
+    cos, sin = numpy.abs(numpy.cos(radians)), numpy.abs(numpy.sin(radians))
+    cos = numpy.where(turn == 0, 1.0, numpy.where(turn == 90, 0.0, cos))
+    sin = numpy.where(turn == 0, 0.0, numpy.where(turn == 90, 1.0, sin))
+    width, height = packed["width"], packed["height"]
+    half_width = (width * cos + height * sin) / 2
+    half_height = (width * sin + height * cos) / 2
+    center_x, center_y = packed["left"] + width / 2, packed["top"] + height / 2
+    straight = turn == 0
+    packed["x0"] = numpy.where(straight, packed["left"], center_x - half_width)
+    packed["y0"] = numpy.where(straight, packed["top"], center_y - half_height)
+    packed["x1"] = numpy.where(straight, packed["left"] + width, center_x + half_width)
+    packed["y1"] = numpy.where(straight, packed["top"] + height, center_y + half_height)
+
+    return list(map(ItemGeometry._make, packed.tolist()))
+
+
+def _at_least_step(snapped, original, step: float, decimals: int):
+    """Keep sizes that were not zero at one grid step or more."""
+    return numpy.where((original > 0) & (snapped < step), round(step, decimals), snapped)
+
+
+def _item_geometry_python(box: Box, step: float, decimals: int) -> ItemGeometry:
+    def snap(pixels: float) -> float:
+        return round(round(pixels / step) * step, decimals)
+
+    def at_least_step(snapped: float, original: float) -> float:
+        return round(step, decimals) if original > 0 and snapped < step else snapped
+
+    left, top, width, height, border, rotation = map(float, box)
+    x, y = left * POINTS_TO_PIXELS, top * POINTS_TO_PIXELS
+    snapped_left, snapped_top = snap(x), snap(y)
+    snapped_width = at_least_step(round(snap(x + width * POINTS_TO_PIXELS) - snapped_left, decimals), width)
+    snapped_height = at_least_step(round(snap(y + height * POINTS_TO_PIXELS) - snapped_top, decimals), height)
+    border_pixels = border * POINTS_TO_PIXELS
+    snapped_border = at_least_step(snap(border_pixels), border_pixels)
+
+    turn = rotation % 180
+    if turn == 0:
+        bounds = (snapped_left, snapped_top, snapped_left + snapped_width, snapped_top + snapped_height)
+    else:
+        if turn == 90:
+            cos, sin = 0.0, 1.0
+        else:
+            radians = math.radians(rotation)
+            cos, sin = abs(math.cos(radians)), abs(math.sin(radians))
+        half_width = (snapped_width * cos + snapped_height * sin) / 2
+        half_height = (snapped_width * sin + snapped_height * cos) / 2
+        center_x, center_y = snapped_left + snapped_width / 2, snapped_top + snapped_height / 2
+        bounds = (center_x - half_width, center_y - half_height, center_x + half_width, center_y + half_height)
+    return ItemGeometry(snapped_left, snapped_top, snapped_width, snapped_height, snapped_border, rotation, *bounds)
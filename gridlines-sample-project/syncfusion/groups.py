@@ -0,0 +1,212 @@
+"""
+Flattening of group shapes.
+
+A group element lists its children under ``items`` (or ``Items``), placed in
+the group's child coordinate space: ``ChildLeft``, ``ChildTop``,
+``ChildWidth`` and ``ChildHeight`` (points), which default to the group's own
+box, so children given in slide coordinates stay where they are. The group
+maps that space onto its ``Left``/``Top``/``Width``/``Height`` box and turns
+it by ``Rotation`` degrees about the box center. Groups nest.
+
+Each group's mapping is a 3x3 affine matrix. The matrices are composed with
+their parents' one tree level at a time, over every group of the level at
+once, and all leaf boxes are then mapped in one batch. Leaves come out as
+flat elements with absolute ``Left``/``Top``/``Width``/``Height`` and
+``Rotation``, in paint order, so deep groups do not become nested DOM.
+NumPy is used when installed; the pure Python version gives the same result.
+"""
+
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy
+except ImportError:  # Optional: pure Python fallback
+    numpy = None
+
+# Row-major 3x3 affine matrix
+Matrix = Tuple[float, float, float, float, float, float, float, float, float]
+
+_IDENTITY: Matrix = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0)
+
+# Box of an element without one, as in the SlideItem defaults
+_DEFAULT_BOX = {"Left": 0.0, "Top": 0.0, "Width": 100.0, "Height": 50.0}
+
+# Leaf fields replaced when a leaf is moved
+_LEAF_KEYS = tuple(_DEFAULT_BOX) + ("Rotation",)
+
+
+def group_children(element: Any) -> Optional[List[Any]]:
+    """Children of a group element, or None if it is not a group."""
+    if not isinstance(element, dict) or ("items" not in element and "Items" not in element):
+        return None
+    return element.get("items") or element.get("Items") or []
+
+
+def _as_float(value: Any) -> Optional[float]:
+    """``value`` as a float, or None if it is missing or not a number."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _number(element: Dict[str, Any], key: str, default: float) -> float:
+    """Numeric field of an element; missing or malformed values give ``default``."""
+    value = _as_float(element.get(key))
+    return default if value is None else value
+
+
+def _has_bad_number(element: Dict[str, Any], keys: Sequence[str]) -> bool:
+    return any(element.get(key) is not None and _as_float(element.get(key)) is None for key in keys)
+
+
+def _local_matrix(group: Dict[str, Any]) -> Matrix:
+    """Matrix mapping a group's child space onto its box on the parent."""
+    left, top, width, height = (_number(group, key, default) for key, default in _DEFAULT_BOX.items())
+    child_left = _number(group, "ChildLeft", left)
+    child_top = _number(group, "ChildTop", top)
+    child_width = _number(group, "ChildWidth", width)
+    child_height = _number(group, "ChildHeight", height)
+    scale_x = width / child_width if child_width else 1.0
+    scale_y = height / child_height if child_height else 1.0
+    offset_x = left - scale_x * child_left
+    offset_y = top - scale_y * child_top
+    angle = math.radians(_number(group, "Rotation", 0.0))
+    if not angle:
+        return (scale_x, 0.0, offset_x, 0.0, scale_y, offset_y, 0.0, 0.0, 1.0)
+    # Rotate the scaled space about the center of the box
+    cos, sin = math.cos(angle), math.sin(angle)
+    center_x, center_y = left + width / 2, top + height / 2
+    return (cos * scale_x, -sin * scale_y, cos * offset_x - sin * offset_y + center_x - cos * center_x + sin * center_y,
+            sin * scale_x, cos * scale_y, sin * offset_x + cos * offset_y + center_y - sin * center_x - cos * center_y,
+            0.0, 0.0, 1.0)
+
+
+def _collect(group: Dict[str, Any]) -> Tuple[List[Matrix], List[int], List[List[int]], List[Tuple[Any, int]]]:
+    """
+    Walk a group tree once.
+
+    Returns:
+        Tuple: Local matrix and parent index of every group (-1 for the
+        root), group indices per tree level, and the leaves in paint order
+        with the index of the group that holds them
+    """
+    matrices, parents, levels, leaves = [], [], [], []
+    pending = [(group, -1, 0)]
+    while pending:
+        element, parent, depth = pending.pop()
+        children = group_children(element)
+        if children is None:
+            leaves.append((element, parent))
+            continue
+        index = len(matrices)
+        matrices.append(_local_matrix(element))
+        parents.append(parent)
+        if depth == len(levels):
+            levels.append([])
+        levels[depth].append(index)
+        # Reversed, so children are taken from the stack in order
+        pending.extend((child, index, depth + 1) for child in reversed(children))
+    return matrices, parents, levels, leaves
+
+
+def _multiply(a: Sequence[float], b: Sequence[float]) -> Matrix:
+    return tuple(sum(a[row * 3 + k] * b[k * 3 + column] for k in range(3))
+                 for row in range(3) for column in range(3))
+
+
+def _compose(matrices: List[Matrix], parents: List[int], levels: List[List[int]]) -> Any:
+    """Absolute matrix of every group: its parent's absolute matrix times its own."""
+    if numpy is not None:
+        local = numpy.array(matrices, dtype=numpy.float64).reshape(-1, 3, 3)
+        absolute = local.copy()
+        parent_of = numpy.array(parents)
+        for level in levels[1:]:
+            level = numpy.array(level)
+            absolute[level] = numpy.matmul(absolute[parent_of[level]], local[level])
+        return absolute.reshape(-1, 9)
+    absolute = list(matrices)
+    for level in levels[1:]:
+        for index in level:
+            absolute[index] = _multiply(absolute[parents[index]], matrices[index])
+    return absolute
+
+
+def _place(boxes: List[Tuple[float, float, float, float, float]], transforms: Any) -> List[Tuple[float, ...]]:
+    """
+    Map leaf boxes (left, top, width, height, rotation) through their group
+    matrices. Unrotated mappings scale and move the box edges; rotated ones
+    move the box center and add the angle to the leaf's rotation.
+    """
+    if numpy is not None:
+        left, top, width, height, rotation = numpy.array(boxes, dtype=numpy.float64).T
+        m = numpy.asarray(transforms)
+        rotated = (m[:, 1] != 0) | (m[:, 3] != 0)
+        # Unrotated: scale and move the edges, so identity mappings are exact
+        x0, x1 = m[:, 0] * left + m[:, 2], m[:, 0] * (left + width) + m[:, 2]
+        y0, y1 = m[:, 4] * top + m[:, 5], m[:, 4] * (top + height) + m[:, 5]
+        # Rotated: move the center, scale by the length of each mapped axis
+        center_x, center_y = left + width / 2, top + height / 2
+        scale_x, scale_y = numpy.hypot(m[:, 0], m[:, 3]), numpy.hypot(m[:, 1], m[:, 4])
+        new_width = numpy.where(rotated, width * scale_x, numpy.abs(x1 - x0))
+        new_height = numpy.where(rotated, height * scale_y, numpy.abs(y1 - y0))
+        mapped_x = m[:, 0] * center_x + m[:, 1] * center_y + m[:, 2]
+        mapped_y = m[:, 3] * center_x + m[:, 4] * center_y + m[:, 5]
+        new_left = numpy.where(rotated, mapped_x - new_width / 2, numpy.minimum(x0, x1))
+        new_top = numpy.where(rotated, mapped_y - new_height / 2, numpy.minimum(y0, y1))
+        angle = numpy.where(rotated, rotation + numpy.degrees(numpy.arctan2(m[:, 3], m[:, 0])), rotation)
+        return list(zip(new_left.tolist(), new_top.tolist(), new_width.tolist(), new_height.tolist(),
+                        angle.tolist()))
+    placed = []
+    for (left, top, width, height, rotation), m in zip(boxes, transforms):
+        if m[1] == 0 and m[3] == 0:
+            x0, x1 = m[0] * left + m[2], m[0] * (left + width) + m[2]
+            y0, y1 = m[4] * top + m[5], m[4] * (top + height) + m[5]
+            placed.append((min(x0, x1), min(y0, y1), abs(x1 - x0), abs(y1 - y0), rotation))
+            continue
+        center_x, center_y = left + width / 2, top + height / 2
+        new_width, new_height = width * math.hypot(m[0], m[3]), height * math.hypot(m[1], m[4])
+        placed.append((m[0] * center_x + m[1] * center_y + m[2] - new_width / 2,
+                       m[3] * center_x + m[4] * center_y + m[5] - new_height / 2,
+                       new_width, new_height, rotation + math.degrees(math.atan2(m[3], m[0]))))
+    return placed
+
+
+def flatten_group(group: Dict[str, Any]) -> List[Any]:
+    """
+    Flatten a group tree into its leaf elements with absolute geometry.
+
+    Leaves whose groups all map their child space unchanged are returned as
+    they are; others are copied with their ``Left``, ``Top``, ``Width``,
+    ``Height`` and ``Rotation`` replaced. Elements that are not dicts, and
+    leaves whose own box fields are not numbers, are returned unchanged, so
+    they fail validation on their own. Malformed numbers on a group fall
+    back to the field's default rather than dropping its children.
+
+    Args:
+        group: Decoded group element, with an ``items`` or ``Items`` list
+
+    Returns:
+        List[Any]: Leaf elements in paint order
+    """
+    matrices, parents, levels, leaves = _collect(group)
+    transforms = _compose(matrices, parents, levels)
+    moved = [position for position, (element, parent) in enumerate(leaves)
+             if isinstance(element, dict) and tuple(transforms[parent]) != _IDENTITY
+             and not _has_bad_number(element, _LEAF_KEYS)]
+    if not moved:
+        return [element for element, _ in leaves]
+    boxes = []
+    for position in moved:
+        element = leaves[position][0]
+        boxes.append(tuple(_number(element, key, default) for key, default in _DEFAULT_BOX.items())
+                     + (_number(element, "Rotation", 0.0),))
+    flattened = [element for element, _ in leaves]
+    placed = _place(boxes, [transforms[leaves[position][1]] for position in moved])
+    for position, (left, top, width, height, rotation) in zip(moved, placed):
+        flattened[position] = dict(flattened[position], Left=left, Top=top, Width=width, Height=height,
+                                   Rotation=rotation % 360)
+    return flattened
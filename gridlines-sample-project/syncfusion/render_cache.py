@@ -0,0 +1,170 @@
+"""
+Content-addressed on-disk cache for rendered JSX fragments.
+
+Entries live in a SQLite database so that several worker processes can share
+one cache directory safely. The total size of the stored fragments is capped,
+and the least recently used entries are evicted first.
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access);
+CREATE TABLE IF NOT EXISTS stats (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO stats (name, value) VALUES ('hits', 0), ('misses', 0), ('evictions', 0), ('bytes', 0);
+"""
+
+# SQLite limits the number of bound parameters per statement
+_MAX_BATCH = 500
+
+
+def cache_key(version: str, canonical: str) -> str:
+    """Hash a canonical item serialization together with the converter version."""
+    digest = hashlib.sha256(version.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(canonical.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """
+    Persistent key/value cache of rendered fragments with LRU eviction.
+
+    Hit, miss and eviction counters are kept both for this instance and,
+    cumulatively, in the database so totals cover every worker process.
+
+    Args:
+        directory: Cache directory, created if missing
+        max_bytes: Size cap for the stored fragments (UTF-8 bytes)
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024):
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, "render_cache.sqlite3")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._connection = None
+        self._pid = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        # Connections must not cross a fork, so each process opens its own
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+            self._pid = os.getpid()
+            # Apply a cap that was lowered since the cache was last written
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                if connection.execute("SELECT value FROM stats WHERE name = 'bytes'").fetchone()[0] > self.max_bytes:
+                    self._evict()
+        return self._connection
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """Look up several keys at once and mark the hits as recently used."""
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        for start in range(0, len(keys), _MAX_BATCH):
+            batch = keys[start:start + _MAX_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            rows = self.connection.execute(
+                f"SELECT key, value FROM entries WHERE key IN ({placeholders})", batch
+            ).fetchall()
+            found.update(rows)
+
+        hits = len(found)
+        misses = len(keys) - hits
+        self.hits += hits
+        self.misses += misses
+        now = time.time()
+        with self.connection:
+            self.connection.execute("BEGIN IMMEDIATE")
+            self.connection.executemany(
+                "UPDATE entries SET last_access = ? WHERE key = ?", ((now, key) for key in found)
+            )
+            self.connection.executemany(
+                "UPDATE stats SET value = value + ? WHERE name = ?", ((hits, "hits"), (misses, "misses"))
+            )
+        return found
+
+    def get(self, key: str) -> Optional[str]:
+        return self.get_many([key]).get(key)
+
+    def put_many(self, entries: Dict[str, str]) -> None:
+        """Store several fragments, then evict down to the size cap."""
+        if not entries:
+            return
+        now = time.time()
+        rows = [(key, value, len(value.encode("utf-8")), now) for key, value in entries.items()]
+        with self.connection:
+            self.connection.execute("BEGIN IMMEDIATE")
+            # Track the total size incrementally so the eviction scan only
+            # runs when the cap is actually exceeded
+            replaced = 0
+            for start in range(0, len(rows), _MAX_BATCH):
+                batch = [row[0] for row in rows[start:start + _MAX_BATCH]]
+                placeholders = ",".join("?" * len(batch))
+                replaced += self.connection.execute(
+                    f"SELECT COALESCE(SUM(size), 0) FROM entries WHERE key IN ({placeholders})", batch
+                ).fetchone()[0]
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO entries (key, value, size, last_access) VALUES (?, ?, ?, ?)", rows
+            )
+            total = self.connection.execute(
+                "UPDATE stats SET value = value + ? WHERE name = 'bytes' RETURNING value",
+                (sum(row[2] for row in rows) - replaced,),
+            ).fetchone()[0]
+            if total > self.max_bytes:
+                self._evict()
+
+    def put(self, key: str, value: str) -> None:
+        self.put_many({key: value})
+
+    def _evict(self) -> None:
+        # Keep the most recently used entries whose cumulative size fits
+        evicted = self.connection.execute(
+            """
+            DELETE FROM entries WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, SUM(size) OVER (ORDER BY last_access DESC, key) AS running
+                    FROM entries
+                ) WHERE running > ?
+            )
+            """,
+            (self.max_bytes,),
+        ).rowcount
+        if evicted:
+            self.evictions += evicted
+            self.connection.execute("UPDATE stats SET value = value + ? WHERE name = 'evictions'", (evicted,))
+        self.connection.execute(
+            "UPDATE stats SET value = (SELECT COALESCE(SUM(size), 0) FROM entries) WHERE name = 'bytes'"
+        )
+
+    def totals(self) -> Dict[str, int]:
+        """Cumulative counters across every process that used this cache."""
+        totals = dict(self.connection.execute("SELECT name, value FROM stats").fetchall())
+        totals["entries"] = self.connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        return totals
+
+    def close(self) -> None:
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
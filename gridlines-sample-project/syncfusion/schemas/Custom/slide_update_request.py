@@ -2,10 +2,13 @@ from __future__ import annotations
 
 from typing import Optional
 
-from models import CustomBaseModel
+from syncfusion.base64_payload import Base64Payload
+from syncfusion.schemas import presentation
+from syncfusion.utils import CustomBaseModel
 
 
 class SlideUpdateRequest(CustomBaseModel):
-    PptxBase64String: Optional[str] = None
+    PptxBase64String: Optional[Base64Payload] = None
     PresentationTemplate: Optional[str] = None
-    Presentation: Optional[Presentation] = None
+    # Module-qualified: the field name shadows the class inside the class body
+    Presentation: Optional[presentation.Presentation] = None
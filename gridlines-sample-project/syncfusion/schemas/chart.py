@@ -1,5 +1,6 @@
 
 from enum import Enum
+from typing import List, Optional
 
 from syncfusion.utils import CustomBaseModel
 
@@ -108,13 +108,13 @@ class PatternFillType(str, Enum):
 
 
 class SolidFill(SyncfusionBaseModel):
-    Color: Annotated[Optional[Color], Optional[str], Field(default=None)]  # The color of the solid fill
+    Color: Annotated[Optional[Color | str], Field(default=None)]  # The color of the solid fill
     Transparency: Optional[int] = 0
 
 
 class GradientStop(SyncfusionBaseModel):
     Brightness: Optional[float] = None
-    Color: Annotated[Optional[Color], Optional[str], Field(default=None)]
+    Color: Annotated[Optional[Color | str], Field(default=None)]
     Position: Optional[float] = None
     Transparency: Optional[int] = None
 
@@ -274,10 +274,10 @@ class TextUnderlineType(str, Enum):
 class Font(SyncfusionBaseModel):
     Bold: Optional[bool] = None  # Indicates if the text is bold
     CapsType: Optional[TextCapsType] = None  # Type of capitalization
-    Color: Annotated[Optional[Color], Optional[str], Field(default=None)]  # Default black color
+    Color: Annotated[Optional[Color | str], Field(default=None)]  # Default black color
     FontName: Optional[str] = None  # Name of the font
     FontSize: Optional[float] = None  # Size of the font
-    HighlightColor: Annotated[Optional[Color], Optional[str], Field(default=None)]  # Highlight color of the text
+    HighlightColor: Annotated[Optional[Color | str], Field(default=None)]  # Highlight color of the text
     Italic: Optional[bool] = None  # Indicates if the text is italic
     LanguageID: Optional[int] = None
     StrikeType: Optional[str] = None  # Type of strikethrough
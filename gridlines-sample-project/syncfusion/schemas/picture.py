@@ -4,7 +4,8 @@ from typing import Annotated, Optional
 
 from pydantic import Field
 
-from .core import SlideItem, SlideItemType, SyncfusionBaseModel
+from . import core
+from .core import SlideItem, SyncfusionBaseModel
 
 
 class Crop(SyncfusionBaseModel):
@@ -19,7 +20,8 @@ class Crop(SyncfusionBaseModel):
 
 
 class Picture(SlideItem):
-    SlideItemType: SlideItemType = SlideItemType.PICTURE
+    # Qualified: under postponed annotations a bare name resolves to this class
+    SlideItemType: core.SlideItemType = core.SlideItemType.PICTURE
     Crop: Annotated[Optional[Crop], Field(default=None)]
     ImageData: str
     FallbackImageData: Optional[str] = None
@@ -1,14 +1,65 @@
 from __future__ import annotations
 
 import logging
-from typing import List, Optional
+from collections.abc import Sequence
+from typing import Any, Dict, List, Optional
 
+from pydantic import field_serializer, field_validator
+
+from ..base64_payload import Base64Payload
 from .core import SyncfusionBaseModel
 from .slide import Slide
 
 logger = logging.getLogger(__name__)
 
 
+class LazySlides(Sequence):
+    """
+    Read-only sequence of slides that validates each raw slide dict the first
+    time it is accessed, so callers that need one slide (or only the count)
+    skip validating the rest of the deck.
+
+    Args:
+        raw_slides: Unvalidated slide data, in slide order
+    """
+
+    def __init__(self, raw_slides: List[Any]):
+        self._raw = raw_slides
+        self._slides: List[Optional[Slide]] = [None] * len(raw_slides)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = range(len(self))[index]
+        slide = self._slides[index]
+        if slide is None:
+            slide = self._slides[index] = Slide.model_validate(self._raw[index])
+        return slide
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (LazySlides, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LazySlides({self.validated_count} of {len(self)} validated)"
+
+    @property
+    def validated_count(self) -> int:
+        """Number of slides validated so far."""
+        return sum(slide is not None for slide in self._slides)
+
+    def is_validated(self, index: int) -> bool:
+        return self._slides[index] is not None
+
+    def raw(self, index: int) -> Any:
+        """Unvalidated data of a slide."""
+        return self._raw[index]
+
+
 class Presentation(SyncfusionBaseModel):
     # BuiltInDocumentProperties: Optional[IBuiltInDocumentProperties] = None
     # CustomDocumentProperties: Optional[ICustomDocumentProperties] = None
@@ -25,13 +76,44 @@ class Presentation(SyncfusionBaseModel):
     IsWriteProtected: bool = False
     Slides: List[Slide] = []
     PresentationTemplate: Optional[str] = None
-    PptxBase64String: Optional[str] = None
+    # Decoded into a spool file on validation; the model keeps only a handle
+    PptxBase64String: Optional[Base64Payload] = None
 
     def __init__(self, **data):
-        logger.debug(f"Initializing Presentation with data: {data}")
+        # Lazy formatting: the data may hold a whole base64-encoded .pptx
+        logger.debug("Initializing Presentation with data: %s", data)
         try:
             super().__init__(**data)
         except Exception as e:
             logger.error(f"Error initializing Presentation: {str(e)}")
             logger.error(f"Slides data: {data.get('Slides', [])}")
             raise
+
+    @field_validator("Slides", mode="wrap")
+    @classmethod
+    def _lazy_slides(cls, value: Any, handler: Any) -> Any:
+        # Deferred slides are validated on access instead
+        if isinstance(value, LazySlides):
+            return value
+        return handler(value)
+
+    @field_serializer("Slides", mode="wrap")
+    def _serialize_slides(self, value: Any, handler: Any) -> Any:
+        if isinstance(value, LazySlides):
+            value = list(value)
+        return handler(value)
+
+    @classmethod
+    def lazy(cls, data: Dict[str, Any]) -> "Presentation":
+        """
+        Validate a presentation but defer each slide until it is accessed.
+
+        ``Slides`` becomes a ``LazySlides`` sequence; everything else is
+        validated as usual.
+
+        Args:
+            data: Raw presentation data
+        """
+        data = dict(data)
+        data["Slides"] = LazySlides(data.get("Slides") or [])
+        return cls(**data)
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Optional
+from typing import Annotated, Optional
+
+from pydantic import Field
 
 from syncfusion.utils import CustomBaseModel
 
-from .core import SlideItem, SlideItemType
+from .core import SlideItem, SlideItemType, TextBody
 
 
 class PlaceholderType(str, Enum):
@@ -206,8 +208,8 @@ class AutoShapeType(str, Enum):
 class Shape(SlideItem):  # Inherits from SlideItem
     SlideItemType: SlideItemType = SlideItemType.AUTOSHAPE  # Add default value
     AutoShapeType: "AutoShapeType"  # Use string for forward reference
-    Fill: Optional["Fill"] = None  # Use string for forward reference
-    TextBody: Optional["TextBody"] = None  # Use string for forward reference
+    Fill: Annotated[Optional["Fill"], Field(default=None)]  # Use string for forward reference
+    TextBody: Annotated[Optional[TextBody], Field(default=None)]
     Rotation: Optional[int] = 0
 
 
@@ -217,7 +219,7 @@ class SolidFill(CustomBaseModel):
 
 class Fill(CustomBaseModel):
     FillType: str = "Solid"  # Add default value
-    SolidFill: Optional[SolidFill] = None
+    SolidFill: Annotated[Optional[SolidFill], Field(default=None)]
 
 
 # Rebuild the model
@@ -5,7 +5,8 @@ from typing import Annotated, List, Optional
 
 from pydantic import Field
 
-from .core import LineFormat, SlideItem, SyncfusionBaseModel, Fill, TextBody, SlideItemType
+from . import core
+from .core import LineFormat, SlideItem, SyncfusionBaseModel, Fill, TextBody
 
 
 class BuiltInTableStyle(str, Enum):
@@ -113,7 +114,8 @@ class TableRow(SyncfusionBaseModel):
 
 
 class Table(SlideItem):
-    SlideItemType: SlideItemType = SlideItemType.TABLE
+    # Qualified: under postponed annotations a bare name resolves to this class
+    SlideItemType: core.SlideItemType = core.SlideItemType.TABLE
     BuiltInStyle: Optional[BuiltInTableStyle] = None
     HasBandedColumns: Optional[bool] = None
     HasBandedRows: Optional[bool] = None
@@ -0,0 +1,150 @@
+"""
+Incremental JSON array reader.
+
+Decodes the elements of a top-level JSON array (or of a list stored under one
+of a set of wrapper keys in a top-level object) one at a time, so that memory
+stays bounded by the largest single element instead of the whole document.
+"""
+
+import json
+from typing import Any, Iterable, Iterator, Optional, TextIO
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_START = "-0123456789"
+_NUMBER_CHARS = "0123456789.eE+-"
+_DEFAULT_CHUNK_SIZE = 1 << 16
+
+_decoder = json.JSONDecoder()
+
+
+class _Reader:
+    """Sliding text buffer over a file object."""
+
+    def __init__(self, stream: TextIO, chunk_size: int = _DEFAULT_CHUNK_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, min_size: int = 0) -> bool:
+        """Read at least one more chunk; returns False at end of file."""
+        if self.eof:
+            return False
+        if self.pos:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        chunk = self.stream.read(max(self.chunk_size, min_size))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer += chunk
+        return True
+
+    def peek(self) -> Optional[str]:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return None
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if char is None or char not in chars:
+            raise ValueError(f"Expected one of {chars!r} at offset {self.pos}, got {char!r}")
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value, reading more input as needed."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # Grow the read size with the pending value so very large
+                # elements do not degrade into quadratic re-parsing
+                if not self.fill(len(self.buffer) - self.pos):
+                    raise
+                continue
+            # A number running up to the end of the buffer may continue in
+            # the next chunk (e.g. "-2." followed by "5e3")
+            if not self.eof and self.buffer[self.pos] in _NUMBER_START:
+                tail = end
+                while tail < len(self.buffer) and self.buffer[tail] in _NUMBER_CHARS:
+                    tail += 1
+                if tail == len(self.buffer):
+                    self.fill()
+                    continue
+            self.pos = end
+            return value
+
+
+def _iter_array(reader: _Reader) -> Iterator[Any]:
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.pos += 1
+        return
+    while True:
+        yield reader.value()
+        if reader.expect(",]") == "]":
+            return
+
+
+def iter_json_array(
+    stream: TextIO,
+    wrapper_keys: Iterable[str] = (),
+    chunk_size: int = _DEFAULT_CHUNK_SIZE,
+) -> Iterator[Any]:
+    """
+    Yield the elements of a JSON array one at a time.
+
+    If the document is an object, the first key (in document order) found in
+    ``wrapper_keys`` whose value is an array is streamed instead. The values
+    ahead of it are decoded one at a time and dropped. An object without
+    such a key is yielded as a single element: it is read again from the
+    start of a seekable stream, and only the values of an unseekable one
+    are kept while scanning. Any other scalar document is yielded as-is.
+
+    Args:
+        stream: Text file object positioned at the start of the document
+        wrapper_keys: Object keys that may hold the item list
+        chunk_size: Number of characters read per refill
+
+    Returns:
+        Iterator over the decoded elements
+    """
+    start = stream.tell() if stream.seekable() else None
+    reader = _Reader(stream, chunk_size)
+    first = reader.peek()
+    if first == "[":
+        yield from _iter_array(reader)
+        return
+    if first != "{":
+        yield reader.value()
+        return
+
+    wrapper_keys = set(wrapper_keys)
+    skipped = {} if start is None else None
+    reader.expect("{")
+    if reader.peek() == "}":
+        yield {}
+        return
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        if key in wrapper_keys and reader.peek() == "[":
+            yield from _iter_array(reader)
+            return
+        value = reader.value()
+        if skipped is not None:
+            skipped[key] = value
+        if reader.expect(",}") == "}":
+            break
+    if skipped is None:
+        stream.seek(start)
+        skipped = _Reader(stream, chunk_size).value()
+    yield skipped
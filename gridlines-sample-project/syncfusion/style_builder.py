@@ -0,0 +1,64 @@
+"""
+Keyed, ordered inline style for generated JSX elements.
+
+Replaces lists of ``"key: 'value'"`` strings, which had to be rescanned (and
+re-split) to answer questions such as "is a background set yet?".
+"""
+
+from typing import Dict, Iterable, Iterator, Mapping, Optional, Tuple, Union
+
+StyleValue = Union[str, int, float]
+
+
+class StyleBuilder:
+    """
+    Ordered mapping of style properties, serialized once into the body of a
+    JSX style object.
+
+    Setting an existing property replaces its value in place, which matches
+    how a JavaScript object literal with a repeated key evaluates. String
+    values are emitted quoted (``left: '12px'``); numbers are emitted as-is
+    (``zIndex: 3``).
+
+    Args:
+        props: Initial properties, in order
+    """
+
+    __slots__ = ("_props",)
+
+    def __init__(self, props: Optional[Union[Mapping[str, StyleValue], Iterable[Tuple[str, StyleValue]]]] = None):
+        self._props: Dict[str, StyleValue] = dict(props or ())
+
+    def set(self, name: str, value: StyleValue) -> "StyleBuilder":
+        self._props[name] = value
+        return self
+
+    def setdefault(self, name: str, value: StyleValue) -> StyleValue:
+        """Set a property only if it is not set yet; returns the effective value."""
+        return self._props.setdefault(name, value)
+
+    def update(self, props: Union[Mapping[str, StyleValue], Iterable[Tuple[str, StyleValue]]]) -> "StyleBuilder":
+        self._props.update(props)
+        return self
+
+    def get(self, name: str, default: Optional[StyleValue] = None) -> Optional[StyleValue]:
+        return self._props.get(name, default)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._props
+
+    def __len__(self) -> int:
+        return len(self._props)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._props)
+
+    def __repr__(self) -> str:
+        return f"StyleBuilder({self._props!r})"
+
+    def serialize(self, separator: str = ", ") -> str:
+        """Render the properties as the body of a JSX ``style={{ ... }}`` object."""
+        return separator.join(
+            f"{name}: '{value}'" if isinstance(value, str) else f"{name}: {value}"
+            for name, value in self._props.items()
+        )
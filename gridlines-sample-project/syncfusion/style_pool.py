@@ -0,0 +1,150 @@
+"""
+Interning of repeated inline JSX styles.
+
+Rendered fragments repeat the same ``style={{ ... }}`` literals (every span of
+a text box usually shares one font style), which bloats the bundle and makes
+React allocate a fresh style object per node on every render. ``StylePool``
+rewrites repeated literals to shared module-level ``const`` objects or to
+generated CSS classes.
+
+The pass runs over output as it is streamed, so a style is shared from its
+second occurrence on; its first occurrence stays inline.
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+# An optional className attribute directly before a style object literal
+_STYLE_ATTRIBUTE = re.compile(r'(?:className="([^"]*)"\s+)?style=\{\{(.*?)\}\}', re.S)
+_STYLE_PROPERTY = re.compile(r"\s*(\w+):\s*('(?:[^'\\]|\\.)*'|[^,]+?)\s*(?:,|$)", re.S)
+# A style attribute rewritten to a shared constant
+_CONST_REFERENCE = re.compile(r"\bstyle=\{(S\d+)\}")
+
+MODES = ("const", "class")
+
+
+def _normalize(body: str) -> str:
+    # Multi-line style objects differ from single-line ones only in indentation
+    return re.sub(r"\s*\n\s*", " ", body.strip())
+
+
+def style_to_css(body: str) -> List[Tuple[str, str]]:
+    """
+    Convert the body of a JSX style object to CSS declarations.
+
+    Returns:
+        List[Tuple[str, str]]: (property, value) pairs, e.g. ("font-size", "12px")
+    """
+    declarations = []
+    for match in _STYLE_PROPERTY.finditer(body):
+        name, value = match.groups()
+        if value.startswith("'"):
+            value = value[1:-1].replace("\\'", "'")
+        declarations.append((re.sub(r"([A-Z])", r"-\1", name).lower(), value))
+    return declarations
+
+
+class StylePool:
+    """
+    Shares repeated style literals across one output module.
+
+    Args:
+        mode: ``"const"`` hoists shared styles into module-level constants
+            (``style={S1}``); ``"class"`` moves them into CSS classes that are
+            merged into the element's ``className``
+    """
+
+    def __init__(self, mode: str = "const"):
+        if mode not in MODES:
+            raise ValueError(f"Unknown style dedupe mode {mode!r}, expected one of {MODES}")
+        self.mode = mode
+        self._seen: Dict[str, int] = {}
+        self._names: Dict[str, str] = {}
+        self.literals = 0
+        self.shared = 0
+        # Output size of the rewritten literals before and after the pass
+        self.bytes_before = 0
+        self.bytes_after = 0
+
+    def _name_for(self, body: str) -> str:
+        name = self._names.get(body)
+        if name is None:
+            index = len(self._names) + 1
+            name = self._names[body] = f"S{index}" if self.mode == "const" else f"sfs-{index}"
+        return name
+
+    def _replace(self, match: "re.Match") -> str:
+        class_name, body = match.groups()
+        body = _normalize(body)
+        if not body:
+            return match.group(0)
+        self.literals += 1
+        seen = self._seen.get(body, 0)
+        self._seen[body] = seen + 1
+        if not seen:
+            return match.group(0)
+        if self.mode == "class" and not style_to_css(body):
+            return match.group(0)
+
+        name = self._name_for(body)
+        if self.mode == "const":
+            prefix = match.group(0)[:match.start(2) - match.start(0) - len("style={{")]
+            replacement = f"{prefix}style={{{name}}}"
+        elif class_name is not None:
+            replacement = f'className="{class_name} {name}"'
+        else:
+            replacement = f'className="{name}"'
+        self.shared += 1
+        self.bytes_before += len(match.group(0).encode("utf-8"))
+        self.bytes_after += len(replacement.encode("utf-8"))
+        return replacement
+
+    def rewrite(self, jsx: str) -> str:
+        """Rewrite the repeated style literals in a piece of JSX."""
+        return _STYLE_ATTRIBUTE.sub(self._replace, jsx)
+
+    def rewrite_all(self, fragments: Iterable[str]) -> Iterator[str]:
+        for fragment in fragments:
+            yield self.rewrite(fragment) if fragment else fragment
+
+    def const_declarations(self, exported: bool = False) -> str:
+        """
+        Module-level constants for the shared styles (``const`` mode).
+
+        Args:
+            exported: Declare them with ``export`` for a shared module that
+                other modules import them from
+        """
+        if self.mode != "const" or not self._names:
+            return ""
+        keyword = "export const" if exported else "const"
+        lines = ["// Shared inline styles"]
+        lines.extend(f"{keyword} {name} = {{ {body} }};" for body, name in self._names.items())
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def referenced_consts(jsx: str) -> List[str]:
+        """Names of the shared style constants a rewritten piece of JSX uses, sorted."""
+        return sorted(set(_CONST_REFERENCE.findall(jsx)), key=lambda name: int(name[1:]))
+
+    def css_rules(self) -> str:
+        """CSS rules for the shared styles (``class`` mode)."""
+        if self.mode != "class" or not self._names:
+            return ""
+        rules = ["\n/* Shared styles extracted from the generated components */"]
+        for body, name in self._names.items():
+            declarations = " ".join(f"{prop}: {value};" for prop, value in style_to_css(body))
+            # Two-class selectors outrank the element rules above, as the
+            # inline styles they replace did
+            rules.append(f".syncfusion-slide .{name}, .syncfusion-slide.{name} {{ {declarations} }}")
+        return "\n".join(rules) + "\n"
+
+    @property
+    def bytes_saved(self) -> int:
+        """Net bytes saved, including the emitted constants or CSS rules."""
+        overhead = len(self.const_declarations().encode("utf-8")) + len(self.css_rules().encode("utf-8"))
+        return self.bytes_before - self.bytes_after - overhead
+
+    def summary(self) -> str:
+        return (f"Style dedupe ({self.mode}): {self.shared} of {self.literals} style literals shared "
+                f"as {len(self._names)} styles, {self.bytes_saved} bytes saved")
@@ -0,0 +1,59 @@
+"""
+SVG path geometry for polygonal AutoShapes.
+
+Shape outlines are defined once per AutoShapeType as CSS ``polygon()`` clip
+paths in percentages of the shape box. They are parsed once into unit-square
+points and scaled per instance into SVG path data, so a slide's vector shapes
+can be drawn as real paths (with fills and strokes that follow the outline)
+instead of clipped boxes.
+"""
+
+import functools
+import re
+from typing import Tuple
+
+# (x, y) fractions of the shape box
+UnitPolygon = Tuple[Tuple[float, float], ...]
+
+_POLYGON = re.compile(r"^\s*polygon\((.*)\)\s*$", re.S)
+
+
+def _fraction(value: str) -> float:
+    value = value.strip()
+    if value.endswith("%"):
+        return float(value[:-1]) / 100
+    if float(value) != 0:
+        raise ValueError(f"Only percentages (or 0) are supported in shape outlines, got {value!r}")
+    return 0.0
+
+
+@functools.lru_cache(maxsize=None)
+def unit_polygon(clip_path: str) -> UnitPolygon:
+    """
+    Parse a CSS ``polygon()`` of percentages into unit-square points.
+
+    Raises:
+        ValueError: If the clip path is not a percentage polygon
+    """
+    match = _POLYGON.match(clip_path)
+    if match is None:
+        raise ValueError(f"Not a polygon() clip path: {clip_path!r}")
+    points = []
+    for vertex in match.group(1).split(","):
+        x, y = vertex.split()
+        points.append((_fraction(x), _fraction(y)))
+    return tuple(points)
+
+
+def format_coordinate(value: float) -> str:
+    """Format a pixel value compactly; two decimals are below a device pixel at any practical zoom."""
+    return f"{value:.2f}".rstrip("0").rstrip(".")
+
+
+def polygon_path(points: UnitPolygon, left: float, top: float, width: float, height: float) -> str:
+    """Scale unit-square points to a shape box and format them as SVG path data."""
+    commands = [
+        f"{'M' if index == 0 else 'L'}{format_coordinate(left + x * width)} {format_coordinate(top + y * height)}"
+        for index, (x, y) in enumerate(points)
+    ]
+    return " ".join(commands) + " Z"
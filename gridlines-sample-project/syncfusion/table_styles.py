@@ -0,0 +1,258 @@
+"""
+Built-in table styles as shared CSS classes.
+
+A ``BuiltInTableStyle`` formats a table by region: the whole table, banded
+rows and columns, the first and last column, and the header and total row,
+in increasing precedence. Which regions a cell belongs to depends only on
+its row class and column class, which the table's ``Has...`` flags decide.
+The formatting of every (style, row class, column class) combination is
+resolved once into a CSS class, and the rules of a style are built into one
+style sheet the first time the style is used, so cells only carry a class
+name however large the table is.
+"""
+
+import functools
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Class names are "ts-<style>-<row class>-<column class>", style lowercased
+TABLE_STYLE_PREFIX = "ts-"
+
+ROW_CLASSES = ("header", "total", "band1", "band2", "body")
+COLUMN_CLASSES = ("first", "last", "band1", "band2", "body")
+
+# One-character codes of row and column classes, for compact per-row data
+ROW_CLASS_CODES = {"header": "h", "total": "t", "band1": "1", "band2": "2", "body": "b"}
+COLUMN_CLASS_CODES = {"first": "f", "last": "l", "band1": "1", "band2": "2", "body": "b"}
+
+# Office theme colors
+_THEME = {
+    "dark": "#000000",
+    "light": "#ffffff",
+    "accent1": "#156082",
+    "accent2": "#e97132",
+    "accent3": "#196b24",
+    "accent4": "#0f9ed5",
+    "accent5": "#a02b93",
+    "accent6": "#4ea72e",
+}
+
+_STYLE_NAME = re.compile(r"^(Light|Medium|Dark|Themed)Style(\d)((?:Accent\d)*)$")
+
+# CSS declarations by property, in rule order
+Declarations = Dict[str, str]
+
+
+class TableFlags(NamedTuple):
+    """The ``Has...`` flags of a table."""
+    header_row: bool = False
+    total_row: bool = False
+    first_column: bool = False
+    last_column: bool = False
+    banded_rows: bool = False
+    banded_columns: bool = False
+
+
+def row_class(index: int, count: int, flags: TableFlags) -> str:
+    """Row class of row ``index`` of ``count``: header, total, band1, band2 or body."""
+    if flags.header_row and index == 0:
+        return "header"
+    if flags.total_row and index == count - 1:
+        return "total"
+    if flags.banded_rows:
+        return "band1" if (index - flags.header_row) % 2 == 0 else "band2"
+    return "body"
+
+
+def column_class(index: int, count: int, flags: TableFlags) -> str:
+    """Column class of column ``index`` of ``count``: first, last, band1, band2 or body."""
+    if flags.first_column and index == 0:
+        return "first"
+    if flags.last_column and index == count - 1:
+        return "last"
+    if flags.banded_columns:
+        return "band1" if (index - flags.first_column) % 2 == 0 else "band2"
+    return "body"
+
+
+def _mix(color: str, other: str, weight: float) -> str:
+    """Blend ``weight`` of ``other`` into ``color``."""
+    channels = [round(int(color[i:i + 2], 16) * (1 - weight) + int(other[i:i + 2], 16) * weight)
+                for i in (1, 3, 5)]
+    return "#" + "".join(f"{channel:02x}" for channel in channels)
+
+
+@functools.lru_cache(maxsize=None)
+def _style_regions(style: str) -> Dict[str, Declarations]:
+    """
+    Formatting of each region of a style: table, band1row, band1col, first,
+    last, total and header.
+    """
+    if style == "NoStyleTableGrid":
+        return {"table": {"border": "1px solid #000000"}}
+    if style == "NoStyleNoGrid":
+        return {"table": {"border": "none"}}
+    match = _STYLE_NAME.match(style)
+    if match is None:
+        # None and Custom keep the default cell formatting
+        return {}
+    family, number, accents = match.group(1), int(match.group(2)), re.findall(r"\d", match.group(3))
+    accent = _THEME[f"accent{accents[0]}"] if accents else _THEME["dark"]
+    second = _THEME[f"accent{accents[1]}"] if len(accents) > 1 else accent
+    tint_20 = _mix(accent, "#ffffff", 0.8)
+    tint_40 = _mix(accent, "#ffffff", 0.6)
+    line = f"1px solid {accent}"
+    bold = {"font-weight": "bold"}
+    filled = {"background-color": accent, "color": "#ffffff", "font-weight": "bold"}
+
+    if family == "Light":
+        if number == 1:
+            return {
+                "table": {"border": "none"},
+                "band1row": {"background-color": tint_20},
+                "band1col": {"background-color": tint_20},
+                "first": bold, "last": bold,
+                "total": {"font-weight": "bold", "border-top": line},
+                "header": {"font-weight": "bold", "border-top": line, "border-bottom": line},
+            }
+        if number == 2:
+            return {
+                "table": {"border": "none", "border-top": line, "border-bottom": line},
+                "band1col": {"border-left": line, "border-right": line},
+                "first": bold, "last": bold,
+                "total": {"font-weight": "bold", "border-top": f"3px double {accent}"},
+                "header": filled,
+            }
+        return {
+            "table": {"border": line},
+            "band1row": {"background-color": tint_20},
+            "band1col": {"background-color": tint_20},
+            "first": bold, "last": bold,
+            "total": {"font-weight": "bold", "border-top": f"3px double {accent}"},
+            "header": {"font-weight": "bold", "color": accent, "border-bottom": f"2px solid {accent}"},
+        }
+    if family == "Medium":
+        if number == 1:
+            return {
+                "table": {"background-color": "#ffffff", "border": "none", "border-bottom": line},
+                "band1row": {"background-color": tint_20},
+                "band1col": {"background-color": tint_20},
+                "first": bold, "last": bold,
+                "total": {"font-weight": "bold", "border-top": f"3px double {accent}"},
+                "header": filled,
+            }
+        if number == 2:
+            return {
+                "table": {"background-color": tint_20, "border": "1px solid #ffffff"},
+                "band1row": {"background-color": tint_40},
+                "band1col": {"background-color": tint_40},
+                "first": filled, "last": filled,
+                "total": dict(filled, **{"border-top": "3px solid #ffffff"}),
+                "header": dict(filled, **{"border-bottom": "3px solid #ffffff"}),
+            }
+        if number == 3:
+            return {
+                "table": {"background-color": "#ffffff", "border": "none", "border-bottom": "1px solid #000000"},
+                "band1row": {"background-color": "#d9d9d9"},
+                "band1col": {"background-color": "#d9d9d9"},
+                "first": filled, "last": filled,
+                "total": {"font-weight": "bold", "border-top": "3px double #000000"},
+                "header": dict(filled, **{"border-bottom": "2px solid #000000"}),
+            }
+        return {
+            "table": {"background-color": tint_20, "border": line},
+            "band1row": {"background-color": tint_40},
+            "band1col": {"background-color": tint_40},
+            "first": bold, "last": bold,
+            "total": {"font-weight": "bold", "border-top": f"2px solid {accent}"},
+            "header": {"font-weight": "bold", "color": accent},
+        }
+    if family == "Dark":
+        if number == 1:
+            shade = _mix(accent, "#000000", 0.25)
+            return {
+                "table": {"background-color": accent, "color": "#ffffff", "border": "none"},
+                "band1row": {"background-color": shade},
+                "band1col": {"background-color": shade},
+                "first": {"background-color": shade, "font-weight": "bold"},
+                "last": {"background-color": shade, "font-weight": "bold"},
+                "total": {"background-color": _mix(accent, "#000000", 0.5), "font-weight": "bold",
+                          "border-top": "2px solid #ffffff"},
+                "header": {"background-color": "#000000", "font-weight": "bold", "border-bottom": "2px solid #ffffff"},
+            }
+        return {
+            "table": {"background-color": tint_20, "border": "none"},
+            "band1row": {"background-color": tint_40},
+            "band1col": {"background-color": tint_40},
+            "first": bold, "last": bold,
+            "total": {"font-weight": "bold", "border-top": "3px double #000000"},
+            "header": {"background-color": second, "color": "#ffffff", "font-weight": "bold"},
+        }
+    # Themed
+    band = _mix(accent, "#ffffff", 0.2) if number == 1 else _mix(accent, "#000000", 0.15)
+    return {
+        "table": {"background-color": accent, "color": "#ffffff", "border": f"1px solid {_mix(accent, '#ffffff', 0.4)}"},
+        "band1row": {"background-color": band},
+        "band1col": {"background-color": band},
+        "first": bold, "last": bold,
+        "total": {"font-weight": "bold", "border-top": "2px solid #ffffff"},
+        "header": {"font-weight": "bold", "border-bottom": "2px solid #ffffff"},
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _resolved(style: str, row: str, column: str) -> Tuple[Tuple[str, str], ...]:
+    """Declarations of a cell, merging its regions in order of precedence."""
+    regions = _style_regions(style)
+    applied = ["table"]
+    if column == "band1":
+        applied.append("band1col")
+    if row == "band1":
+        applied.append("band1row")
+    if column in ("first", "last"):
+        applied.append(column)
+    if row in ("header", "total"):
+        applied.append(row)
+    declarations: Declarations = {}
+    for region in applied:
+        declarations.update(regions.get(region, {}))
+    return tuple(declarations.items())
+
+
+def style_class_prefix(style: str) -> str:
+    """Class name prefix shared by every cell class of a style."""
+    return TABLE_STYLE_PREFIX + style.lower()
+
+
+@functools.lru_cache(maxsize=None)
+def cell_class(style: str, row: str, column: str) -> Optional[str]:
+    """
+    CSS class of a cell with the given row and column class, or None if the
+    style does not format it.
+    """
+    if not _resolved(style, row, column):
+        return None
+    return f"{style_class_prefix(style)}-{row}-{column}"
+
+
+@functools.lru_cache(maxsize=None)
+def style_sheet(style: str) -> str:
+    """
+    CSS rules of every cell class of a style. Selectors are scoped to slide
+    shapes so they take precedence over the default table cell rule.
+    """
+    rules = []
+    for row in ROW_CLASSES:
+        for column in COLUMN_CLASSES:
+            declarations = _resolved(style, row, column)
+            if declarations:
+                name = f"{style_class_prefix(style)}-{row}-{column}"
+                body = " ".join(f"{prop}: {value};" for prop, value in declarations)
+                rules.append(f".syncfusion-shape td.{name}, .syncfusion-shape div.{name} {{ {body} }}")
+    return "\n".join(rules)
+
+
+def table_classes(rows: int, columns: int, flags: TableFlags) -> Tuple[List[str], List[str]]:
+    """Row class of every row and column class of every column of a table."""
+    return ([row_class(index, rows, flags) for index in range(rows)],
+            [column_class(index, columns, flags) for index in range(columns)])
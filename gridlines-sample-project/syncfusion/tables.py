@@ -0,0 +1,119 @@
+"""
+Table layout with merged cells.
+
+Tables store merges the way PowerPoint does: every row has one cell per grid
+column, the top-left cell of a merged area carries ``RowSpan`` and
+``ColumnSpan``, and the cells it covers are flagged ``IsHorizontalMerge`` or
+``IsVerticalMerge``. ``table_layout`` turns that into a merge map in one pass
+over the cells: the origin cells of each row with their clamped spans, and
+for each row the first row whose merged cells reach down into it, which a
+windowed renderer needs to keep a merged cell visible after its origin row
+has scrolled out.
+"""
+
+from typing import Any, List, NamedTuple, Sequence
+
+
+class CellPlacement(NamedTuple):
+    """
+    An origin cell and the grid area it covers.
+
+    Attributes:
+        row: Grid row of the cell
+        column: Grid column of the cell
+        row_span: Rows covered, at least 1 and within the table
+        column_span: Columns covered, at least 1 and within the table
+        cell: The ``TableCell``
+    """
+    row: int
+    column: int
+    row_span: int
+    column_span: int
+    cell: Any
+
+
+class TableLayout(NamedTuple):
+    """
+    Attributes:
+        column_widths: Width of each grid column, in pixels
+        row_heights: Height of each row, in pixels
+        rows: Origin cells of each row, in column order; covered cells are
+            left out
+        span_start: For each row, the first row with a cell that covers it
+            (the row itself when no merged cell reaches into it)
+    """
+    column_widths: List[float]
+    row_heights: List[float]
+    rows: List[List[CellPlacement]]
+    span_start: List[int]
+
+
+def table_layout(rows: Sequence[Any], width: float, height: float) -> TableLayout:
+    """
+    Compute the merge map and grid sizes of a table.
+
+    Column widths come from the ``ColumnWidth`` of the first row's cells and
+    row heights from each row's ``Height`` (points); missing sizes share what
+    is left of the table's box equally.
+
+    Args:
+        rows: The table's ``TableRow`` models
+        width: Table width in pixels
+        height: Table height in pixels
+
+    Returns:
+        TableLayout: Grid sizes and merge map
+    """
+    row_count = len(rows)
+    column_count = max((len(row.Cells) for row in rows), default=0)
+    # Rows below the current one that a vertical merge still covers, per column
+    covered_rows = [0] * column_count
+    span_start = list(range(row_count))
+    placements = []
+    for row_index, row in enumerate(rows):
+        row_cells = []
+        # Columns of this row covered by a horizontal merge
+        covered_until = 0
+        for column_index, cell in enumerate(row.Cells):
+            if (covered_rows[column_index] or column_index < covered_until
+                    or cell.IsHorizontalMerge or cell.IsVerticalMerge):
+                continue
+            row_span = min(max(cell.RowSpan or 1, 1), row_count - row_index)
+            column_span = min(max(cell.ColumnSpan or 1, 1), column_count - column_index)
+            covered_until = column_index + column_span
+            if row_span > 1:
+                for column in range(column_index, covered_until):
+                    covered_rows[column] = row_span
+                for covered in range(row_index + 1, row_index + row_span):
+                    span_start[covered] = min(span_start[covered], row_index)
+            row_cells.append(CellPlacement(row_index, column_index, row_span, column_span, cell))
+        placements.append(row_cells)
+        for column in range(column_count):
+            if covered_rows[column]:
+                covered_rows[column] -= 1
+
+    first_cells = rows[0].Cells if rows else []
+    column_widths = [cell.ColumnWidth * 1.33333 if cell.ColumnWidth else None for cell in first_cells]
+    column_widths += [None] * (column_count - len(column_widths))
+    row_heights = [row.Height * 1.33333 if row.Height else None for row in rows]
+    return TableLayout(_fill_sizes(column_widths, width), _fill_sizes(row_heights, height), placements, span_start)
+
+
+def _fill_sizes(sizes: List[Any], total: float) -> List[float]:
+    """Give sizes that are not set an equal share of what the others leave of ``total``."""
+    missing = sizes.count(None)
+    if not missing:
+        return sizes
+    share = max(total - sum(size for size in sizes if size is not None), 0) / missing
+    return [share if size is None else size for size in sizes]
+
+
+def cell_lines(cell: Any) -> List[str]:
+    """Text of a table cell, one entry per paragraph."""
+    text_body = cell.TextBody
+    if text_body is None:
+        return []
+    if text_body.Paragraphs:
+        return [paragraph.Text or "".join(part.Text for part in paragraph.TextParts or [])
+                for paragraph in text_body.Paragraphs]
+    return text_body.Text.splitlines() if text_body.Text else []
@@ -1,4 +1,6 @@
+import functools
 import json
+import os
 from enum import Enum
 
 from pydantic import BaseModel
@@ -13,6 +15,19 @@ def convert_enum_value(value):
     return value
 
 
+@functools.lru_cache(maxsize=None)
+def default_file_mode() -> int:
+    """
+    Mode a new file gets under the process umask, e.g. 0o644.
+
+    The umask can only be read by setting it, so it is read once, on first
+    use rather than at import time.
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
 def pretty_print_pydantic_model(pydantic_model):
     """
     Pretty prints a Pydantic model instance, excluding fields with None values.
@@ -22,7 +37,8 @@ def pretty_print_pydantic_model(pydantic_model):
     """
     model_dict = pydantic_model.dict(exclude_none=True, by_alias=True)
     model_dict = {k: convert_enum_value(v) for k, v in model_dict.items()}
-    pretty_model = json.dumps(model_dict, indent=4)
+    # default=repr covers handles such as Base64Payload that stay Python objects
+    pretty_model = json.dumps(model_dict, indent=4, default=repr)
     return pretty_model
 
 